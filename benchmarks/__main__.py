@@ -0,0 +1,389 @@
+"""Benchmark `load_settings` across class kinds, field counts, nesting and loader mixes.
+
+Usage:
+    python -m benchmarks run [--kind KIND] [--size SIZE] [--depth DEPTH] [--mix MIX]
+    python -m benchmarks run --save   # Overwrite the stored baseline.
+    python -m benchmarks compare      # Re-run, and flag regressions against the baseline.
+    python -m benchmarks memory       # Retained memory of many loads, with/without `intern`.
+    python -m benchmarks threads      # `load_settings` throughput from 1 to N threads.
+    python -m benchmarks dotenv       # Parse, and load from, a 10k line `.env` file.
+    python -m benchmarks parsers      # Compare the installed TOML parser backends.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict
+
+from benchmarks import classes
+from dataclass_settings import DotEnv, Env, load_settings, load_settings_many, parsers
+from dataclass_settings.context import InternTable
+
+BASELINE = Path(__file__).parent / "baseline.json"
+
+Result = Dict[str, float]
+
+
+def measure(case: classes.Case, min_time: float = 0.2, cold_runs: int = 3) -> Result:
+    with tempfile.TemporaryDirectory() as tmp:
+        loaders = classes.write_sources(case, Path(tmp))
+
+        # Each cold run loads a freshly generated (never before seen) class.
+        colds = []
+        for _ in range(cold_runs):
+            source_cls = classes.build(case)
+            start = time.perf_counter()
+            load_settings(source_cls, loaders=loaders())
+            colds.append(time.perf_counter() - start)
+
+        durations: list[float] = []
+        deadline = time.perf_counter() + min_time
+        while len(durations) < 3 or time.perf_counter() < deadline:
+            start = time.perf_counter()
+            load_settings(source_cls, loaders=loaders())
+            durations.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        try:
+            load_settings(source_cls, loaders=loaders())
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "cold_ms": round(statistics.median(colds) * 1000, 4),
+        "warm_ms": round(statistics.median(durations) * 1000, 4),
+        "peak_kib": round(peak / 1024, 1),
+    }
+
+
+def run(args: argparse.Namespace) -> Dict[str, Result]:
+    # Warm up one-time costs (imports, etc) so they aren't attributed to the first case.
+    measure(classes.Case("dataclass", 10, 1, "toml"), min_time=0)
+
+    results = {}
+    for case in classes.cases(
+        kinds=args.kind or classes.KINDS,
+        sizes=args.size or classes.SIZES,
+        depths=args.depth or classes.DEPTHS,
+        mixes=args.mix or classes.MIXES,
+    ):
+        result = measure(case)
+        results[case.name] = result
+        print(
+            f"{case.name:<40} cold {result['cold_ms']:>10.3f} ms"
+            f"  warm {result['warm_ms']:>10.3f} ms"
+            f"  peak {result['peak_kib']:>10.1f} KiB",
+            flush=True,
+        )
+    return results
+
+
+def measure_memory(kind: str, size: int, tenants: int) -> Result:
+    """Measure the memory retained by `tenants` loaded instances, with and without `intern`."""
+    source_cls = classes.build_tenant(kind, size)
+
+    def sources():
+        # Each tenant's env is only generated as it's loaded (and then dropped),
+        # so every loaded value starts out as a distinct string object.
+        for env in classes.tenant_envs(size, tenants):
+            yield Env.load_with(env=env)
+
+    # Warm up class inspection, so it isn't attributed to the first measurement.
+    list(load_settings_many(source_cls, itertools.islice(sources(), 1), loaders=[]))
+
+    retained = {}
+    intern_table = InternTable()
+    for intern in (False, True):
+        tracemalloc.start()
+        try:
+            instances: list[Any] = list(
+                load_settings_many(
+                    source_cls,
+                    sources(),
+                    loaders=[],
+                    intern=intern_table if intern else False,
+                )
+            )
+            retained[intern], _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del instances
+
+    return {
+        "retained_kib": round(retained[False] / 1024, 1),
+        "interned_retained_kib": round(retained[True] / 1024, 1),
+        "bytes_saved_kib": round(intern_table.bytes_saved / 1024, 1),
+    }
+
+
+def run_memory(args: argparse.Namespace) -> Dict[str, Result]:
+    results = {}
+    for kind in args.kind or classes.KINDS:
+        if not classes.kind_available(kind):
+            continue
+
+        for size in args.size or [10, 100]:
+            name = f"{kind}-{size}-x{args.tenants}"
+            result = measure_memory(kind, size, args.tenants)
+            results[name] = result
+            print(
+                f"{name:<40} retained {result['retained_kib']:>10.1f} KiB"
+                f"  interned {result['interned_retained_kib']:>10.1f} KiB"
+                f"  saved {result['bytes_saved_kib']:>10.1f} KiB",
+                flush=True,
+            )
+    return results
+
+
+def measure_threads(case: classes.Case, threads: int, loads: int) -> float:
+    """Return the `load_settings` throughput (loads/s) of `threads` concurrent threads."""
+    with tempfile.TemporaryDirectory() as tmp:
+        loaders = classes.write_sources(case, Path(tmp))
+        source_cls = classes.build(case)
+
+        # Loader states (and so their caches) are shared, as they would be by a server.
+        shared = loaders()
+        load_settings(source_cls, loaders=shared)
+
+        barrier = threading.Barrier(threads + 1)
+
+        def worker():
+            barrier.wait()
+            for _ in range(loads):
+                load_settings(source_cls, loaders=shared)
+
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        for thread in workers:
+            thread.start()
+
+        barrier.wait()
+        start = time.perf_counter()
+        for thread in workers:
+            thread.join()
+        duration = time.perf_counter() - start
+
+    return threads * loads / duration
+
+
+def run_threads(args: argparse.Namespace) -> Dict[str, Result]:
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL enabled: {gil_enabled}", flush=True)
+
+    results = {}
+    for case in classes.cases(
+        kinds=args.kind or ["dataclass"],
+        sizes=args.size or [100],
+        depths=args.depth or [1],
+        mixes=args.mix or ["toml"],
+    ):
+        single = None
+        for threads in args.threads or [1, 2, 4, 8]:
+            throughput = measure_threads(case, threads, args.loads)
+            if single is None:
+                single = throughput
+
+            name = f"{case.name}-t{threads}"
+            results[name] = {
+                "loads_per_s": round(throughput, 1),
+                "speedup": round(throughput / single, 2),
+            }
+            print(
+                f"{name:<40} {throughput:>12.1f} loads/s"
+                f"  speedup {throughput / single:>6.2f}x"
+                f"  efficiency {throughput / single / threads:>6.0%}",
+                flush=True,
+            )
+    return results
+
+
+def run_dotenv(lines: int = 10_000, fields: int = 100) -> Dict[str, Result]:
+    from dataclass_settings.loaders import dotenv
+
+    with tempfile.TemporaryDirectory() as tmp:
+        file = Path(tmp) / ".env"
+        file.write_text(classes.dotenv_text(lines))
+        text = file.read_text()
+        source_cls = classes.build_dotenv(fields)
+
+        parses = []
+        for _ in range(5):
+            start = time.perf_counter()
+            dotenv.parse_dotenv(text)
+            parses.append(time.perf_counter() - start)
+
+        colds = []
+        for _ in range(5):
+            dotenv._parse_cache.clear()
+            start = time.perf_counter()
+            load_settings(source_cls, loaders=DotEnv.load_with(files=file))
+            colds.append(time.perf_counter() - start)
+
+        warms = []
+        for _ in range(50):
+            start = time.perf_counter()
+            load_settings(source_cls, loaders=DotEnv.load_with(files=file))
+            warms.append(time.perf_counter() - start)
+
+    result = {
+        "parse_ms": round(statistics.median(parses) * 1000, 4),
+        "cold_ms": round(statistics.median(colds) * 1000, 4),
+        "warm_ms": round(statistics.median(warms) * 1000, 4),
+    }
+    name = f"dotenv-{lines}-lines-{fields}-fields"
+    print(
+        f"{name:<40} parse {result['parse_ms']:>10.3f} ms"
+        f"  cold {result['cold_ms']:>10.3f} ms"
+        f"  warm {result['warm_ms']:>10.3f} ms",
+        flush=True,
+    )
+    return {name: result}
+
+
+def run_parsers(tables: int = 1000, keys: int = 20) -> Dict[str, Result]:
+    # Importing the loader registers its backends.
+    from dataclass_settings.loaders import toml  # noqa: F401
+
+    text = classes.toml_text(tables, keys)
+    size_kib = len(text.encode()) / 1024
+
+    results = {}
+    for name in parsers.available("toml"):
+        parser = parsers.get_parser("toml", name)
+        assert parser is not None
+
+        durations = []
+        for _ in range(5):
+            start = time.perf_counter()
+            parser.loads(text)
+            durations.append(time.perf_counter() - start)
+
+        result = {"parse_ms": round(statistics.median(durations) * 1000, 4)}
+        results[f"toml-{name}-{tables}x{keys}"] = result
+        print(
+            f"{name:<12} {size_kib:>8.0f} KiB  parse {result['parse_ms']:>10.3f} ms",
+            flush=True,
+        )
+    return results
+
+
+def compare(
+    baseline: Dict[str, Result],
+    results: Dict[str, Result],
+    threshold: float,
+    noise_floor_ms: float = 0.05,
+) -> list[str]:
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+
+        for metric, value in result.items():
+            before = previous.get(metric)
+            if not before:
+                continue
+
+            if metric.endswith("_ms") and value - before < noise_floor_ms:
+                continue
+
+            change = (value - before) / before
+            if change > threshold:
+                regressions.append(
+                    f"{name} {metric}: {before} -> {value} (+{change:.0%})"
+                )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument(
+        "command",
+        choices=["run", "compare", "memory", "threads", "dotenv", "parsers"],
+    )
+    parser.add_argument("--kind", action="append", choices=classes.KINDS)
+    parser.add_argument("--size", action="append", type=int)
+    parser.add_argument("--depth", action="append", type=int)
+    parser.add_argument("--mix", action="append", choices=classes.MIXES)
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument(
+        "--save", action="store_true", help="Store the results as the new baseline."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="The relative slowdown flagged as a regression (default: 0.25).",
+    )
+    parser.add_argument(
+        "--tenants",
+        type=int,
+        default=1000,
+        help="The number of instances loaded by `memory` (default: 1000).",
+    )
+    parser.add_argument(
+        "--threads",
+        action="append",
+        type=int,
+        help="A thread count measured by `threads` (default: 1, 2, 4, 8).",
+    )
+    parser.add_argument(
+        "--loads",
+        type=int,
+        default=200,
+        help="The number of loads per thread performed by `threads` (default: 200).",
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "parsers":
+        run_parsers()
+        return 0
+
+    if args.command == "dotenv":
+        run_dotenv()
+        return 0
+
+    if args.command == "threads":
+        run_threads(args)
+        return 0
+
+    if args.command == "memory":
+        run_memory(args)
+        return 0
+
+    results = run(args)
+
+    if args.command == "run":
+        if args.save:
+            existing = {}
+            if args.baseline.exists():
+                existing = json.loads(args.baseline.read_text())
+            existing.update(results)
+            args.baseline.write_text(
+                json.dumps(existing, indent=2, sort_keys=True) + "\n"
+            )
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    regressions = compare(baseline, results, args.threshold)
+    if regressions:
+        print("\nRegressions:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+
+    print("\nNo regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
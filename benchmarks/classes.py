@@ -0,0 +1,216 @@
+"""Generate synthetic settings classes, and the sources which satisfy them."""
+
+from __future__ import annotations
+
+import dataclasses
+import itertools
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from typing_extensions import Annotated
+
+from dataclass_settings import DotEnv, Env, Secret, Toml
+from dataclass_settings.class_inspect import ClassTypes
+from dataclass_settings.loader import LoaderTypes
+
+KINDS = [kind.name for kind in ClassTypes]
+SIZES = [10, 100, 1000]
+DEPTHS = [1, 4, 5]
+MIXES = ["env", "secret", "toml"]
+
+FieldSpec = Tuple[str, Any]
+
+
+@dataclasses.dataclass
+class Case:
+    kind: str
+    size: int
+    depth: int
+    mix: str
+
+    @property
+    def name(self) -> str:
+        return f"{self.kind}-{self.size}-d{self.depth}-{self.mix}"
+
+
+def cases(kinds=KINDS, sizes=SIZES, depths=DEPTHS, mixes=MIXES) -> list[Case]:
+    return [
+        Case(kind, size, depth, mix)
+        for kind, size, depth, mix in itertools.product(kinds, sizes, depths, mixes)
+        if kind_available(kind)
+    ]
+
+
+def kind_available(kind: str) -> bool:
+    try:
+        if kind == "attrs":
+            import attr  # noqa: F401
+        elif kind == "msgspec":
+            import msgspec  # noqa: F401
+        elif kind.startswith("pydantic"):
+            import pydantic
+
+            is_v1 = pydantic.VERSION.startswith("1.")
+            if is_v1 != (kind == "pydantic_v1"):
+                return False
+    except ImportError:
+        return False
+    return True
+
+
+def make_class(kind: str, name: str, fields: List[FieldSpec]) -> type:
+    if kind == "dataclass":
+        return dataclasses.make_dataclass(name, fields)
+
+    if kind == "pydantic_v2_dataclass":
+        from pydantic.dataclasses import dataclass as pydantic_dataclass
+
+        return pydantic_dataclass(dataclasses.make_dataclass(name, fields))
+
+    if kind == "attrs":
+        import attr
+
+        cls = attr.make_class(
+            name, {field_name: attr.ib(type=type_) for field_name, type_ in fields}
+        )
+        cls.__annotations__ = dict(fields)
+        return cls
+
+    if kind == "msgspec":
+        import msgspec
+
+        return msgspec.defstruct(name, fields)
+
+    import pydantic
+
+    definitions: dict[str, Any] = {
+        field_name: (type_, ...) for field_name, type_ in fields
+    }
+    return pydantic.create_model(name, **definitions)
+
+
+def loader_for(mix: str, level: int, index: int) -> Any:
+    if mix == "env":
+        return Env(f"L{level}_F{index}")
+    if mix == "secret":
+        if index % 4 == 0:
+            return Env(f"L{level}_F{index}")
+        return Secret(f"l{level}_f{index}")
+
+    if index % 4 == 0:
+        return Env(f"L{level}_F{index}")
+    return Toml(f"l{level}.f{index}")
+
+
+def build(case: Case) -> type:
+    """Build a class with `case.size` leaf fields, spread over `case.depth` levels."""
+    per_level = max(case.size // case.depth, 1)
+
+    child: type | None = None
+    for level in reversed(range(case.depth)):
+        fields: List[FieldSpec] = [
+            (f"f{i}", Annotated[int, loader_for(case.mix, level, i)])
+            for i in range(per_level)
+        ]
+        if child is not None:
+            fields.append(("child", child))
+
+        child = make_class(case.kind, f"Level{level}", fields)
+
+    assert child is not None
+    return child
+
+
+def build_tenant(kind: str, size: int) -> type:
+    """Build a flat class of `size` string fields, each loaded through `Env`."""
+    fields: List[FieldSpec] = [
+        (f"f{i}", Annotated[str, Env(f"F{i}")]) for i in range(size)
+    ]
+    return make_class(kind, "Tenant", fields)
+
+
+def tenant_envs(size: int, count: int, distinct: int = 4) -> Iterator[Dict[str, str]]:
+    """Per-tenant envs, whose values repeat (as regions, hostnames, etc would)."""
+    return (
+        {
+            f"F{i}": f"value-{i}-{(tenant + i) % distinct}-" + "x" * 32
+            for i in range(size)
+        }
+        for tenant in range(count)
+    )
+
+
+def build_dotenv(size: int) -> type:
+    """Build a flat dataclass of `size` fields, each loaded through `DotEnv`."""
+    fields: List[FieldSpec] = [
+        (f"f{i}", Annotated[str, DotEnv(f"VAR_{i * 97}")]) for i in range(size)
+    ]
+    return make_class("dataclass", "DotEnvSettings", fields)
+
+
+def dotenv_text(lines: int) -> str:
+    """Generate a `.env` file of `lines` assignments, mixing the supported syntaxes."""
+    result = []
+    for i in range(lines):
+        if i % 10 == 0:
+            result.append(f"# Section {i}")
+        if i % 4 == 0:
+            result.append(f'VAR_{i}="double quoted \\"value\\" {i}\\n"')
+        elif i % 4 == 1:
+            result.append(f"export VAR_{i}='single quoted {i}'")
+        elif i % 4 == 2:
+            result.append(f"VAR_{i} = unquoted value {i}  # comment")
+        else:
+            result.append(f"VAR_{i}={i}")
+    return "\n".join(result) + "\n"
+
+
+def toml_text(tables: int, keys: int) -> str:
+    """Generate a TOML document of `tables` tables of `keys` (mixed type) keys each."""
+    result = []
+    for table in range(tables):
+        result.append(f"[table_{table}]")
+        for key in range(keys):
+            if key % 4 == 0:
+                result.append(f'key_{key} = "string value {table}.{key}"')
+            elif key % 4 == 1:
+                result.append(f"key_{key} = {table * keys + key}")
+            elif key % 4 == 2:
+                result.append(f"key_{key} = [1.5, 2.5, {key}.5]")
+            else:
+                result.append(f"key_{key} = {{ enabled = true, name = 'inline' }}")
+        result.append("")
+    return "\n".join(result)
+
+
+def write_sources(case: Case, directory: Path) -> Callable[[], LoaderTypes]:
+    """Write any files `case` requires, and return a factory for fresh loader states."""
+    per_level = max(case.size // case.depth, 1)
+
+    env: Dict[str, str] = {}
+    toml_lines: List[str] = []
+    secret_dir = directory / "secrets"
+    secret_dir.mkdir(parents=True, exist_ok=True)
+
+    for level in range(case.depth):
+        toml_lines.append(f"[l{level}]")
+        for i in range(per_level):
+            loader = loader_for(case.mix, level, i)
+            if isinstance(loader, Env):
+                env[loader.env_vars[0]] = str(i)
+            elif isinstance(loader, Secret):
+                (secret_dir / loader.names[0]).write_text(str(i))
+            else:
+                toml_lines.append(f"f{i} = {i}")
+
+    toml_file = directory / "config.toml"
+    toml_file.write_text("\n".join(toml_lines))
+
+    def loaders() -> LoaderTypes:
+        return [
+            Env.load_with(env=env),
+            Secret.load_with(dir=secret_dir),
+            Toml.load_with(file=toml_file),
+        ]
+
+    return loaders
@@ -1,13 +1,36 @@
-from dataclass_settings.base import load_settings
-from dataclass_settings.context import Context
+from dataclass_settings.base import (
+    RowResult,
+    iter_load_settings,
+    load_settings,
+    load_settings_many,
+)
+from dataclass_settings.context import Context, LoadTimeoutError
 from dataclass_settings.loader import Loader
-from dataclass_settings.loaders import Env, Secret, Toml
+from dataclass_settings.loaders import (
+    DotEnv,
+    Env,
+    Json,
+    Row,
+    Secret,
+    SecretBundle,
+    Sqlite,
+    Toml,
+)
 
 __all__ = [
     "Context",
+    "DotEnv",
     "Env",
+    "Json",
+    "LoadTimeoutError",
     "Loader",
+    "Row",
+    "RowResult",
     "Secret",
+    "SecretBundle",
+    "Sqlite",
     "Toml",
+    "iter_load_settings",
     "load_settings",
+    "load_settings_many",
 ]
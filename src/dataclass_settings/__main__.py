@@ -0,0 +1,4 @@
+from dataclass_settings.cli import main
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,12 +1,37 @@
 from __future__ import annotations
 
+import functools
+import itertools
 import logging
-from typing import Any, ClassVar, TypeVar
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Generic,
+    Iterable,
+    Iterator,
+    Mapping,
+    TypeVar,
+)
 
-from dataclass_settings import class_inspect
-from dataclass_settings.context import Context
-from dataclass_settings.loader import LoaderTypes
-from dataclass_settings.loaders import Env, Secret, Toml
+from typing_extensions import Literal
+
+from dataclass_settings import class_inspect, plan
+from dataclass_settings.context import (
+    Context,
+    InternTable,
+    LoadHistory,
+    LoadTimeoutError,
+    Timeouts,
+)
+from dataclass_settings.loader import Loader, LoaderTypes
+from dataclass_settings.loaders import Env, Row, Secret, Toml
+from dataclass_settings.observer import Observer, get_observer
 
 log = logging.getLogger("dataclass_settings")
 
@@ -21,7 +46,12 @@ def load_settings(
     extra_loaders: LoaderTypes = (),
     nested_delimiter: bool | str = False,
     infer_names: bool = False,
-    emit_history: bool = False,
+    emit_history: bool | LoadHistory = False,
+    observer: Observer | None = None,
+    intern: bool | InternTable = False,
+    deadline: float | None = None,
+    timeouts: Mapping[type[Loader], float] | None = None,
+    on_timeout: Literal["miss", "raise"] = "miss",
 ) -> T:
     """Load settings from a supported source class.
 
@@ -39,43 +69,517 @@ def load_settings(
             will require an explicit name.
         emit_history: Defaults to `False`. When `True`, records the provenance
             of loaded secrets (evaluated names and values for each field) and
-            log them in the event of a loading failure.
+            log them in the event of a loading failure. History is recorded as
+            structured events and only formatted when it is logged. A
+            `LoadHistory` instance may be given, to inspect the history afterward.
+        observer: An `Observer` which receives timing and hit/miss events for
+            each phase of the load. Defaults to the observer registered through
+            `dataclass_settings.observer.set_observer`, if any.
+        intern: Defaults to `False`. When `True`, loaded string values are
+            deduplicated through an `InternTable`, so that equal values share a
+            single object. An `InternTable` instance may be given, to share it
+            between loads and to inspect its `bytes_saved` afterward.
+        deadline: The time budget (in seconds) of the whole load. Once exhausted,
+            any remaining loader calls time out.
+        timeouts: The time budget (in seconds) of each call of a given loader
+            type, e.g. `{Secret: 0.5}`.
+        on_timeout: Defaults to `"miss"`, where a loader call which exceeds its
+            budget is abandoned and treated as a miss (falling through to the
+            field's next loader). `"raise"` raises a `LoadTimeoutError` instead.
+            Either way, the timeout is recorded in the load history.
     """
+    if observer is None:
+        observer = get_observer()
+
     context = Context(
         nested_delimiter=nested_delimiter,
         infer_names=infer_names,
-        record_history=emit_history,
+        history=get_history(emit_history),
+        observer=observer,
+        intern=get_intern_table(intern),
+        timeouts=get_timeouts(deadline, timeouts, on_timeout),
     )
 
     context.resolve_loaders(loaders, extra_loaders)
+    return load_resolved(source_cls, context)
+
+
+def load_settings_many(
+    source_cls: type[T],
+    sources: Iterable[LoaderTypes],
+    *,
+    loaders: LoaderTypes = (Env, Secret, Toml),
+    extra_loaders: LoaderTypes = (),
+    nested_delimiter: bool | str = False,
+    infer_names: bool = False,
+    observer: Observer | None = None,
+    processes: int | None = None,
+    chunksize: int = 64,
+    return_exceptions: bool = False,
+    intern: bool | InternTable = False,
+    deadline: float | None = None,
+    timeouts: Mapping[type[Loader], float] | None = None,
+    on_timeout: Literal["miss", "raise"] = "miss",
+) -> Iterator[T]:
+    """Load many instances of the same settings class, one per item of `sources`.
+
+    Each item of `sources` is a loader (or sequence of loaders/loader states), as
+    would be given to `extra_loaders`, and applies only to its own load. For example
+    `Env.load_with(env=tenant_env)`.
+
+    The class is inspected, and `loaders`/`extra_loaders` resolved, once up front,
+    so that the states they produce are shared by every load (e.g. a shared `Toml`
+    file is parsed once). Results are yielded lazily, in the order of `sources`.
+
+    Arguments:
+        source_cls: The root object to load settings for.
+        sources: Per-load loaders/loader states.
+        loaders: See `load_settings`.
+        extra_loaders: See `load_settings`.
+        nested_delimiter: See `load_settings`.
+        infer_names: See `load_settings`.
+        observer: See `load_settings`. Not supported alongside `processes`, in
+            which case a `ValueError` is raised.
+        processes: When given, loads are distributed across a process pool of this
+            size, in chunks of `chunksize` sources. `source_cls` must then be
+            importable, and `sources` must be picklable.
+        chunksize: The number of sources sent to a worker process at a time.
+        return_exceptions: When `True`, an exception raised while loading an item
+            is yielded in place of its result, rather than ending the iteration.
+        intern: See `load_settings`. A single table is shared by every load, so
+            equal values are deduplicated across the loaded instances. Not
+            supported alongside `processes`, in which case a `ValueError` is
+            raised.
+        deadline: See `load_settings`. Applies to each load separately.
+        timeouts: See `load_settings`.
+        on_timeout: See `load_settings`.
+    """
+    if processes:
+        if observer is not None:
+            raise ValueError("`observer` is not supported alongside `processes`")
+        if intern:
+            # Each worker process would intern into its own copy of the table.
+            raise ValueError("`intern` is not supported alongside `processes`")
+
+        return _load_many_in_processes(
+            source_cls,
+            sources,
+            processes=processes,
+            chunksize=chunksize,
+            loaders=loaders,
+            extra_loaders=extra_loaders,
+            nested_delimiter=nested_delimiter,
+            infer_names=infer_names,
+            return_exceptions=return_exceptions,
+            deadline=deadline,
+            timeouts=timeouts,
+            on_timeout=on_timeout,
+        )
+
+    if observer is None:
+        observer = get_observer()
+
+    context = Context(
+        nested_delimiter=nested_delimiter,
+        infer_names=infer_names,
+        observer=observer,
+        intern=get_intern_table(intern),
+        timeouts=get_timeouts(deadline, timeouts, on_timeout),
+    )
+    context.resolve_loaders(loaders, extra_loaders)
+    return _load_many(source_cls, sources, context, return_exceptions)
+
+
+def _load_many(
+    source_cls: type[T],
+    sources: Iterable[LoaderTypes],
+    context: Context,
+    return_exceptions: bool,
+) -> Iterator[T]:
+    shared_state = dict(context.state)
+
+    for source in sources:
+        # The context (and every nested field context entered from it) is reused,
+        # only the (shared) state mapping is swapped out for each source.
+        context.state.clear()
+        context.state.update(shared_state)
+        context.resolve_loaders(source)
+
+        instance: Any
+        try:
+            instance = load_resolved(source_cls, context)
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            instance = e
+        yield instance
+
+
+@dataclass
+class RowResult(Generic[T]):
+    """The outcome of loading a single row, yielded by `iter_load_settings`.
+
+    Exactly one of `value` and `error` is set.
+    """
+
+    index: int
+    value: T | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def iter_load_settings(
+    source_cls: type[T],
+    rows: Iterable[Mapping[str, Any] | Exception],
+    *,
+    loaders: LoaderTypes = (Row,),
+    extra_loaders: LoaderTypes = (),
+    nested_delimiter: bool | str = False,
+    infer_names: bool = False,
+    observer: Observer | None = None,
+    processes: int | None = None,
+    chunksize: int = 64,
+    intern: bool | InternTable = False,
+    deadline: float | None = None,
+    timeouts: Mapping[type[Loader], float] | None = None,
+    on_timeout: Literal["miss", "raise"] = "miss",
+) -> Iterator[RowResult[T]]:
+    """Stream one settings instance per row of a tabular source.
+
+    Each row is a mapping of column names to values, which is exposed to `Row`
+    loaders for the duration of its own load. `rows` is consumed lazily, so
+    combined with `loaders.row.read_csv`/`loaders.row.read_jsonl`, memory use is
+    constant in the size of the input.
+
+    A row which fails to load does not end the iteration; instead its
+    `RowResult.error` is set. The same goes for a row which isn't a mapping, or
+    is an exception (e.g. a malformed line yielded by `read_jsonl`).
+
+    Arguments:
+        source_cls: The root object to load settings for.
+        rows: The rows to load, e.g. `read_csv("tenants.csv")`.
+        loaders: See `load_settings`. Defaults to only `Row`.
+        extra_loaders: See `load_settings`.
+        nested_delimiter: See `load_settings`.
+        infer_names: See `load_settings`.
+        observer: See `load_settings_many`.
+        processes: See `load_settings_many`.
+        chunksize: See `load_settings_many`.
+        intern: See `load_settings_many`.
+        deadline: See `load_settings_many`.
+        timeouts: See `load_settings_many`.
+        on_timeout: See `load_settings_many`. With `"raise"`, a row which times
+            out has its `RowResult.error` set to the `LoadTimeoutError`.
+    """
+    errors: dict[int, Exception] = {}
+
+    def sources() -> Iterator[LoaderTypes]:
+        for index, row in enumerate(rows):
+            if isinstance(row, Mapping):
+                yield Row.load_with(row=row)
+                continue
+
+            if isinstance(row, Exception):
+                errors[index] = row
+            else:
+                errors[index] = TypeError(
+                    f"Expected row {index} to be a mapping, got `{type(row).__name__}`"
+                )
+
+            # An (empty) placeholder keeps the failed row's place in the results.
+            yield Row.load_with()
+
+    results = load_settings_many(
+        source_cls,
+        sources(),
+        loaders=loaders,
+        extra_loaders=extra_loaders,
+        nested_delimiter=nested_delimiter,
+        infer_names=infer_names,
+        observer=observer,
+        processes=processes,
+        chunksize=chunksize,
+        return_exceptions=True,
+        intern=intern,
+        deadline=deadline,
+        timeouts=timeouts,
+        on_timeout=on_timeout,
+    )
+    for index, result in enumerate(results):
+        error = errors.pop(index, None)
+        if error is not None:
+            yield RowResult(index, error=error)
+        elif isinstance(result, Exception):
+            yield RowResult(index, error=result)
+        else:
+            yield RowResult(index, value=result)
+
+
+def _load_many_in_processes(
+    source_cls: type[T],
+    sources: Iterable[LoaderTypes],
+    *,
+    processes: int,
+    chunksize: int,
+    **options: Any,
+) -> Iterator[T]:
+    worker = functools.partial(_load_chunk, source_cls, options)
+
+    with ProcessPoolExecutor(processes) as pool:
+        pending: deque[Future[list[T]]] = deque()
+        for chunk in chunked(sources, chunksize):
+            pending.append(pool.submit(worker, chunk))
+
+            # Bound the number of in-flight chunks, so `sources` is consumed lazily.
+            if len(pending) >= processes * 2:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+
+def _load_chunk(
+    source_cls: type[T], options: dict[str, Any], chunk: list[LoaderTypes]
+) -> list[T]:
+    return list(load_settings_many(source_cls, chunk, **options))
+
+
+def chunked(iterable: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def get_history(emit_history: bool | LoadHistory) -> LoadHistory | None:
+    if isinstance(emit_history, LoadHistory):
+        return emit_history
+    return LoadHistory() if emit_history else None
+
+
+def get_timeouts(
+    deadline: float | None,
+    timeouts: Mapping[type[Loader], float] | None,
+    on_timeout: Literal["miss", "raise"],
+) -> Timeouts | None:
+    if deadline is None and not timeouts:
+        return None
+    return Timeouts(deadline, timeouts or {}, on_timeout)
+
+
+def get_intern_table(intern: bool | InternTable) -> InternTable | None:
+    if isinstance(intern, InternTable):
+        return intern
+    return InternTable() if intern else None
+
+
+def load_resolved(source_cls: type[T], context: Context) -> T:
+    """Load `source_cls`, given a `context` whose loaders have already been resolved."""
+    timeouts = context.timeouts
+    if timeouts is None:
+        return _load_prepared(source_cls, context)
+
+    timeouts.start()
+    try:
+        return _load_prepared(source_cls, context)
+    finally:
+        timeouts.finish()
+
+
+def _load_prepared(source_cls: type[T], context: Context) -> T:
+    prepare_loaders(source_cls, context)
 
-    result = (
+    observer = context.observer
+    if observer is None:
+        return _load_settings(source_cls, context)
+
+    start = time.perf_counter()
+    try:
+        instance = _load_settings(source_cls, context)
+    except Exception:
+        observer.on_finish(source_cls, time.perf_counter() - start, False)
+        raise
+
+    observer.on_finish(source_cls, time.perf_counter() - start, True)
+    return instance
+
+
+def prepare_loaders(source_cls: type, context: Context):
+    """Call `Loader.prepare` for each of the context's loaders which override it.
+
+    Each is given the (cached) result of its `Loader.compile`, and called within
+    its time budget (if any).
+    """
+    loader_types = [
+        loader_type
+        for loader_type in context.loaders
+        if loader_type.prepare.__func__ is not Loader.prepare.__func__  # type: ignore[attr-defined]
+    ]
+    if not loader_types:
+        return
+
+    timeouts = context.timeouts
+    for loader_type, compiled in compile_plans(source_cls, context, loader_types):
+        loader, result = compiled
+        call = functools.partial(
+            loader_type.prepare, context.state[loader_type], result
+        )
+
+        timeout = None if timeouts is None else timeouts.budget(loader)
+        if timeouts is None or timeout is None:
+            prepared = call()
+        else:
+            done, prepared = call_within_budget(loader, timeouts, call, timeout)
+            if not done and timeouts.on_timeout == "raise":
+                raise LoadTimeoutError(loader, source_cls.__qualname__, timeout)
+
+        if prepared is not None:
+            # Only replaces the state for this load (`context.state` is
+            # specific to the load).
+            context.state[loader_type] = prepared
+
+
+_compiled_plans: class_inspect.ClassCache[dict[tuple, tuple[Loader, Any] | None]] = (
+    class_inspect.ClassCache()
+)
+
+
+def compile_plans(
+    source_cls: type, context: Context, loader_types: list[type[Loader]]
+) -> list[tuple[type[Loader], tuple[Loader, Any]]]:
+    """Return the `Loader.compile` result of each of `loader_types` used by `source_cls`.
+
+    Results are cached per class (and `nested_delimiter`/`infer_names`), along
+    with one of the class's loaders of that type, so the class is only walked
+    the first time. Loader types which the class doesn't use are omitted.
+    """
+    try:
+        cache = _compiled_plans[source_cls]
+    except KeyError:
+        cache = _compiled_plans.setdefault(source_cls, {})
+
+    options = (context.nested_delimiter, context.infer_names)
+    missing = [
+        loader_type
+        for loader_type in loader_types
+        if (loader_type, *options) not in cache
+    ]
+    if missing:
+        plans: dict[type[Loader], list[tuple[Loader, Context]]] = {
+            loader_type: [] for loader_type in missing
+        }
+        for entry in plan.walk(source_cls, context):
+            for loader in entry.loaders:
+                calls = plans.get(type(loader))
+                if calls is not None:
+                    calls.append((loader, entry.context))
+
+        for loader_type, calls in plans.items():
+            cache[(loader_type, *options)] = (
+                (calls[0][0], loader_type.compile(calls)) if calls else None
+            )
+
+    result = []
+    for loader_type in loader_types:
+        compiled = cache[(loader_type, *options)]
+        if compiled is not None:
+            result.append((loader_type, compiled))
+    return result
+
+
+def _load_settings(source_cls: type[T], context: Context) -> T:
+    raw = (
         collect(
             source_cls,
             context=context,
-            nested_delimiter=nested_delimiter,
+            nested_delimiter=context.nested_delimiter,
         )
         or {}
     )
 
+    builder = class_inspect.single_shot_builder(source_cls)
+    if builder is not None:
+        try:
+            return construct(source_cls, builder, raw, context)
+        except Exception:  # noqa: S110
+            # Fall back to mapping each level separately, which tolerates (by
+            # omitting) individual fields which fail to map.
+            pass
+
+    result = build(source_cls, raw, context=context)
+
     try:
-        return source_cls(**result)
-    except Exception:
-        if emit_history:
+        return construct(source_cls, lambda value: source_cls(**value), result, context)
+    except Exception as e:
+        if context.history is not None:
             log.warning(context.generate_load_history())
+
+        timed_out = get_timed_out(context, raw)
+        if timed_out is not None:
+            raise timed_out from e
         raise
 
 
+def get_timed_out(context: Context, raw: dict[str, Any]) -> LoadTimeoutError | None:
+    """Return the (missed) timeout of the load which left a field without a value, if any.
+
+    A load which fails to construct after a timeout most likely failed because of
+    it, which is reported as such, rather than as a missing field.
+    """
+    timeouts = context.timeouts
+    if timeouts is None:
+        return None
+
+    for error in timeouts.timed_out:
+        value: Any = raw
+        for part in error.field.split("."):
+            value = value.get(part) if isinstance(value, dict) else None
+        if value is None:
+            return error
+    return None
+
+
+def construct(
+    source_cls: type[T],
+    builder: Callable[[dict[str, Any]], T],
+    value: dict[str, Any],
+    context: Context,
+) -> T:
+    observer = context.observer
+    if observer is None:
+        return builder(value)
+
+    start = time.perf_counter()
+    instance = builder(value)
+    observer.on_construct(source_cls, time.perf_counter() - start)
+    return instance
+
+
 def collect(
     source_cls: type,
     *,
     context: Context,
     nested_delimiter: bool | str = False,
 ) -> dict[str, Any] | None:
+    """Collect the raw loaded value of each field.
+
+    Nested settings classes are collected as nested dicts, which `build` (or a
+    `class_inspect.single_shot_builder`) then turns into the final objects.
+    """
     loaders = context.loaders
+    observer = context.observer
+
+    fields = class_inspect.fields(
+        source_cls, on_compile=observer.on_compile if observer else None
+    )
 
     result = {}
-    for field in class_inspect.fields(source_cls):
+    for field in fields:
         if field.type_view.fallback_origin is ClassVar:
             continue
 
@@ -93,16 +597,118 @@ def collect(
         else:
             for loader in field.get_loaders(loaders):
                 state = context.get_state(loader)
-                value = loader.load(field_context, state)
+                if observer is None:
+                    value = call_loader(loader, field_context, state)
+                else:
+                    start = time.perf_counter()
+                    value = call_loader(loader, field_context, state)
+                    observer.on_load(
+                        field_context,
+                        loader,
+                        time.perf_counter() - start,
+                        value is not None,
+                    )
+
                 if value is not None:
                     break
 
+            if type(value) is str and context.intern is not None:
+                value = context.intern(value)
+
         if value is not None:
-            try:
-                mapped_value = field.map_value(value)
-            except Exception:  # noqa: S110
-                pass
-            else:
-                result[field.name] = mapped_value
+            result[field.name] = value
+
+    return result
+
+
+def call_loader(loader: Loader, context: Context, state: Any) -> Any:
+    """Call `loader.load`, within its time budget (if any)."""
+    timeouts = context.timeouts
+    if timeouts is None or not loader.blocking:
+        # Non-blocking loaders only read memory, so they're always called, even
+        # once the deadline has passed.
+        return loader.load(context, state)
+
+    timeout = timeouts.budget(loader)
+    if timeout is None:
+        return loader.load(context, state)
+
+    start = time.perf_counter()
+    done, value = call_within_budget(
+        loader, timeouts, functools.partial(loader.load, context, state), timeout
+    )
+    if done:
+        return value
+
+    if context.record_history:
+        names = ", ".join(loader.describe(context, state)) or context.name
+        context.record_timeout(loader, names, time.perf_counter() - start)
+
+    error = LoadTimeoutError(loader, ".".join([*context.path, context.name]), timeout)
+    if timeouts.on_timeout == "raise":
+        raise error
+
+    timeouts.timed_out.append(error)
+    return None
+
+
+def call_within_budget(
+    loader: Loader, timeouts: Timeouts, call: Callable[[], Any], timeout: float
+) -> tuple[bool, Any]:
+    """Make `call` (of `loader`), returning whether it completed within `timeout`, and its result.
+
+    A blocking call is made on the load's (daemon) worker thread, so that a call
+    which exceeds the budget can be abandoned, rather than blocking the load. A
+    non-blocking call is always made directly, whatever budget remains.
+    """
+    if not loader.blocking:
+        return True, call()
+
+    if timeout <= 0:
+        return False, None
+
+    future = timeouts.submit(call)
+    try:
+        return True, future.result(timeout)
+    except FutureTimeoutError:
+        if future.done():
+            # Either it finished just in time, or itself raised a `TimeoutError`.
+            return True, future.result()
+
+        # The worker is stuck on this call, so later calls need another.
+        timeouts.finish()
+        return False, None
+
+
+def build(source_cls: type, raw: dict[str, Any], *, context: Context) -> dict[str, Any]:
+    """Map the collected raw values of `source_cls` into each field's type.
+
+    Fields which fail to map are omitted, leaving the class to apply its default
+    or report the missing field.
+    """
+    observer = context.observer
+
+    result = {}
+    for field in class_inspect.fields(source_cls):
+        if field.name not in raw:
+            continue
+
+        value = raw[field.name]
+        field_context = context.enter(field.name) if observer is not None else context
+
+        nested_type = field.get_nested_type()
+        if nested_type:
+            value = build(nested_type, value, context=field_context)
+
+        start = time.perf_counter() if observer is not None else 0.0
+        try:
+            mapped_value = field.map_value(value)
+        except Exception:  # noqa: S110
+            pass
+        else:
+            result[field.name] = mapped_value
+        finally:
+            if observer is not None:
+                observer.on_map(field_context, time.perf_counter() - start)
 
     return result
@@ -1,18 +1,50 @@
 from __future__ import annotations
 
+import collections.abc
 import dataclasses
+import datetime
+import functools
+import json
+import sys
+import threading
+import time
+import weakref
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Callable, Sequence, Type
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Generic,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from type_lens import TypeView
-from typing_extensions import Self, get_type_hints
+from typing_extensions import (
+    Annotated,
+    Literal,
+    Self,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+if sys.version_info >= (3, 10):
+    from types import UnionType
+else:  # pragma: no cover
+    UnionType = None
 
 if TYPE_CHECKING:
     from dataclass_settings.loader import Loader
 
 __all__ = [
+    "compile_converter",
     "detect",
     "fields",
+    "single_shot_builder",
 ]
 
 
@@ -20,12 +52,273 @@ def detect(cls: type) -> bool:
     return bool(ClassTypes.from_cls(cls))
 
 
+TRUE_VALUES = frozenset({"1", "true", "t", "yes", "y", "on"})
+FALSE_VALUES = frozenset({"0", "false", "f", "no", "n", "off"})
+
+Converter = Callable[[Any], Any]
+V = TypeVar("V")
+
+SEQUENCE_CONTAINERS: dict[Any, type] = {
+    list: list,
+    set: set,
+    frozenset: frozenset,
+    collections.abc.Sequence: list,
+    collections.abc.MutableSequence: list,
+    collections.abc.Set: set,
+    collections.abc.MutableSet: set,
+}
+
+
+def compile_converter(annotation: Any) -> Converter:
+    """Compile a function which coerces a loaded (typically `str`) value to `annotation`.
+
+    All type inspection happens once, here, so that the returned function does
+    only the work specific to its annotation. Results are cached per annotation.
+
+    - `bool` accepts the usual true/false strings (`"false"` is `False`!).
+    - `list`/`tuple`/`set`/`frozenset` accept a comma delimited string, or JSON.
+    - `dict` accepts JSON.
+    - `Enum` accepts a member's value or name, `Literal` its values' string forms.
+    - `Union`/`Optional` try each option in order.
+    - `datetime`/`date`/`time` accept ISO format strings.
+    - Anything else is called with the value, e.g. `int("3")` or `Decimal("3")`.
+    """
+    try:
+        hash(annotation)
+    except TypeError:
+        return _compile_converter(annotation)
+    return _cached_compile_converter(annotation)
+
+
+def _compile_converter(annotation: Any) -> Converter:
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if annotation is Any or annotation is object:
+        return identity
+
+    if origin is Annotated:
+        return compile_converter(args[0])
+
+    if origin is Union or (UnionType is not None and origin is UnionType):
+        return union_converter(args)
+
+    if origin is Literal:
+        return literal_converter(args)
+
+    if annotation is type(None):
+        return none_converter
+
+    if annotation is str:
+        return str_converter
+
+    if annotation is bool:
+        return bool_converter
+
+    container = SEQUENCE_CONTAINERS.get(origin)
+    if container is not None:
+        return sequence_converter(
+            container, compile_converter(args[0] if args else Any)
+        )
+
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            return sequence_converter(tuple, compile_converter(args[0]))
+        return fixed_tuple_converter(tuple(compile_converter(arg) for arg in args))
+
+    if origin in (dict, collections.abc.Mapping):
+        key_type, value_type = args if args else (Any, Any)
+        return mapping_converter(
+            compile_converter(key_type), compile_converter(value_type)
+        )
+
+    if annotation in (list, tuple, set, frozenset):
+        return sequence_converter(annotation, identity)
+
+    if annotation is dict:
+        return mapping_converter(identity, identity)
+
+    if isinstance(annotation, type):
+        if issubclass(annotation, Enum):
+            return enum_converter(annotation)
+
+        if issubclass(annotation, (datetime.datetime, datetime.date, datetime.time)):
+            return isoformat_converter(annotation)
+
+        return class_converter(annotation)
+
+    return call_converter(annotation)
+
+
+_cached_compile_converter = functools.lru_cache(maxsize=None)(_compile_converter)
+
+
+def identity(value: Any) -> Any:
+    return value
+
+
+def none_converter(value: Any) -> None:
+    if value is None or (
+        isinstance(value, str) and value.lower() in ("", "none", "null")
+    ):
+        return
+    raise ValueError(f"Expected None, got {value!r}")
+
+
+def str_converter(value: Any) -> str:
+    if isinstance(value, str):
+        return value
+    return str(value)
+
+
+def bool_converter(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+
+    if isinstance(value, str):
+        lowered = value.strip().lower()
+        if lowered in TRUE_VALUES:
+            return True
+        if lowered in FALSE_VALUES:
+            return False
+        raise ValueError(f"Invalid boolean value: {value!r}")
+
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+
+    raise ValueError(f"Invalid boolean value: {value!r}")
+
+
+def class_converter(cls: type) -> Converter:
+    def convert(value: Any) -> Any:
+        if isinstance(value, cls):
+            return value
+        return cls(value)
+
+    return convert
+
+
+def call_converter(annotation: Any) -> Converter:
+    def convert(value: Any) -> Any:
+        return annotation(value)
+
+    return convert
+
+
+def isoformat_converter(cls: type) -> Converter:
+    def convert(value: Any) -> Any:
+        if isinstance(value, cls):
+            return value
+        if isinstance(value, str):
+            return cls.fromisoformat(value)  # type: ignore
+        return cls(value)
+
+    return convert
+
+
+def enum_converter(cls: type[Enum]) -> Converter:
+    # `__members__` (unlike iterating `cls`) includes e.g. a `Flag`'s 0-valued member.
+    by_str = {str(member.value): member for member in cls.__members__.values()}
+    by_name = cls.__members__
+
+    def convert(value: Any) -> Any:
+        if isinstance(value, cls):
+            return value
+
+        if isinstance(value, str):
+            member = by_str.get(value)
+            if member is None:
+                member = by_name.get(value)
+            if member is not None:
+                return member
+        return cls(value)
+
+    return convert
+
+
+def literal_converter(values: tuple[Any, ...]) -> Converter:
+    by_str = {str(value): value for value in values}
+    allowed = set()
+    for value in values:
+        try:
+            allowed.add(value)
+        except TypeError:  # pragma: no cover
+            pass
+
+    def convert(value: Any) -> Any:
+        try:
+            if value in allowed:
+                return value
+        except TypeError:  # pragma: no cover
+            pass
+
+        if isinstance(value, str) and value in by_str:
+            return by_str[value]
+        raise ValueError(f"Expected one of {list(values)!r}, got {value!r}")
+
+    return convert
+
+
+def union_converter(args: tuple[Any, ...]) -> Converter:
+    converters = [compile_converter(arg) for arg in args]
+
+    def convert(value: Any) -> Any:
+        for converter in converters:
+            try:
+                return converter(value)
+            except (TypeError, ValueError):
+                continue
+        raise ValueError(f"{value!r} does not match any of {list(args)!r}")
+
+    return convert
+
+
+def parse_sequence(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+
+    stripped = value.strip()
+    if stripped.startswith("["):
+        return json.loads(stripped)
+
+    if not stripped:
+        return []
+    return [item.strip() for item in stripped.split(",")]
+
+
+def sequence_converter(container: Any, item: Converter) -> Converter:
+    def convert(value: Any) -> Any:
+        return container(item(v) for v in parse_sequence(value))
+
+    return convert
+
+
+def fixed_tuple_converter(items: tuple[Converter, ...]) -> Converter:
+    def convert(value: Any) -> Any:
+        values = parse_sequence(value)
+        if len(values) != len(items):
+            raise ValueError(f"Expected {len(items)} items, got {len(values)}")
+        return tuple(item(v) for item, v in zip(items, values))
+
+    return convert
+
+
+def mapping_converter(key: Converter, item: Converter) -> Converter:
+    def convert(value: Any) -> Any:
+        if isinstance(value, str):
+            value = json.loads(value)
+        return {key(k): item(v) for k, v in value.items()}
+
+    return convert
+
+
 @dataclasses.dataclass
 class Field:
     name: str
     type_view: TypeView
     annotations: tuple[Any, ...]
     mapper: Callable[..., Any] | None = None
+    converter: Converter | None = None
 
     def get_loaders(self, loaders: tuple[Type[Loader], ...]):
         for m in self.annotations:
@@ -33,6 +326,11 @@ class Field:
                 yield m
 
     def get_nested_type(self) -> Type | None:
+        return self.nested_type
+
+    @functools.cached_property
+    def nested_type(self) -> Type | None:
+        """The supported settings class this field nests, if any (computed once)."""
         if self.type_view.is_union:
             args: Sequence[type] = self.type_view.args
         else:
@@ -54,6 +352,9 @@ class Field:
         return supported_arg
 
     def map_value(self, value: str | dict[str, Any]):
+        if self.converter is not None:
+            return self.converter(value)
+
         if not self.mapper:
             return value
 
@@ -62,6 +363,17 @@ class Field:
 
         return self.mapper(value)
 
+    def with_converter(self) -> Self:
+        """Coerce values with a compiled converter, for classes which don't do so themselves."""
+        if self.type_view.fallback_origin is ClassVar or detect(
+            self.type_view.annotation
+        ):
+            return self
+
+        return dataclasses.replace(
+            self, converter=compile_converter(self.type_view.annotation)
+        )
+
     @classmethod
     def from_type_view(cls, name: str, type_view: TypeView) -> Self:
         stripped = type_view.strip_optional()
@@ -80,7 +392,7 @@ class DataclassField(Field):
         fields = []
         for f in value.__dataclass_fields__.values():  # type: ignore
             type_view = type_hints[f.name]
-            field = cls.from_type_view(f.name, type_view)
+            field = cls.from_type_view(f.name, type_view).with_converter()
             fields.append(field)
         return fields
 
@@ -93,7 +405,7 @@ class AttrsField(Field):
 
         for f in value.__attrs_attrs__:  # type: ignore
             type_view = type_hints[f.name]
-            field = cls.from_type_view(f.name, type_view)
+            field = cls.from_type_view(f.name, type_view).with_converter()
             fields.append(field)
         return fields
 
@@ -172,7 +484,66 @@ class PydanticV2DataclassField(Field):
         return fields
 
 
-def fields(cls: type):
+class ClassCache(Generic[V]):
+    """A read-mostly cache, keyed (weakly) by class, for use from many threads.
+
+    Reads never lock; they look up in an immutable snapshot. Writes take a lock
+    and publish a new copy of the snapshot ("copy-on-write"), so that readers
+    (including on free-threaded builds) never observe a mapping mid-mutation.
+    Entries are dropped when their class is garbage collected.
+    """
+
+    def __init__(self):
+        self._snapshot: dict[weakref.ref[type], V] = {}
+        self._lock = threading.RLock()
+
+    def __getitem__(self, cls: type) -> V:
+        return self._snapshot[weakref.ref(cls)]
+
+    def __contains__(self, cls: type) -> bool:
+        return weakref.ref(cls) in self._snapshot
+
+    def __len__(self) -> int:
+        return len(self._snapshot)
+
+    def setdefault(self, cls: type, value: V) -> V:
+        """Store `value` for `cls`, unless another thread already stored one."""
+        with self._lock:
+            key = weakref.ref(cls, self._remove)
+            if key in self._snapshot:
+                return self._snapshot[key]
+
+            self._snapshot = {**self._snapshot, key: value}
+            return value
+
+    def _remove(self, key: weakref.ref[type]):
+        # Called by the garbage collector, potentially while this thread
+        # already holds the lock in `setdefault` (hence the `RLock`).
+        with self._lock:
+            snapshot = dict(self._snapshot)
+            snapshot.pop(key, None)
+            self._snapshot = snapshot
+
+
+_fields_cache: ClassCache[list[Field]] = ClassCache()
+_builder_cache: ClassCache[Callable[[dict[str, Any]], Any] | None] = ClassCache()
+
+
+def fields(
+    cls: type, on_compile: Callable[[type, float], None] | None = None
+) -> list[Field]:
+    """Inspect the fields of `cls`.
+
+    The result is cached per class, so the (relatively expensive) type-hint
+    evaluation only happens the first time a given class is loaded. `on_compile`
+    is called with the time spent whenever that inspection actually happens.
+    """
+    try:
+        return _fields_cache[cls]
+    except KeyError:
+        pass
+
+    start = time.perf_counter()
     class_type = ClassTypes.from_cls(cls)
     if class_type is None:  # pragma: no cover
         raise ValueError(
@@ -183,7 +554,62 @@ def fields(cls: type):
     type_hints = {
         k: TypeView(v) for k, v in get_type_hints(cls, include_extras=True).items()
     }
-    return class_type.value.collect(cls, type_hints)
+    result = _fields_cache.setdefault(cls, class_type.value.collect(cls, type_hints))
+
+    if on_compile is not None:
+        on_compile(cls, time.perf_counter() - start)
+    return result
+
+
+def single_shot_builder(cls: type) -> Callable[[dict[str, Any]], Any] | None:
+    """Return a function which validates and builds `cls` from a raw nested dict.
+
+    This is only available for pydantic v2 models/dataclasses and msgspec structs,
+    whose nested settings classes are all of the same kind. The whole tree is then
+    built by a single `TypeAdapter.validate_python` or `msgspec.convert` call,
+    rather than constructing (and revalidating) each nested level separately.
+    """
+    try:
+        return _builder_cache[cls]
+    except KeyError:
+        pass
+
+    builder: Callable[[dict[str, Any]], Any] | None = None
+
+    class_type = ClassTypes.from_cls(cls)
+    if class_type in PYDANTIC_V2_TYPES and is_homogeneous(cls, PYDANTIC_V2_TYPES):
+        from pydantic import TypeAdapter
+
+        builder = TypeAdapter(cls).validate_python
+
+    elif class_type is ClassTypes.msgspec and is_homogeneous(cls, (class_type,)):
+        import msgspec
+
+        def builder(value: dict[str, Any]) -> Any:
+            return msgspec.convert(value, cls, strict=False)
+
+    return _builder_cache.setdefault(cls, builder)
+
+
+def is_homogeneous(cls: type, class_types: tuple[ClassTypes, ...]) -> bool:
+    """Whether `cls` and all of its nested settings classes are among `class_types`."""
+    if ClassTypes.from_cls(cls) is ClassTypes.msgspec:
+        import msgspec
+
+        if any(f.name != f.encode_name for f in msgspec.structs.fields(cls)):
+            return False
+
+    for field in fields(cls):
+        nested_type = field.get_nested_type()
+        if nested_type is None:
+            continue
+
+        if ClassTypes.from_cls(nested_type) not in class_types:
+            return False
+
+        if not is_homogeneous(nested_type, class_types):
+            return False
+    return True
 
 
 class ClassTypes(Enum):
@@ -196,7 +622,7 @@ class ClassTypes(Enum):
 
     @classmethod
     def from_cls(cls, obj: type) -> ClassTypes | None:
-        if hasattr(obj, "__pydantic_fields__"):
+        if hasattr(obj, "__pydantic_fields__") and dataclasses.is_dataclass(obj):
             return cls.pydantic_v2_dataclass
 
         if dataclasses.is_dataclass(obj):
@@ -226,3 +652,6 @@ class ClassTypes(Enum):
             return cls.attrs
 
         return None
+
+
+PYDANTIC_V2_TYPES = (ClassTypes.pydantic_v2, ClassTypes.pydantic_v2_dataclass)
@@ -0,0 +1,344 @@
+from __future__ import annotations
+
+import argparse
+import functools
+import importlib
+import math
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Sequence, TextIO
+
+from dataclass_settings.base import load_settings
+from dataclass_settings.context import Context, LoadHistory
+from dataclass_settings.loader import Loader, LoaderType
+from dataclass_settings.loaders import (
+    DotEnv,
+    Env,
+    Json,
+    Secret,
+    SecretBundle,
+    Sqlite,
+    Toml,
+)
+from dataclass_settings.loaders.bundle import build_bundle
+from dataclass_settings.observer import LoadStats
+from dataclass_settings.plan import walk
+
+__all__ = [
+    "main",
+]
+
+
+def main(argv: Sequence[str] | None = None, *, out: TextIO | None = None) -> int:
+    """Diagnose how a settings class is loaded, without writing code.
+
+    - `explain`: Print every leaf field along with the concrete env vars, secret
+      paths and toml keys it will consult.
+    - `load`: Perform a load, and print per-field provenance and per-loader timings.
+    - `profile`: Perform repeated loads (each with fresh loader states), and print
+      the cold first load, latency percentiles and the memory allocated per load.
+    - `bundle`: Bundle a directory of secret files for `SecretBundle`.
+    """
+    args = create_parser().parse_args(argv)
+    if out is None:
+        out = sys.stdout
+
+    if args.command == "bundle":
+        count = build_bundle(args.directory, args.output)
+        out.write(f"Bundled {count} secrets from {args.directory} into {args.output}\n")
+        return 0
+
+    source_cls = import_class(args.source)
+    options = {
+        "nested_delimiter": args.nested_delimiter,
+        "infer_names": args.infer_names,
+    }
+
+    if args.command == "explain":
+        return explain(source_cls, out, loaders=get_loaders(args), **options)
+    if args.command == "load":
+        return load(source_cls, out, loaders=get_loaders(args), **options)
+    return profile(
+        source_cls,
+        out,
+        iterations=args.iterations,
+        get_loaders=functools.partial(get_loaders, args),
+        **options,
+    )
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m dataclass_settings",
+        description="Explain, load, or profile a settings class.",
+    )
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("source", help="The settings class to load, as `module:Class`.")
+    common.add_argument(
+        "--nested-delimiter",
+        nargs="?",
+        const=True,
+        default=False,
+        help='Join nested field names with a delimiter ("_" when no value is given).',
+    )
+    common.add_argument(
+        "--infer-names",
+        action="store_true",
+        help="Infer setting names from field names.",
+    )
+    common.add_argument(
+        "--secret-dir",
+        action="append",
+        help="A directory to search for `Secret` files (may be repeated).",
+    )
+    common.add_argument(
+        "--secret-bundle",
+        help="A bundle file read by `SecretBundle` loaders.",
+    )
+    common.add_argument(
+        "--toml-file",
+        action="append",
+        help="A file read by `Toml` loaders (may be repeated, later files taking precedence).",
+    )
+    common.add_argument(
+        "--json-file",
+        help="A file read by `Json` loaders.",
+    )
+    common.add_argument(
+        "--dotenv-file",
+        action="append",
+        help="A file read by `DotEnv` loaders (may be repeated, later files taking precedence).",
+    )
+    common.add_argument(
+        "--sqlite-file",
+        help="A database read by `Sqlite` loaders.",
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser(
+        "explain", parents=[common], help="Print the names each field will consult."
+    )
+    subparsers.add_parser(
+        "load", parents=[common], help="Load once and print provenance and timings."
+    )
+    profile = subparsers.add_parser(
+        "profile", parents=[common], help="Load repeatedly and print latency."
+    )
+    profile.add_argument(
+        "-n",
+        "--iterations",
+        type=int,
+        default=100,
+        help="The number of loads to perform (default: 100).",
+    )
+
+    bundle = subparsers.add_parser(
+        "bundle", help="Bundle a directory of secret files for `SecretBundle`."
+    )
+    bundle.add_argument(
+        "directory", help="The directory of secrets, e.g. /run/secrets."
+    )
+    bundle.add_argument("output", help="The bundle file to (atomically) write.")
+    return parser
+
+
+def import_class(source: str) -> type:
+    module_name, _, class_name = source.partition(":")
+    if not class_name:
+        raise SystemExit(f"Expected `module:Class`, got `{source}`.")
+
+    value: Any = importlib.import_module(module_name)
+    for segment in class_name.split("."):
+        value = getattr(value, segment)
+    return value
+
+
+def get_loaders(args: argparse.Namespace) -> list[LoaderType]:
+    """Build (fresh) loader states from the command line options.
+
+    `Sqlite` requires a database, so it's only included given `--sqlite-file`.
+    """
+    loaders: list[LoaderType] = [
+        Env,
+        Secret.load_with(dir=args.secret_dir),
+        SecretBundle.load_with(file=args.secret_bundle),
+        Toml.load_with(file=args.toml_file),
+        Json.load_with(file=args.json_file),
+        DotEnv.load_with(files=args.dotenv_file),
+    ]
+    if args.sqlite_file:
+        loaders.append(Sqlite.load_with(file=args.sqlite_file))
+    return loaders
+
+
+def unresolved_loaders(source_cls: type, context: Context) -> list[str]:
+    """Return the names of the loader types used by `source_cls`, but not resolved."""
+    result: dict[str, None] = {}
+    for entry in walk(source_cls, context):
+        for annotation in entry.field.annotations:
+            if isinstance(annotation, Loader) and not isinstance(
+                annotation, context.loaders
+            ):
+                result[type(annotation).__name__] = None
+    return list(result)
+
+
+def write_unresolved(source_cls: type, context: Context, out: TextIO):
+    unresolved = unresolved_loaders(source_cls, context)
+    if unresolved:
+        out.write(f"\nUnresolved loaders (skipped): {', '.join(unresolved)}\n")
+
+
+def explain(
+    source_cls: type,
+    out: TextIO,
+    *,
+    loaders: list[LoaderType],
+    nested_delimiter: bool | str,
+    infer_names: bool,
+) -> int:
+    context = Context(nested_delimiter=nested_delimiter, infer_names=infer_names)
+    context.resolve_loaders(loaders)
+
+    for entry in walk(source_cls, context):
+        out.write(f"{entry.path}:\n")
+        described = entry.describe()
+        if not described:
+            out.write("  (no loaders)\n")
+
+        for loader, sources in described:
+            for source in sources:
+                out.write(f"  {loader.__class__.__name__}: {source}\n")
+
+    write_unresolved(source_cls, context, out)
+    return 0
+
+
+def load(
+    source_cls: type,
+    out: TextIO,
+    *,
+    loaders: list[LoaderType],
+    nested_delimiter: bool | str,
+    infer_names: bool,
+) -> int:
+    history = LoadHistory(limit=None)
+    stats = LoadStats()
+
+    error: Exception | None = None
+    try:
+        load_settings(
+            source_cls,
+            loaders=loaders,
+            nested_delimiter=nested_delimiter,
+            infer_names=infer_names,
+            emit_history=history,
+            observer=stats,
+        )
+    except Exception as e:
+        error = e
+
+    provenance: dict[str, str | None] = {}
+    for event in history.events:
+        if provenance.get(event.path) is None:
+            provenance[event.path] = (
+                f"{event.loader.__class__.__name__} '{event.name}'"
+                if event.hit
+                else None
+            )
+
+    out.write("Provenance:\n")
+    for path, source in provenance.items():
+        out.write(f"  {path}: {source or '(not found)'}\n")
+
+    out.write("\nTimings:\n")
+    out.write(stats.summary())
+    out.write("\n")
+
+    context = Context(nested_delimiter=nested_delimiter, infer_names=infer_names)
+    context.resolve_loaders(loaders)
+    write_unresolved(source_cls, context, out)
+
+    if error is not None:
+        out.write(f"\nFailed to load `{source_cls.__qualname__}`: {error!r}\n")
+        return 1
+    return 0
+
+
+def profile(
+    source_cls: type,
+    out: TextIO,
+    *,
+    iterations: int,
+    get_loaders: Callable[[], list[LoaderType]],
+    nested_delimiter: bool | str,
+    infer_names: bool,
+) -> int:
+    def run(history: bool | LoadHistory = False):
+        # Each load gets fresh loader states, so that state caches (e.g. of
+        # secret files) don't hide the cost of a load in a new process.
+        load_settings(
+            source_cls,
+            loaders=get_loaders(),
+            nested_delimiter=nested_delimiter,
+            infer_names=infer_names,
+            emit_history=history,
+        )
+
+    if iterations < 1:
+        raise SystemExit("`--iterations` must be at least 1.")
+
+    durations = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        try:
+            run()
+        except Exception:
+            # Reload with the history recorded (which would skew the timings of
+            # successful loads), in order to explain the failure.
+            history = LoadHistory(limit=None)
+            try:
+                run(history)
+            except Exception as e:
+                out.write(history.format())
+                out.write(f"\nFailed to load `{source_cls.__qualname__}`: {e!r}\n")
+                return 1
+            raise
+        durations.append(time.perf_counter() - start)
+
+    # The first load additionally pays for one-off work (e.g. inspecting the
+    # class), so it's reported separately from the rest.
+    first, *rest = durations
+    rest.sort()
+
+    # Memory is measured in a separate pass, because tracing skews timings.
+    # Tracing is restarted for each load, which resets its peak.
+    peaks = []
+    for _ in range(min(iterations, 10)):
+        tracemalloc.start()
+        try:
+            run()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        peaks.append(peak)
+
+    out.write(f"iterations: {iterations}\n")
+    out.write(f"first: {first * 1000:.3f} ms\n")
+    if rest:
+        out.write(f"p50: {percentile(rest, 50) * 1000:.3f} ms\n")
+        out.write(f"p99: {percentile(rest, 99) * 1000:.3f} ms\n")
+        out.write(f"max: {rest[-1] * 1000:.3f} ms\n")
+    out.write(f"peak allocated per load: {max(peaks) / 1024:.1f} KiB\n")
+    return 0
+
+
+def percentile(values: Sequence[float], percent: float) -> float:
+    """Return the nearest-rank percentile of already-sorted `values`."""
+    if not values:
+        return 0.0
+
+    rank = max(math.ceil(percent / 100 * len(values)) - 1, 0)
+    return values[min(rank, len(values) - 1)]
@@ -1,10 +1,238 @@
 from __future__ import annotations
 
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
 from dataclasses import dataclass, field, replace
-from typing import Any, Sequence, cast
+from functools import cached_property
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Mapping,
+    NamedTuple,
+    Sequence,
+    cast,
+)
+
+from typing_extensions import Literal
 
 from dataclass_settings.loader import Loader, LoaderState, LoaderType, LoaderTypes, T
 
+if TYPE_CHECKING:
+    from dataclass_settings.observer import Observer
+
+DEFAULT_HISTORY_LIMIT = 1000
+DEFAULT_INTERN_LIMIT = 10_000
+MAX_HISTORY_VALUE_LENGTH = 200
+
+
+class LoadEvent(NamedTuple):
+    """A single loader lookup, recorded as references and formatted lazily."""
+
+    context: Context
+    loader: Loader
+    #: The name looked up, or its raw parts, as formatted by `Loader.format_name`.
+    raw_name: Any
+    value: Any
+
+    #: Set when the lookup exceeded its time budget (and was abandoned).
+    timed_out_after: float | None = None
+
+    @property
+    def hit(self) -> bool:
+        return self.value is not None
+
+    @property
+    def name(self) -> str:
+        return self.loader.format_name(self.raw_name)
+
+    @property
+    def path(self) -> str:
+        return ".".join([*self.context.path, self.context.name])
+
+    def format(self) -> str:
+        value = self.value
+        if value is not None and self.loader.sensitive:
+            value = "***"
+        else:
+            value = str(value)
+            if len(value) > MAX_HISTORY_VALUE_LENGTH:
+                value = value[:MAX_HISTORY_VALUE_LENGTH] + "..."
+
+        loader_name = self.loader.__class__.__name__
+        if self.timed_out_after is not None:
+            return f"Used `{loader_name}` to read '{self.name}', timed out after {self.timed_out_after:.3f}s. Skipping."
+
+        message = f"Used `{loader_name}` to read '{self.name}', found '{value}'."
+        if not self.hit:
+            message += " Skipping."
+        return message
+
+
+@dataclass
+class LoadHistory:
+    """A bounded buffer of `LoadEvent`, only formatted when requested.
+
+    Once `limit` events have been recorded, the oldest events are dropped.
+    """
+
+    limit: int | None = DEFAULT_HISTORY_LIMIT
+    events: Deque[LoadEvent] = field(init=False)
+
+    def __post_init__(self):
+        self.events = deque(maxlen=self.limit)
+
+    def record(
+        self,
+        context: Context,
+        loader: Loader,
+        name: Any,
+        value: Any,
+        timed_out_after: float | None = None,
+    ):
+        self.events.append(LoadEvent(context, loader, name, value, timed_out_after))
+
+    def format(self) -> str:
+        grouped: dict[str, list[str]] = {}
+        for event in self.events:
+            grouped.setdefault(event.path, []).append(event.format())
+
+        result = []
+        for name, attempts in grouped.items():
+            result.append(f"{name}:")
+            for attempt in attempts:
+                result.append(f" - {attempt}")
+            result.append("")
+        return "\n".join(result)
+
+
+@dataclass
+class InternTable:
+    """Deduplicate loaded string values, so that equal values share one object.
+
+    At most `limit` distinct strings are retained; once full, new strings are
+    passed through unchanged (while already-interned ones continue to be shared).
+    `bytes_saved` totals the size of each duplicate which was replaced.
+    """
+
+    limit: int = DEFAULT_INTERN_LIMIT
+    values: dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    hits: int = field(default=0, init=False)
+    bytes_saved: int = field(default=0, init=False)
+
+    def __call__(self, value: str) -> str:
+        existing = self.values.get(value)
+        if existing is not None:
+            if existing is not value:
+                self.hits += 1
+                self.bytes_saved += sys.getsizeof(value)
+            return existing
+
+        if len(self.values) < self.limit:
+            self.values[value] = value
+        return value
+
+
+class LoadTimeoutError(TimeoutError):
+    """Raised when a loader exceeds its time budget, given `on_timeout="raise"`."""
+
+    def __init__(self, loader: Loader, field: str, timeout: float):
+        self.loader = loader
+        self.field = field
+        self.timeout = timeout
+        super().__init__(
+            f"`{loader.__class__.__name__}` exceeded its {timeout:.3f}s budget loading `{field}`"
+        )
+
+
+@dataclass
+class Timeouts:
+    """The time budgets of a load.
+
+    `deadline` bounds the whole load (in seconds, from `start`), and `loaders`
+    bounds each individual call of a given loader type. A loader call which
+    exceeds its budget is abandoned, and either treated as a miss (falling
+    through to the field's next loader) or raises `LoadTimeoutError`.
+    """
+
+    deadline: float | None = None
+    loaders: Mapping[type[Loader], float] = field(default_factory=dict)
+    on_timeout: Literal["miss", "raise"] = "miss"
+    expires: float | None = field(default=None, init=False)
+
+    #: The timeouts of the current load, which were treated as misses.
+    timed_out: list[LoadTimeoutError] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    _worker: Worker | None = field(default=None, init=False, repr=False, compare=False)
+
+    def start(self):
+        self.timed_out.clear()
+        if self.deadline is not None:
+            self.expires = time.monotonic() + self.deadline
+
+    def finish(self):
+        """Stop the load's worker thread (if one was started)."""
+        if self._worker is not None:
+            self._worker.stop()
+            self._worker = None
+
+    def submit(self, call: Callable[[], Any]) -> Future:
+        """Make `call` on the load's worker thread, starting one if necessary."""
+        worker = self._worker
+        if worker is None:
+            worker = self._worker = Worker()
+        return worker.submit(call)
+
+    def budget(self, loader: Loader) -> float | None:
+        timeout = self.loaders.get(type(loader))
+        if self.expires is not None:
+            remaining = max(self.expires - time.monotonic(), 0.0)
+            timeout = remaining if timeout is None else min(timeout, remaining)
+        return timeout
+
+
+class Worker:
+    """A (daemon) thread which makes the blocking loader calls of a load, in turn.
+
+    A call which exceeds its budget is abandoned along with its worker (whose
+    thread exits once that call eventually returns), and a new worker makes the
+    load's remaining calls.
+    """
+
+    def __init__(self):
+        self.calls: queue.SimpleQueue = queue.SimpleQueue()
+        self.thread = threading.Thread(
+            target=self.run, name="dataclass-settings-loader", daemon=True
+        )
+        self.thread.start()
+
+    def submit(self, call: Callable[[], Any]) -> Future:
+        future: Future = Future()
+        self.calls.put((call, future))
+        return future
+
+    def stop(self):
+        self.calls.put(None)
+
+    def run(self):
+        while True:
+            item = self.calls.get()
+            if item is None:
+                return
+
+            call, future = item
+            try:
+                future.set_result(call())
+            except BaseException as e:
+                future.set_exception(e)
+
 
 @dataclass
 class Context:
@@ -14,9 +242,14 @@ class Context:
 
     nested_delimiter: bool | str = False
     infer_names: bool = False
-    record_history: bool = False
+    history: LoadHistory | None = None
+    observer: Observer | None = None
+    intern: InternTable | None = None
+    timeouts: Timeouts | None = None
 
-    _loaded_values: dict[str, list[str]] = field(default_factory=dict)
+    _children: dict[str, Context] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     @property
     def name(self):
@@ -26,20 +259,37 @@ class Context:
     def loaders(self) -> tuple[type[Loader], ...]:
         return tuple(self.state.keys())
 
+    @property
+    def record_history(self) -> bool:
+        return self.history is not None
+
     def enter(self, name: str):
+        # Child contexts are memoized, so that repeated loads through the same
+        # root context (e.g. `load_settings_many`) only ever create them once.
+        child = self._children.get(name)
+        if child is not None:
+            return child
+
         path = [*self.path]
         if self.field_name is not None:
             path.append(self.field_name)
 
-        return replace(self, path=path, field_name=name)
+        child = self._children[name] = replace(self, path=path, field_name=name)
+        return child
+
+    @cached_property
+    def name_prefix(self) -> str:
+        """The `nested_delimiter` joined `path`, which prefixes `get_name` names."""
+        if not self.nested_delimiter or not self.path:
+            return ""
+
+        nested_delimiter = (
+            self.nested_delimiter if isinstance(self.nested_delimiter, str) else "_"
+        )
+        return nested_delimiter.join(self.path) + nested_delimiter
 
     def get_name(self, name: str) -> str:
-        if self.nested_delimiter:
-            nested_delimiter = (
-                self.nested_delimiter if isinstance(self.nested_delimiter, str) else "_"
-            )
-            return nested_delimiter.join([*self.path, name])
-        return name
+        return self.name_prefix + name
 
     def resolve_loaders(self, *loaders_: LoaderTypes):
         seen: set[type[Loader]] = set()
@@ -72,24 +322,33 @@ class Context:
     def get_state(self, loader: Loader[T]) -> T:
         return cast(T, self.state[type(loader)])
 
-    def record_loaded_value(self, loader: Loader, name: str, value: Any):
-        if not self.record_history:
+    def record_loaded_value(self, loader: Loader, name: Any, value: Any):
+        """Record a lookup of `name` in the history (if enabled).
+
+        `name` may be given as raw parts (see `Loader.format_name`), which are
+        only formatted if the history itself is.
+        """
+        history = self.history
+        if history is None:
             return
 
-        message = (
-            f"Used `{loader.__class__.__name__}` to read '{name}', found '{value}'."
-        )
-        if value is None:
-            message += " Skipping."
+        history.record(self, loader, name, value)
 
-        full_path = ".".join([*self.path, cast(str, self.field_name)])
-        self._loaded_values.setdefault(full_path, []).append(message)
+    def record_timeout(self, loader: Loader, name: str, duration: float):
+        history = self.history
+        if history is None:
+            return
 
-    def generate_load_history(self):
-        result = []
-        for name, attempts in self._loaded_values.items():
-            result.append(f"{name}:")
-            for attempt in attempts:
-                result.append(f" - {attempt}")
-            result.append("")
-        return "\n".join(result)
+        history.record(self, loader, name, None, timed_out_after=duration)
+
+    def record_cache_lookup(self, loader: Loader, hit: bool):
+        observer = self.observer
+        if observer is None:
+            return
+
+        observer.on_cache(loader, hit)
+
+    def generate_load_history(self) -> str:
+        if self.history is None:
+            return ""
+        return self.history.format()
@@ -1,24 +1,35 @@
 from __future__ import annotations
 
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from pathlib import PurePath
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
+    ClassVar,
+    Dict,
     Generic,
     MutableMapping,
     Sequence,
+    Tuple,
     TypeVar,
     Union,
 )
 
-from typing_extensions import assert_never
+from typing_extensions import Self, assert_never
 
 if TYPE_CHECKING:
     from dataclass_settings.context import Context
 
 
 T = TypeVar("T")
+V = TypeVar("V")
+
+DEFAULT_FILE_CACHE_LIMIT = 128
 
 
 @dataclass
@@ -31,10 +42,149 @@ class DictState(LoaderState[T]):
     value: MutableMapping[Any, Any] = field(default_factory=dict)
 
 
+@dataclass
+class CacheState(DictState[T]):
+    """A `DictState` whose `value` caches loaded values, and is safe to share.
+
+    A single state may be shared by concurrent `load_settings` calls (e.g. from a
+    thread pool). `get_or_load` is "single-flight": when several threads request
+    the same uncached key at once, only one of them calls `load`, and the rest
+    wait for (and share) its result.
+    """
+
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+    _pending: Dict[Any, Future] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def get_or_load(self, key: Any, load: Callable[[], Any]) -> tuple[Any, bool]:
+        """Return the cached value of `key` (calling `load` if necessary), and whether it was cached.
+
+        `None` results are not cached.
+        """
+        try:
+            return self.value[key], True
+        except KeyError:
+            pass
+
+        with self._lock:
+            if key in self.value:
+                return self.value[key], True
+
+            pending = self._pending.get(key)
+            owner = pending is None
+            if pending is None:
+                pending = self._pending[key] = Future()
+
+        if not owner:
+            return pending.result(), True
+
+        try:
+            value = load()
+        except BaseException as e:
+            with self._lock:
+                del self._pending[key]
+            pending.set_exception(e)
+            raise
+
+        with self._lock:
+            if value is not None:
+                self.value[key] = value
+            del self._pending[key]
+
+        pending.set_result(value)
+        return value, False
+
+    def get_or_load_latest(
+        self, key: tuple, version: Any, load: Callable[[], Any]
+    ) -> tuple[Any, bool]:
+        """`get_or_load` the `version` of `key`, dropping any other cached version of it.
+
+        Keys are cached as `(*key, version)`, so only the latest version loaded
+        is retained.
+        """
+        value, cached = self.get_or_load((*key, version), load)
+        if not cached:
+            with self._lock:
+                for other in list(self.value):
+                    if (
+                        isinstance(other, tuple)
+                        and other[:-1] == key
+                        and other[-1] != version
+                    ):
+                        del self.value[other]
+        return value, cached
+
+    def view(self, **changes: Any) -> Self:
+        """Return a copy of this state with `changes`, which shares its caches."""
+        view = object.__new__(type(self))
+        view.__dict__.update(self.__dict__, **changes)
+        return view
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        del state["_pending"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+        self._pending = {}
+
+
 class Loader(Generic[T]):
+    #: When `True`, values found by this loader are redacted in the load history.
+    sensitive: ClassVar[bool] = False
+
+    #: When `False`, `load` only reads memory (e.g. `Env`), so it's always called
+    #: directly, rather than made (within its time budget) on the load's worker
+    #: thread.
+    blocking: ClassVar[bool] = True
+
     def load(self, context: Context, state: T) -> Any:
         assert_never()  # type: ignore
 
+    def describe(self, context: Context, state: T) -> Sequence[str]:
+        """Describe the concrete sources `load` would consult, in order."""
+        return ()
+
+    def format_name(self, name: Any) -> str:
+        """Format a `name` which `load` recorded through `Context.record_loaded_value`.
+
+        Names may be recorded as raw parts, so that formatting them is deferred
+        until the load history is formatted. By default, a tuple's parts are
+        concatenated.
+        """
+        if isinstance(name, tuple):
+            return "".join(str(part) for part in name)
+        return str(name)
+
+    @classmethod
+    def compile(cls, plan: Sequence[tuple[Loader, Context]]) -> Any:
+        """Compile what `prepare` needs, given every `(loader, context)` a settings class may `load`.
+
+        Called once per settings class (and `nested_delimiter`/`infer_names`), with
+        the result cached and given to every `prepare` of that class. As such, the
+        result shouldn't retain the contexts. By default, `plan`'s loaders.
+        """
+        return [loader for loader, _ in plan]
+
+    @classmethod
+    def prepare(cls, state: T, compiled: Any) -> T | None:
+        """Prepare `state` for a load, given the result of `compile`.
+
+        Loaders which override this are called once per load (before any field
+        is loaded), e.g. in order to fetch every value the load may need at once.
+        The call is bounded by the load's budget for the loader type.
+
+        A returned state is used in place of `state` for the rest of that load
+        only, e.g. a view of `state` pinned to what was read for the load.
+        """
+        return None
+
     @classmethod
     def load_with(cls, *args, **kwargs) -> T | None:
         return None
@@ -44,6 +194,19 @@ LoaderType = Union[type[Loader], LoaderState]
 LoaderTypes = Union[LoaderType, Sequence[LoaderType]]
 PathLike = Union[PurePath, str]
 
+#: A file's `(st_dev, st_ino, st_mtime_ns, st_size)`, see `stat_key`.
+StatKey = Tuple[int, int, int, int]
+
+
+def stat_key(file: PathLike | int | os.stat_result) -> StatKey:
+    """Return the `StatKey` of `file` (a path, a descriptor, or its `stat`).
+
+    The key changes whenever the file is replaced (e.g. a rotated secret) or
+    modified, so it can key cached contents of the file.
+    """
+    stat = file if isinstance(file, os.stat_result) else os.stat(file)
+    return (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
 
 def coerce_pathlike(dir: PathLike | None, default: PurePath) -> PurePath:
     if dir is None:
@@ -65,3 +228,42 @@ def coerce_pathlike_sequence(
         return (coerce_pathlike(dir, default),)
 
     return tuple(PurePath(d) for d in dir)
+
+
+class FileCache(Generic[V]):
+    """A process-wide LRU cache of values derived from files, keyed by path.
+
+    Each value is stored along with its file's `StatKey`, and only returned while
+    the file is unchanged. At most `limit` files are retained, evicting the least
+    recently used, so that e.g. per-tenant files aren't held for the life of the
+    process. Safe to share between threads.
+    """
+
+    def __init__(self, limit: int = DEFAULT_FILE_CACHE_LIMIT):
+        self.limit = limit
+        self._entries: OrderedDict[PurePath, tuple[StatKey, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, path: PurePath, key: StatKey) -> V | None:
+        """Return the value cached for `path`, if it was cached as of `key`."""
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry[0] != key:
+                return None
+
+            self._entries.move_to_end(path)
+            return entry[1]
+
+    def set(self, path: PurePath, key: StatKey, value: V):
+        with self._lock:
+            self._entries[path] = (key, value)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.limit:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -1,9 +1,19 @@
+from dataclass_settings.loaders.bundle import SecretBundle
+from dataclass_settings.loaders.dotenv import DotEnv
 from dataclass_settings.loaders.env import Env
+from dataclass_settings.loaders.json import Json
+from dataclass_settings.loaders.row import Row
 from dataclass_settings.loaders.secret import Secret
+from dataclass_settings.loaders.sqlite import Sqlite
 from dataclass_settings.loaders.toml import Toml
 
 __all__ = [
+    "DotEnv",
     "Env",
+    "Json",
+    "Row",
     "Secret",
+    "SecretBundle",
+    "Sqlite",
     "Toml",
 ]
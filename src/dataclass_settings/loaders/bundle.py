@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import functools
+import mmap
+import os
+import struct
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path, PurePath
+from typing import Any, Sequence
+
+from dataclass_settings.context import Context
+from dataclass_settings.loader import CacheState, FileCache, Loader, PathLike, stat_key
+
+MAGIC = b"DSB1"
+
+# The header: the magic, followed by the number of entries.
+HEADER = struct.Struct("<4sI")
+# Each index entry: the length of its (utf-8) name, followed by the name itself,
+# and then the absolute offset and length of its value.
+NAME_LENGTH = struct.Struct("<H")
+SPAN = struct.Struct("<QQ")
+
+
+class Bundle:
+    """A memory-mapped secret bundle, and its (eagerly parsed) index.
+
+    Values are read by slicing the mapped buffer, so no syscalls are made per
+    lookup, and the pages are shared (through the page cache) between every
+    process which maps the same file.
+    """
+
+    def __init__(self, file: PurePath, buffer: mmap.mmap):
+        self.file = file
+        self._buffer = buffer
+        self._index = read_index(file, buffer)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def __reduce__(self):
+        # The mapping itself can't be pickled (e.g. to a process pool), so the
+        # receiving process maps the file itself.
+        return (open_bundle, (self.file,))
+
+    def get(self, name: str) -> str | None:
+        span = self._index.get(name)
+        if span is None:
+            return None
+
+        offset, length = span
+        return self._buffer[offset : offset + length].decode()
+
+
+@dataclass
+class SecretBundleState(CacheState):
+    """Caches the mapped bundle. Safe to share between threads."""
+
+    file: PurePath | None = None
+
+
+@dataclass(init=False)
+class SecretBundle(Loader):
+    """Load secrets from a single, memory-mapped bundle file.
+
+    Mounting many individual secret files costs an `open`/`read`/`close` per
+    secret, per process. A bundle (built from such a directory by `build_bundle`,
+    or `python -m dataclass_settings bundle`) is mapped once per process, after
+    which each lookup only slices the mapped buffer.
+
+    Names are resolved like `Secret` (through `Context.get_name`, and not
+    upper-cased). A bundle which doesn't exist is treated as empty.
+    """
+
+    sensitive = True
+
+    names: tuple[str, ...] = ()
+
+    def __init__(self, *names: str):
+        self.names = names
+
+    def load(self, context: Context, state: SecretBundleState) -> Any:
+        file = self.get_file(state)
+
+        bundle, cached = state.get_or_load(file, functools.partial(open_bundle, file))
+        context.record_cache_lookup(self, cached)
+
+        for name in self.get_names(context):
+            value = None if bundle is None else bundle.get(name)
+            context.record_loaded_value(self, (file, ":", name), value)
+
+            if value is not None:
+                return value
+
+        return None
+
+    def describe(self, context: Context, state: SecretBundleState) -> Sequence[str]:
+        file = self.get_file(state)
+        return [f"{file}:{name}" for name in self.get_names(context)]
+
+    def get_names(self, context: Context) -> list[str]:
+        field_name = context.name
+
+        names = self.names
+        if not names and context.infer_names:
+            names = (field_name,)
+
+        if not names:
+            field = ".".join([*context.path, field_name])
+            raise ValueError(
+                f"SecretBundle instance for `{field}` supplies no name and `infer_names` is enabled"
+            )
+
+        return [context.get_name(name) for name in names]
+
+    def get_file(self, state: SecretBundleState) -> PurePath:
+        if state.file is None:
+            raise ValueError("SecretBundle loader requires a `file` argument")
+        return state.file
+
+    @classmethod
+    def load_with(cls, file: PathLike | None = None) -> SecretBundleState:
+        return SecretBundleState(cls, file=None if file is None else PurePath(file))
+
+
+_bundles: FileCache[Bundle] = FileCache()
+
+
+def open_bundle(file: PathLike) -> Bundle | None:
+    """Map the bundle `file`, returning `None` if it doesn't exist.
+
+    Mappings are cached process-wide (in a bounded `FileCache`) by the file's
+    `(st_dev, st_ino, st_mtime_ns, st_size)`, so an unchanged bundle is only
+    mapped once, however many states/loads read it. An evicted bundle is
+    unmapped once it's no longer referenced.
+    """
+    path = PurePath(file)
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+
+    key = stat_key(stat)
+    cached = _bundles.get(path, key)
+    if cached is not None:
+        return cached
+
+    with open(path, "rb") as f:
+        if stat.st_size < HEADER.size:
+            raise ValueError(f"`{path}` is not a secret bundle")
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    bundle = Bundle(path, buffer)
+    _bundles.set(path, key, bundle)
+    return bundle
+
+
+def read_index(file: PurePath, buffer: mmap.mmap) -> dict[str, tuple[int, int]]:
+    magic, count = HEADER.unpack_from(buffer, 0)
+    if magic != MAGIC:
+        raise ValueError(f"`{file}` is not a secret bundle")
+
+    index = {}
+    position = HEADER.size
+    for _ in range(count):
+        (name_length,) = NAME_LENGTH.unpack_from(buffer, position)
+        position += NAME_LENGTH.size
+        name = buffer[position : position + name_length].decode()
+        position += name_length
+
+        offset, length = SPAN.unpack_from(buffer, position)
+        position += SPAN.size
+        if offset + length > len(buffer):
+            raise ValueError(f"`{file}` is truncated")
+
+        index[name] = (offset, length)
+    return index
+
+
+def build_bundle(directory: PathLike, output: PathLike) -> int:
+    """Bundle each file in `directory` (e.g. `/run/secrets`) into `output`.
+
+    Only regular files (or symlinks to them) directly within `directory` are
+    included, skipping the `..`-prefixed entries of a Kubernetes secret mount.
+    `output` is replaced atomically, so processes never map a partial bundle.
+
+    Returns the number of secrets bundled.
+    """
+    directory = Path(directory)
+    output = Path(output)
+
+    values = {}
+    with os.scandir(directory) as it:
+        for entry in it:
+            if entry.name.startswith("..") or not entry.is_file():
+                continue
+            if directory / entry.name == output:
+                continue
+
+            with open(entry.path, "rb") as f:
+                values[entry.name] = f.read()
+
+    names = sorted(values)
+    encoded = [name.encode() for name in names]
+    offset = HEADER.size + sum(
+        NAME_LENGTH.size + len(name) + SPAN.size for name in encoded
+    )
+
+    index = bytearray(HEADER.pack(MAGIC, len(names)))
+    for name, raw_name in zip(names, encoded):
+        length = len(values[name])
+        index += NAME_LENGTH.pack(len(raw_name)) + raw_name + SPAN.pack(offset, length)
+        offset += length
+
+    fd, temp = tempfile.mkstemp(dir=output.parent, prefix=f".{output.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(index)
+            for name in names:
+                f.write(values[name])
+        os.replace(temp, output)
+    except BaseException:
+        os.unlink(temp)
+        raise
+
+    return len(names)
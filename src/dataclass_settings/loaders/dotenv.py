@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass
+from pathlib import PurePath
+from typing import Any, Dict, Sequence
+
+from dataclass_settings.context import Context
+from dataclass_settings.loader import (
+    CacheState,
+    FileCache,
+    Loader,
+    PathLike,
+    coerce_pathlike_sequence,
+    stat_key,
+)
+
+DEFAULT_FILE = PurePath(".env")
+
+ESCAPES = {"n": "\n", "r": "\r", "t": "\t", '"': '"', "\\": "\\", "$": "$"}
+ESCAPE_PATTERN = re.compile(r"\\(.)")
+
+
+@dataclass
+class DotEnvState(CacheState):
+    """Caches the merged contents of `files`. Safe to share between threads."""
+
+    files: Sequence[PurePath] = (DEFAULT_FILE,)
+
+
+@dataclass(init=False)
+class DotEnv(Loader):
+    """Load values from `.env` files, without sourcing them into the environment.
+
+    Names are resolved like `Env` (through `Context.get_name`, and upper-cased).
+    When multiple files are given, later files take precedence over earlier ones.
+    Files which don't exist are skipped.
+    """
+
+    env_vars: tuple[str, ...]
+
+    def __init__(self, *env_vars: str):
+        self.env_vars = env_vars
+
+    def load(self, context: Context, state: DotEnvState) -> Any:
+        env, cached = state.get_or_load(None, lambda: read_files(state.files))
+        context.record_cache_lookup(self, cached)
+
+        for name in self.get_names(context):
+            final_env_var = name.upper()
+
+            value = env.get(final_env_var)
+            context.record_loaded_value(self, final_env_var, value)
+
+            if value is not None:
+                return value
+
+        return None
+
+    def describe(self, context: Context, state: DotEnvState) -> Sequence[str]:
+        files = ", ".join(str(file) for file in state.files)
+        return [f"{name.upper()} ({files})" for name in self.get_names(context)]
+
+    def get_names(self, context: Context) -> list[str]:
+        field_name = context.name
+        if not self.env_vars and not context.infer_names:
+            field = ".".join([*context.path, field_name])
+            raise ValueError(
+                f"DotEnv instance for `{field}` supplies no `env_var` and `infer_names` is enabled"
+            )
+
+        env_vars = [field_name] if context.infer_names else self.env_vars
+        return [context.get_name(env_var) for env_var in env_vars]
+
+    @classmethod
+    def load_with(
+        cls, *, files: PathLike | Sequence[PathLike] | None = None
+    ) -> DotEnvState:
+        return DotEnvState(cls, files=coerce_pathlike_sequence(files, DEFAULT_FILE))
+
+
+def read_files(files: Sequence[PurePath]) -> dict[str, str]:
+    if len(files) == 1:
+        # The (shared, and never mutated) cached result can be used directly.
+        return read_dotenv(files[0])
+
+    result: dict[str, str] = {}
+    for file in files:
+        result.update(read_dotenv(file))
+    return result
+
+
+_parse_cache: FileCache[Dict[str, str]] = FileCache()
+
+
+def read_dotenv(file: PathLike) -> dict[str, str]:
+    """Parse a `.env` file, returning an empty dict if it doesn't exist.
+
+    Parsed results are cached process-wide (in a bounded `FileCache`) by the
+    file's `(st_dev, st_ino, st_mtime_ns, st_size)`, so an unchanged file is only
+    parsed once, however many states/loads read it.
+    """
+    path = PurePath(file)
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return {}
+
+    key = stat_key(stat)
+    cached = _parse_cache.get(path, key)
+    if cached is not None:
+        return cached
+
+    with open(path, encoding="utf-8") as f:
+        result = parse_dotenv(f.read(), str(path))
+
+    _parse_cache.set(path, key, result)
+    return result
+
+
+def parse_dotenv(text: str, source: str = "<string>") -> dict[str, str]:
+    r"""Parse the contents of a `.env` file, in a single pass.
+
+    - Blank lines and `#` comments are ignored, as is a leading `export`.
+    - Unquoted values are stripped, and end at an inline ` #` comment.
+    - Single quoted values are literal.
+    - Double quoted values support `\n`, `\r`, `\t`, `\"`, `\\` and `\$` escapes.
+    - Quoted values may span multiple lines.
+
+    Examples:
+        >>> parse_dotenv('export A=1\nB = "two\\nlines" # comment\nC=\'$x\'')
+        {'A': '1', 'B': 'two\nlines', 'C': '$x'}
+    """
+    result: dict[str, str] = {}
+
+    pos = 0
+    end = len(text)
+    lineno = 1
+    while pos < end:
+        line_end = text.find("\n", pos)
+        if line_end == -1:
+            line_end = end
+
+        line = text[pos:line_end].lstrip()
+        if not line or line[0] == "#":
+            pos = line_end + 1
+            lineno += 1
+            continue
+
+        if line.startswith("export ") or line.startswith("export\t"):
+            line = line[7:].lstrip()
+
+        key, eq, value = line.partition("=")
+        key = key.strip()
+        if not eq or not key:
+            raise ValueError(f"{source}:{lineno}: Expected `KEY=VALUE`, got {line!r}")
+
+        value = value.lstrip()
+        quote = value[:1]
+        if quote == '"' or quote == "'":
+            start = line_end - len(value) + 1
+            close = find_closing_quote(text, start, quote)
+            if close == -1:
+                raise ValueError(f"{source}:{lineno}: Unterminated {quote} quote")
+
+            value = text[start:close]
+            lineno += value.count("\n")
+            if quote == '"' and "\\" in value:
+                value = ESCAPE_PATTERN.sub(unescape, value)
+
+            line_end = text.find("\n", close)
+            if line_end == -1:
+                line_end = end
+        else:
+            comment = value.find(" #")
+            if comment != -1:
+                value = value[:comment]
+            value = value.strip()
+
+        result[key] = value
+        pos = line_end + 1
+        lineno += 1
+
+    return result
+
+
+def find_closing_quote(text: str, start: int, quote: str) -> int:
+    close = text.find(quote, start)
+    if quote == "'":
+        return close
+
+    while close != -1:
+        # A quote is escaped if preceded by an odd number of backslashes.
+        backslashes = 0
+        while text[close - 1 - backslashes] == "\\":
+            backslashes += 1
+
+        if backslashes % 2 == 0:
+            return close
+        close = text.find(quote, close + 1)
+    return close
+
+
+def unescape(match: re.Match) -> str:
+    char = match.group(1)
+    return ESCAPES.get(char, match.group(0))
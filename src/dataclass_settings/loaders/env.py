@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
-from typing import Any, MutableMapping, cast
+from typing import Any, MutableMapping, Sequence, cast
 
 from dataclass_settings.context import Context
 from dataclass_settings.loader import DictState, Loader
@@ -12,22 +12,15 @@ EnvLike = MutableMapping[str, str]
 
 @dataclass(init=False)
 class Env(Loader):
+    blocking = False
+
     env_vars: tuple[str, ...]
 
     def __init__(self, *env_vars: str):
         self.env_vars = env_vars
 
     def load(self, context: Context, state: DictState) -> Any:
-        field_name = context.name
-        if not self.env_vars and not context.infer_names:
-            field = ".".join([*context.path, field_name])
-            raise ValueError(
-                f"Env instance for `{field}` supplies no `env_var` and `infer_names` is enabled"
-            )
-
-        env_vars = [field_name] if context.infer_names else self.env_vars
-        for env_var in env_vars:
-            name = context.get_name(env_var)
+        for name in self.get_names(context):
             final_env_var = name.upper()
 
             value = state.value.get(final_env_var)
@@ -38,6 +31,20 @@ class Env(Loader):
 
         return None
 
+    def describe(self, context: Context, state: DictState) -> Sequence[str]:
+        return [name.upper() for name in self.get_names(context)]
+
+    def get_names(self, context: Context) -> list[str]:
+        field_name = context.name
+        if not self.env_vars and not context.infer_names:
+            field = ".".join([*context.path, field_name])
+            raise ValueError(
+                f"Env instance for `{field}` supplies no `env_var` and `infer_names` is enabled"
+            )
+
+        env_vars = [field_name] if context.infer_names else self.env_vars
+        return [context.get_name(env_var) for env_var in env_vars]
+
     @classmethod
     def load_with(cls, *, env: EnvLike | None = None) -> DictState:
         if env is None:
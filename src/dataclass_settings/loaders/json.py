@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import functools
+from dataclasses import dataclass, field
+from pathlib import Path, PurePath
+from typing import Any, Dict, Sequence
+
+from dataclass_settings import parsers
+from dataclass_settings.context import Context
+from dataclass_settings.loader import CacheState, Loader
+from dataclass_settings.parsers import Parser
+
+
+@dataclass
+class JsonState(CacheState):
+    """Caches decoded documents (and subtrees) by file. Safe to share between threads."""
+
+    file: str | PurePath | None = None
+    parser: Parser | None = field(
+        default_factory=functools.partial(parsers.get_parser, "json")
+    )
+
+
+@dataclass
+class Json(Loader[JsonState]):
+    """Load a value from a JSON file, by its `.` delimited `key`.
+
+    With the `msgspec` parser backend (the default, when it's installed), only the
+    top level of the document is parsed up front, and each top-level value is
+    only decoded once a `key` beneath it is actually looked up. Otherwise, the
+    whole document is decoded (with `orjson` if it's installed, else `json`).
+    """
+
+    key: str | None = None
+    file: str | PurePath | None = None
+
+    def load(self, context: Context, state: JsonState) -> Any:
+        key = self.get_key(context)
+        file = self.get_file(state)
+
+        document, cached = state.get_or_load(
+            file, functools.partial(read_json, file, state.parser)
+        )
+        context.record_cache_lookup(self, cached)
+
+        head, *rest = key.split(".")
+        if head not in document:
+            context.record_loaded_value(self, key, None)
+            return None
+
+        file_context, _ = state.get_or_load(
+            (file, head),
+            functools.partial(decode_subtree, document[head], state.parser),
+        )
+        for segment in rest:
+            try:
+                file_context = file_context[segment]
+            except (KeyError, TypeError, IndexError):
+                context.record_loaded_value(self, key, None)
+                return None
+
+        context.record_loaded_value(self, key, file_context)
+        return file_context
+
+    def describe(self, context: Context, state: JsonState) -> Sequence[str]:
+        return [f"{self.get_file(state)}:{self.get_key(context)}"]
+
+    def get_key(self, context: Context) -> str:
+        field_name = context.name
+        if not self.key and not context.infer_names:
+            field = ".".join([*context.path, field_name])
+            raise ValueError(
+                f"Json instance for `{field}` supplies no `key` and `infer_names` is enabled"
+            )
+
+        return self.key or field_name
+
+    def get_file(self, state: JsonState) -> Path:
+        file = self.file or state.file
+        if file is None:
+            raise ValueError("Json loader requires a `file` argument")
+
+        return Path(file)
+
+    @classmethod
+    def load_with(
+        cls, file: str | PurePath | None = None, *, parser: str | None = None
+    ) -> JsonState:
+        """Configure the `Json` loader.
+
+        Arguments:
+            file: The file to read.
+            parser: The name of the `parsers` backend to parse files with, i.e.
+                "msgspec", "orjson" or "json". By default, the most preferred
+                installed backend is used.
+        """
+        return JsonState(cls, file=file, parser=parsers.get_parser("json", parser))
+
+
+def read_json(file: Path, parser: Parser | None) -> dict[str, Any]:
+    """Read the top level of a JSON object document.
+
+    With `msgspec`, values are left as undecoded `msgspec.Raw` slices of the file.
+    """
+    assert parser is not None
+    document = parser.loads(file.read_bytes())
+    if not isinstance(document, dict):
+        raise ValueError(f"Expected `{file}` to contain a JSON object")
+    return document
+
+
+def decode_subtree(value: Any, parser: Parser | None) -> Any:
+    if parser is None or parser.decode is None:
+        return value
+    return parser.decode(value)
+
+
+def _msgspec() -> Parser:
+    import msgspec
+
+    top_level = msgspec.json.Decoder(Dict[str, msgspec.Raw])
+    decoder = msgspec.json.Decoder()
+
+    def loads(content: bytes) -> dict[str, Any] | None:
+        try:
+            return top_level.decode(content)
+        except msgspec.ValidationError:
+            return None
+
+    return Parser("json", "msgspec", loads, decoder.decode)
+
+
+def _orjson() -> Parser:
+    import orjson
+
+    return Parser("json", "orjson", orjson.loads)
+
+
+def _json() -> Parser:
+    import json
+
+    return Parser("json", "json", json.loads)
+
+
+parsers.register("json", "msgspec", _msgspec)
+parsers.register("json", "orjson", _orjson)
+parsers.register("json", "json", _json)
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import csv
+import json
+from dataclasses import dataclass
+from pathlib import PurePath
+from typing import Any, Iterator, Mapping, Sequence
+
+from dataclass_settings.context import Context
+from dataclass_settings.loader import DictState, Loader
+
+
+@dataclass(init=False)
+class Row(Loader):
+    """Load a value from the current row of a tabular source (e.g. CSV or JSONL).
+
+    Names are resolved like `Env` (through `Context.get_name`, and `infer_names`),
+    but are matched against the row's column names/keys exactly, without
+    upper-casing.
+    """
+
+    blocking = False
+
+    columns: tuple[str, ...]
+
+    def __init__(self, *columns: str):
+        self.columns = columns
+
+    def load(self, context: Context, state: DictState) -> Any:
+        for name in self.get_names(context):
+            value = state.value.get(name)
+            context.record_loaded_value(self, name, value)
+
+            if value is not None:
+                return value
+
+        return None
+
+    def describe(self, context: Context, state: DictState) -> Sequence[str]:
+        return self.get_names(context)
+
+    def get_names(self, context: Context) -> list[str]:
+        field_name = context.name
+        if not self.columns and not context.infer_names:
+            field = ".".join([*context.path, field_name])
+            raise ValueError(
+                f"Row instance for `{field}` supplies no `column` and `infer_names` is enabled"
+            )
+
+        columns = [field_name] if context.infer_names else self.columns
+        return [context.get_name(column) for column in columns]
+
+    @classmethod
+    def load_with(cls, *, row: Mapping[str, Any] | None = None) -> DictState:
+        return DictState(cls, dict(row) if row is not None else {})
+
+
+def read_jsonl(
+    file: str | PurePath, encoding: str = "utf-8"
+) -> Iterator[dict | ValueError]:
+    """Incrementally read a JSON-lines file, yielding one object per (non-blank) line.
+
+    A malformed line doesn't end the iteration; instead, the `ValueError`
+    describing it is yielded in its place (which `iter_load_settings` reports as
+    that row's error).
+    """
+    with open(file, encoding=encoding) as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                yield ValueError(
+                    f"Line {line_number} of `{file}` is not valid JSON: {e}"
+                )
+
+
+def read_csv(
+    file: str | PurePath, encoding: str = "utf-8", **reader_options: Any
+) -> Iterator[dict | ValueError]:
+    """Incrementally read a CSV file with a header row, yielding one dict per row.
+
+    Empty cells are omitted, so that the field's default (if any) applies. Like
+    `read_jsonl`, a malformed row is yielded as the `ValueError` describing it.
+    """
+    with open(file, encoding=encoding, newline="") as f:
+        reader = csv.DictReader(f, **reader_options)
+        while True:
+            try:
+                row = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as e:
+                yield ValueError(f"Malformed row in `{file}`: {e}")
+                continue
+
+            yield {key: value for key, value in row.items() if value != ""}
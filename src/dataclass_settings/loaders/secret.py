@@ -1,42 +1,317 @@
 from __future__ import annotations
 
+import functools
+import io
+import mmap
 import os
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import PurePath
-from typing import Any, Sequence
+from typing import Any, Dict, FrozenSet, Mapping, Sequence
 
 from typing_extensions import Self
 
 from dataclass_settings.context import Context
 from dataclass_settings.loader import (
-    DictState,
+    CacheState,
     Loader,
     PathLike,
+    StatKey,
     coerce_pathlike_sequence,
+    stat_key,
 )
 
 DEFAULT_PATH = PurePath("/run/secrets")
+DEFAULT_CACHE_BYTES = 1024 * 1024
+
+# The symlink (to the current generation's directory) which Kubernetes swaps,
+# atomically, when a projected volume's contents are updated.
+DATA_LINK = "..data"
+SNAPSHOT_ATTEMPTS = 5
+
+NEWLINES = b"\r\n"
+# Binary secrets at least this large are memory-mapped, rather than read.
+MMAP_THRESHOLD = 1024 * 1024
+
+
+class SecretCache:
+    """A byte-size bounded LRU cache of secret file contents, shared between loads.
+
+    Entries are keyed by the file's `(st_dev, st_ino, st_mtime_ns, st_size)`, so
+    each lookup costs an `open` and `fstat`, but a rotated secret (which changes
+    at least one of those) is re-read, while an unchanged one is not.
+
+    Contents are held in `bytearray` buffers, which are overwritten with zeros
+    (best-effort, as decoded `str` copies handed out can't be) when they're
+    evicted, replaced by a newer version of the same file, or `clear`-ed.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: OrderedDict[StatKey, bytearray] = OrderedDict()
+        self._paths: dict[PurePath, StatKey] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __reduce__(self):
+        # Contents are never pickled (e.g. to a process pool), only the config.
+        return (self.__class__, (self.max_bytes,))
+
+    def get(
+        self,
+        path: PurePath,
+        *,
+        binary: bool = False,
+        strip: bool = False,
+        max_bytes: int | None = None,
+    ) -> tuple[str | bytes | None, bool]:
+        """Return the contents of `path` (`None` if it doesn't exist), and whether they were cached.
+
+        See `Secret` for `binary` and `strip`, and `Secret.load_with` for `max_bytes`.
+        """
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
+            return None, False
+
+        with f:
+            # The open file is `stat`-ed, so that its key is always that of the
+            # contents read, even should the path be replaced meanwhile.
+            stat = os.fstat(f.fileno())
+            check_size(path, stat.st_size, max_bytes)
+
+            key = stat_key(stat)
+            with self._lock:
+                buffer = self._entries.get(key)
+                if buffer is not None:
+                    self._entries.move_to_end(key)
+                    return decode(buffer, binary=binary, strip=strip), True
+
+            buffer = read_buffer(f, stat.st_size)
+
+        value = decode(buffer, binary=binary, strip=strip)
+        with self._lock:
+            stale = self._paths.get(path)
+            if stale is not None and stale != key:
+                # The previous version of a rotated file.
+                self._discard(stale)
+                del self._paths[path]
+
+            if key in self._entries:
+                # Cached meanwhile, by another thread which missed the same key.
+                wipe(buffer)
+                self._paths[path] = key
+            elif len(buffer) > self.max_bytes:
+                wipe(buffer)
+            else:
+                self._entries[key] = buffer
+                self._paths[path] = key
+                self.size += len(buffer)
+                while self.size > self.max_bytes:
+                    self._discard(next(iter(self._entries)))
+
+        return value, False
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._entries):
+                self._discard(key)
+            self._paths.clear()
+
+    def _discard(self, key: StatKey):
+        buffer = self._entries.pop(key, None)
+        if buffer is not None:
+            self.size -= len(buffer)
+            wipe(buffer)
+
+
+def read_buffer(file: io.BufferedReader, size: int) -> bytearray:
+    """Read (up to) `size` bytes of `file` into a new buffer."""
+    buffer = bytearray(size)
+    del buffer[file.readinto(buffer) :]
+    return buffer
+
+
+def wipe(buffer: bytearray):
+    buffer[:] = bytes(len(buffer))
+
+
+#: The process-wide cache used by `Secret.load_with(cache=True)`.
+shared_cache = SecretCache()
 
 
 @dataclass
-class SecretState(DictState):
+class SecretState(CacheState):
+    """Caches secret file contents by path. Safe to share between threads.
+
+    When `cache` is set, that (shared) `SecretCache` is used instead. When
+    `atomic` is set, each directory is read as a single `Snapshot`, cached by
+    its generation.
+    """
+
     dir: Sequence[PurePath] = (DEFAULT_PATH,)
+    cache: SecretCache | None = None
+    atomic: bool = False
+    max_bytes: int | None = None
+
+    #: The snapshot of each directory, pinned (by `Secret.prepare`) for a single load.
+    snapshots: Mapping[PurePath, Snapshot] | None = field(
+        default=None, repr=False, compare=False
+    )
+
+    def snapshot(self, dir: PurePath) -> tuple[Snapshot, bool]:
+        """Return the snapshot of the generation `dir/..data` resolves to, and whether it was cached.
+
+        Unless pinned, `..data` is resolved on every call, so that a rotation is
+        seen by the next load. Only the latest generation of each directory is
+        kept cached.
+        """
+        if self.snapshots is not None:
+            snapshot = self.snapshots.get(dir)
+            if snapshot is not None:
+                return snapshot, True
+
+        try:
+            generation = os.readlink(os.path.join(dir, DATA_LINK))
+        except OSError:
+            # Either missing, or not a symlink: not a projected volume.
+            return Snapshot(None, {}), False
+
+        return self.get_or_load_latest(
+            (DATA_LINK, dir),
+            generation,
+            functools.partial(read_snapshot, dir, self.max_bytes, generation),
+        )
+
+
+@dataclass
+class Snapshot:
+    """The contents of one generation of a Kubernetes projected volume.
+
+    `generation` is `None` when the directory isn't such a volume (i.e. it has no
+    `..data` symlink), in which case its files are read individually.
+    """
+
+    generation: str | None
+    values: Dict[str, bytes]
 
 
 @dataclass(init=False)
 class Secret(Loader):
+    """Load a value from a secret file.
+
+    Arguments:
+        names: The file names to search for, in order.
+        dir: The directory (or directories) to search, overriding the state's.
+        binary: Return the contents as `bytes` (rather than decoding them), or
+            for files of at least `MMAP_THRESHOLD` bytes, as a `memoryview` of
+            the memory-mapped file.
+        strip: Strip trailing newlines. The file's tail is inspected first, so
+            that only the stripped contents are ever read.
+    """
+
+    sensitive = True
+
     names: tuple[str, ...] = ()
     dir: Sequence[PurePath] | None = None
+    binary: bool = False
+    strip: bool = False
 
-    def __init__(self, *names: str, dir: Sequence[PathLike] | None = None):
+    def __init__(
+        self,
+        *names: str,
+        dir: PathLike | Sequence[PathLike] | None = None,
+        binary: bool = False,
+        strip: bool = False,
+    ):
         self.names = names
+        self.binary = binary
+        self.strip = strip
 
         if dir is None:
             self.dir = None
         else:
             self.dir = coerce_pathlike_sequence(dir, DEFAULT_PATH)
 
+    @classmethod
+    def compile(cls, plan: Sequence[tuple[Loader, Context]]) -> FrozenSet[Any]:
+        """Return the distinct `dir` of `plan`'s loaders (`None` meaning the state's)."""
+        return frozenset(
+            None if loader.dir is None else tuple(loader.dir)
+            for loader, _ in plan
+            if isinstance(loader, Secret)
+        )
+
+    @classmethod
+    def prepare(cls, state: SecretState, compiled: FrozenSet[Any]):
+        """Resolve (and pin) each atomic directory's generation once for the load."""
+        if not state.atomic:
+            return None
+
+        dirs = {dir for dirs in compiled for dir in (dirs or state.dir)}
+        return state.view(snapshots={dir: state.snapshot(dir)[0] for dir in dirs})
+
     def load(self, context: Context, state: SecretState) -> Any:
+        cache = state.cache
+        for dir, name in self.get_locations(context, state):
+            path = dir / name
+
+            snapshot = None
+            if state.atomic:
+                snapshot, cached = state.snapshot(dir)
+
+            value: str | bytes | memoryview | None
+            if snapshot is not None and snapshot.generation is not None:
+                data = snapshot.values.get(name)
+                value = (
+                    None
+                    if data is None
+                    else decode(data, binary=self.binary, strip=self.strip)
+                )
+            elif cache is not None:
+                value, cached = cache.get(
+                    path,
+                    binary=self.binary,
+                    strip=self.strip,
+                    max_bytes=state.max_bytes,
+                )
+            elif self.binary or self.strip or state.max_bytes is not None:
+                value, cached = state.get_or_load(
+                    (path, self.binary, self.strip),
+                    functools.partial(
+                        read_bounded,
+                        path,
+                        binary=self.binary,
+                        strip=self.strip,
+                        max_bytes=state.max_bytes,
+                    ),
+                )
+            else:
+                value, cached = state.get_or_load(
+                    path, functools.partial(read_file, path)
+                )
+
+            context.record_loaded_value(self, path, value)
+
+            if value is not None:
+                context.record_cache_lookup(self, cached)
+                return value
+
+        return None
+
+    def describe(self, context: Context, state: SecretState) -> Sequence[str]:
+        return [str(path) for path in self.get_paths(context, state)]
+
+    def get_paths(self, context: Context, state: SecretState) -> list[PurePath]:
+        return [dir / name for dir, name in self.get_locations(context, state)]
+
+    def get_locations(
+        self, context: Context, state: SecretState
+    ) -> list[tuple[PurePath, str]]:
         field_name = context.name
 
         names = self.names
@@ -50,30 +325,226 @@ class Secret(Loader):
             )
 
         dirs = self.dir or state.dir
+        return [(dir, context.get_name(name)) for name in names for dir in dirs]
+
+    def with_name(self, *names: str) -> Self:
+        return self.__class__(
+            *names, dir=self.dir, binary=self.binary, strip=self.strip
+        )
+
+    def with_dir(self, *dir: str) -> Self:
+        return self.__class__(
+            *self.names, dir=dir, binary=self.binary, strip=self.strip
+        )
+
+    @classmethod
+    def load_with(
+        cls,
+        *,
+        dir: PathLike | Sequence[PathLike] | None = None,
+        cache: bool | SecretCache = False,
+        atomic: bool = False,
+        max_bytes: int | None = None,
+    ) -> SecretState:
+        """Configure the `Secret` loader.
 
-        for name in names:
-            final_name = context.get_name(name)
+        Arguments:
+            dir: The directory (or directories) to search for secrets.
+            cache: By default, file contents are cached for the lifetime of the
+                returned state. When `True`, the process-wide `shared_cache` is
+                used instead, or a given `SecretCache` instance.
+            atomic: Read each directory which is a Kubernetes projected volume
+                (i.e. contains a `..data` symlink) as a consistent snapshot of
+                a single generation, so that a load racing a rotation can't mix
+                old and new values. Can't be combined with `cache`.
+            max_bytes: The largest secret file which may be read (checked with
+                `fstat`, before reading it), guarding against e.g. a large file
+                mounted by mistake. Larger files raise a `ValueError`.
+        """
+        if atomic and cache is not False:
+            raise ValueError("Secret `atomic` and `cache` options can't be combined")
 
-            for dir in dirs:
-                path = dir / final_name
+        if cache is True:
+            cache = shared_cache
 
-                if path in state.value:
-                    return state.value[path]
+        return SecretState(
+            cls,
+            dir=coerce_pathlike_sequence(dir, DEFAULT_PATH),
+            cache=None if cache is False else cache,
+            atomic=atomic,
+            max_bytes=max_bytes,
+        )
 
-                if os.path.exists(path):
-                    with open(path) as f:
-                        value = f.read()
-                        state.value[path] = value
-                        return value
 
+def read_file(path: PurePath) -> str | None:
+    if not os.path.exists(path):
         return None
 
-    def with_name(self, *names: str) -> Self:
-        return self.__class__(*names, dir=self.dir)
+    # Decoded as `decode` does, whether or not a cache is used.
+    with open(path, encoding="utf-8") as f:
+        return f.read()
 
-    def with_dir(self, *dir: str) -> Self:
-        return self.__class__(*self.names, dir=dir)
 
-    @classmethod
-    def load_with(cls, *, dir: Sequence[PathLike] | None = None) -> SecretState:
-        return SecretState(cls, dir=coerce_pathlike_sequence(dir, DEFAULT_PATH))
+def read_bounded(
+    path: PurePath, *, binary: bool, strip: bool, max_bytes: int | None
+) -> str | bytes | memoryview | None:
+    """Read `path` (returning `None` if it doesn't exist) with a single, exactly sized read."""
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    except FileNotFoundError:
+        return None
+
+    try:
+        size = os.fstat(fd).st_size
+        check_size(path, size, max_bytes)
+
+        end = size
+        while strip and end:
+            # Inspect the tail, so the trailing newlines are never read (or copied).
+            chunk = pread(fd, min(end, 64), max(end - 64, 0))
+            stripped = len(chunk) - len(chunk.rstrip(NEWLINES))
+            end -= stripped
+            if stripped < len(chunk):
+                break
+
+        if binary and end >= MMAP_THRESHOLD:
+            return memoryview(mmap.mmap(fd, 0, access=mmap.ACCESS_READ))[:end]
+
+        data = read_exact(fd, end)
+    finally:
+        os.close(fd)
+
+    return data if binary else decode_text(data)
+
+
+def read_exact(fd: int, size: int) -> bytes:
+    data = os.read(fd, size)
+    if len(data) == size:
+        return data
+
+    # A short read; the file was truncated, or `size` exceeds a single read.
+    chunks = [data]
+    remaining = size - len(data)
+    while remaining and data:
+        data = os.read(fd, remaining)
+        chunks.append(data)
+        remaining -= len(data)
+    return b"".join(chunks)
+
+
+def pread(fd: int, size: int, offset: int) -> bytes:
+    if hasattr(os, "pread"):
+        return os.pread(fd, size, offset)
+
+    os.lseek(fd, offset, os.SEEK_SET)  # pragma: no cover
+    try:  # pragma: no cover
+        return os.read(fd, size)
+    finally:  # pragma: no cover
+        os.lseek(fd, 0, os.SEEK_SET)
+
+
+def check_size(path: PurePath | str, size: int, max_bytes: int | None):
+    if max_bytes is not None and size > max_bytes:
+        raise ValueError(
+            f"Secret `{path}` is {size} bytes, exceeding `max_bytes` ({max_bytes})"
+        )
+
+
+def decode(data: bytes | bytearray, *, binary: bool, strip: bool) -> str | bytes:
+    view = memoryview(data)
+    if strip:
+        end = len(view)
+        while end and view[end - 1] in NEWLINES:
+            end -= 1
+        view = view[:end]
+
+    if binary:
+        return bytes(view)
+    return decode_text(view)
+
+
+def decode_text(data: bytes | memoryview) -> str:
+    """Decode `data` as UTF-8 with universal newlines, as `open` (in text mode) does."""
+    text = str(data, "utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def read_snapshot(
+    dir: PurePath, max_bytes: int | None = None, generation: str | None = None
+) -> Snapshot:
+    """Read every file of the current generation of the projected volume `dir`.
+
+    `..data` is resolved once (unless its `generation` is given), and files are
+    read relative to the resolved generation's directory (through `dir_fd`,
+    where supported). Should `..data` be swapped while reading (or the
+    generation be removed out from under it), the new generation is read instead.
+    """
+    for _ in range(SNAPSHOT_ATTEMPTS):
+        if generation is None:
+            try:
+                generation = os.readlink(os.path.join(dir, DATA_LINK))
+            except OSError:
+                # Either missing, or not a symlink: not a projected volume.
+                return Snapshot(None, {})
+
+        try:
+            values = read_generation(os.path.join(dir, generation), max_bytes)
+        except FileNotFoundError:
+            generation = None
+            continue
+
+        if os.readlink(os.path.join(dir, DATA_LINK)) == generation:
+            return Snapshot(generation, values)
+        generation = None
+
+    raise RuntimeError(
+        f"`{dir}` was rotated {SNAPSHOT_ATTEMPTS} times while it was being read"
+    )
+
+
+def read_generation(path: str, max_bytes: int | None = None) -> dict[str, bytes]:
+    result: dict[str, bytes] = {}
+    if os.open not in os.supports_dir_fd:  # pragma: no cover
+        for root, _, files in os.walk(path):
+            prefix = os.path.relpath(root, path)
+            for name in files:
+                key = name if prefix == "." else f"{prefix}/{name}"
+                file = os.path.join(root, name)
+                check_size(file, os.stat(file).st_size, max_bytes)
+                with open(file, "rb") as f:
+                    result[key] = f.read()
+        return result
+
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    try:
+        read_directory_fd(fd, "", result, max_bytes)
+    finally:
+        os.close(fd)
+    return result
+
+
+def read_directory_fd(
+    dir_fd: int, prefix: str, result: dict[str, bytes], max_bytes: int | None
+):
+    with os.scandir(dir_fd) as it:
+        entries = list(it)
+
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            fd = os.open(
+                entry.name, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0), dir_fd=dir_fd
+            )
+            try:
+                read_directory_fd(fd, f"{prefix}{entry.name}/", result, max_bytes)
+            finally:
+                os.close(fd)
+        elif entry.is_file():
+            fd = os.open(entry.name, os.O_RDONLY, dir_fd=dir_fd)
+            try:
+                size = os.fstat(fd).st_size
+                check_size(prefix + entry.name, size, max_bytes)
+                result[prefix + entry.name] = read_exact(fd, size)
+            finally:
+                os.close(fd)
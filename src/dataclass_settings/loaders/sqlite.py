@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path, PurePath
+from typing import Any, Collection, Dict, FrozenSet, Sequence
+
+from dataclass_settings.context import Context
+from dataclass_settings.loader import Loader, LoaderState, PathLike
+
+DEFAULT_TABLE = "settings"
+
+# Stays under SQLite's (pre-3.32) default limit on the number of bound parameters.
+MAX_PARAMETERS = 999
+
+
+@dataclass(frozen=True)
+class SqliteSnapshot:
+    """The values of `names` which were found, as of the database's `version`."""
+
+    version: int | None
+    names: FrozenSet[str]
+    rows: Dict[str, Any]
+
+
+@dataclass
+class SqliteState(LoaderState):
+    """Holds a single (read-only) connection, and the latest fetched `SqliteSnapshot`.
+
+    Safe to share between threads.
+    """
+
+    file: PurePath | None = None
+    table: str = DEFAULT_TABLE
+    key_column: str = "key"
+    value_column: str = "value"
+    immutable: bool = False
+
+    snapshot: SqliteSnapshot | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _connection: sqlite3.Connection | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_connection"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def fetch(self, names: Collection[str]) -> tuple[SqliteSnapshot, bool]:
+        """Return a snapshot including `names`, and whether it was cached.
+
+        While the database is unchanged (according to `PRAGMA data_version`),
+        the previous snapshot is reused, and extended with any of `names` it's
+        missing (e.g. those of another settings class sharing the state). Those
+        (or, once the database changes, all of `names`) are fetched with a
+        single batched query.
+        """
+        with self._lock:
+            connection = self._connection
+            if connection is None:
+                connection = self._connection = self.connect()
+
+            snapshot = self.snapshot
+            if connection is None:
+                version = None
+            else:
+                (version,) = connection.execute("PRAGMA data_version").fetchone()
+
+            if snapshot is None or snapshot.version != version:
+                snapshot = SqliteSnapshot(version, frozenset(), {})
+
+            missing = [name for name in names if name not in snapshot.names]
+            if not missing and snapshot is self.snapshot:
+                return snapshot, True
+
+            rows: dict[str, Any] = {}
+            if connection is not None and missing:
+                rows = query(connection, self.select(), missing)
+
+            snapshot = self.snapshot = SqliteSnapshot(
+                version, snapshot.names.union(missing), {**snapshot.rows, **rows}
+            )
+            return snapshot, False
+
+    def connect(self) -> sqlite3.Connection | None:
+        if self.file is None:
+            raise ValueError("Sqlite loader requires a `file` argument")
+
+        if not os.path.exists(self.file):
+            return None
+
+        uri = Path(self.file).resolve().as_uri() + "?mode=ro"
+        if self.immutable:
+            uri += "&immutable=1"
+        return sqlite3.connect(uri, uri=True, check_same_thread=False)
+
+    def select(self) -> str:
+        key = quote_identifier(self.key_column)
+        return (
+            f"SELECT {key}, {quote_identifier(self.value_column)}"  # noqa: S608
+            f" FROM {quote_identifier(self.table)} WHERE {key} IN "
+        )
+
+
+@dataclass(init=False)
+class Sqlite(Loader[SqliteState]):
+    """Load values from a `key`/`value` table of a SQLite database.
+
+    Names are resolved like `Env` (through `Context.get_name`), but aren't
+    upper-cased. Every name a load may need (as compiled from the plan of the
+    settings class) is fetched with a single batched query, before any field is
+    loaded; and that result is reused across loads for as long as the database
+    is unchanged. A database which doesn't exist is treated as empty.
+    """
+
+    keys: tuple[str, ...]
+
+    def __init__(self, *keys: str):
+        self.keys = keys
+
+    @classmethod
+    def compile(cls, plan: Sequence[tuple[Loader, Context]]) -> FrozenSet[str]:
+        return frozenset(
+            name
+            for loader, context in plan
+            if isinstance(loader, Sqlite)
+            for name in loader.get_names(context)
+        )
+
+    @classmethod
+    def prepare(cls, state: SqliteState, compiled: FrozenSet[str]):
+        state.fetch(compiled)
+
+    def load(self, context: Context, state: SqliteState) -> Any:
+        names = self.get_names(context)
+
+        snapshot = state.snapshot
+        if snapshot is not None and snapshot.names.issuperset(names):
+            cached = True
+        else:
+            # Not prepared (e.g. when called directly), so fetch just these names.
+            snapshot, cached = state.fetch(names)
+
+        context.record_cache_lookup(self, cached)
+
+        for name in names:
+            value = snapshot.rows.get(name)
+            context.record_loaded_value(self, name, value)
+
+            if value is not None:
+                return value
+
+        return None
+
+    def describe(self, context: Context, state: SqliteState) -> Sequence[str]:
+        return [
+            f"{state.file}:{state.table}[{name}]" for name in self.get_names(context)
+        ]
+
+    def get_names(self, context: Context) -> list[str]:
+        field_name = context.name
+        if not self.keys and not context.infer_names:
+            field = ".".join([*context.path, field_name])
+            raise ValueError(
+                f"Sqlite instance for `{field}` supplies no `key` and `infer_names` is enabled"
+            )
+
+        keys = [field_name] if context.infer_names else self.keys
+        return [context.get_name(key) for key in keys]
+
+    @classmethod
+    def load_with(
+        cls,
+        file: PathLike | None = None,
+        *,
+        table: str = DEFAULT_TABLE,
+        key_column: str = "key",
+        value_column: str = "value",
+        immutable: bool = False,
+    ) -> SqliteState:
+        """Configure the `Sqlite` loader.
+
+        Arguments:
+            file: The database file, which is opened read-only.
+            table: The table holding the settings.
+            key_column: The column holding each setting's name.
+            value_column: The column holding each setting's value.
+            immutable: Open the database with the `immutable` URI parameter,
+                skipping all locking and change detection. Only appropriate for
+                a database which can't change while it's open.
+        """
+        return SqliteState(
+            cls,
+            file=None if file is None else PurePath(file),
+            table=table,
+            key_column=key_column,
+            value_column=value_column,
+            immutable=immutable,
+        )
+
+
+def query(
+    connection: sqlite3.Connection, select: str, names: list[str]
+) -> dict[str, Any]:
+    rows: dict[str, Any] = {}
+    for start in range(0, len(names), MAX_PARAMETERS):
+        batch = names[start : start + MAX_PARAMETERS]
+        placeholders = ", ".join("?" * len(batch))
+        rows.update(connection.execute(f"{select}({placeholders})", batch))
+    return rows
+
+
+def quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
@@ -1,26 +1,150 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import fnmatch
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path, PurePath
-from typing import Any
+from typing import Any, Callable, Sequence, Tuple, Union
 
+from dataclass_settings import parsers
 from dataclass_settings.context import Context
-from dataclass_settings.loader import DictState, Loader
+from dataclass_settings.loader import CacheState, Loader, PathLike, StatKey, stat_key
+from dataclass_settings.parsers import Parser
+
+TomlFiles = Union[PathLike, Sequence[PathLike]]
+
+DEFAULT_PATTERN = "*.toml"
+MAX_PARSE_WORKERS = 8
+
+Listing = Tuple[Tuple[str, StatKey], ...]
+
+
+@dataclass
+class TomlState(CacheState):
+    """Caches parsed (and merged) documents by file. Safe to share between threads.
+
+    `file` may be a sequence of files, which are deep-merged in order (later
+    files overriding earlier ones) into a single view. Fragments in `directory`
+    matching `pattern` are merged (in lexical order) after any `file`, and only
+    re-read when its listing changes.
+    """
+
+    file: TomlFiles | None = None
+    directory: PurePath | None = None
+    pattern: str = DEFAULT_PATTERN
+    nested: bool = False
+    parser: Parser | None = field(
+        default_factory=functools.partial(parsers.get_parser, "toml")
+    )
+
+    #: The listing of `directory`, pinned (by `Toml.prepare`) for a single load.
+    listing: Listing | None = field(default=None, repr=False, compare=False)
+
+    def get_listing(self, directory: Path) -> Listing:
+        if self.listing is not None:
+            return self.listing
+        return list_directory(directory, self.pattern)
 
 
 @dataclass
-class TomlState(DictState):
-    file: str | PurePath | None = None
+class TomlDocument:
+    """A (possibly merged) document, along with the file which supplied each key.
+
+    Keys are looked up through a flat `{"a.b.c": value}` index of the document,
+    which is built lazily, one top-level table at a time.
+    """
+
+    value: dict[str, Any]
+    sources: dict[tuple[str, ...], Path] = field(default_factory=dict)
+    index: dict[str, dict[str, Any]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    def get(self, key: str) -> Any:
+        """Return the value at the `.` delimited `key`, or `None` if there isn't one."""
+        head = key.partition(".")[0]
+        flat = self.index.get(head)
+        if flat is None:
+            flat = {}
+            if head in self.value:
+                flatten(flat, head, self.value[head])
+            flat = self.index.setdefault(head, flat)
+        return flat.get(key)
+
+    def source(self, segments: Sequence[str]) -> Path | None:
+        """Return the file which supplied the value at `segments` (or its closest ancestor)."""
+        for end in range(len(segments), 0, -1):
+            source = self.sources.get(tuple(segments[:end]))
+            if source is not None:
+                return source
+        return None
 
 
 @dataclass
 class Toml(Loader[TomlState]):
     key: str | None = None
-    file: str | PurePath | None = None
+    file: TomlFiles | None = None
 
     def load(self, context: Context, state: TomlState) -> Any:
-        import tomllib
+        key = self.get_key(context, state)
+        files = self.get_files(state)
+        directory = self.get_directory(state)
+
+        if directory is None:
+            document, cached = state.get_or_load(
+                (files, directory),
+                functools.partial(read_layered, state, files, directory, ()),
+            )
+        else:
+            listing = state.get_listing(directory)
+            document, cached = state.get_or_load_latest(
+                (files, directory),
+                listing,
+                functools.partial(read_layered, state, files, directory, listing),
+            )
+        context.record_cache_lookup(self, cached)
+
+        value = document.get(key)
+
+        if value is not None and document.sources:
+            context.record_loaded_value(self, (key, document), value)
+        else:
+            context.record_loaded_value(self, key, value)
+        return value
+
+    @classmethod
+    def compile(cls, plan: Sequence[tuple[Loader, Context]]) -> bool:
+        """Whether any of `plan`'s loaders read the state's `directory`."""
+        return any(isinstance(loader, Toml) and not loader.file for loader, _ in plan)
+
+    @classmethod
+    def prepare(cls, state: TomlState, compiled: bool) -> TomlState | None:
+        """List the state's `directory` once for the load (rather than per field)."""
+        if not compiled or state.directory is None:
+            return None
+
+        directory = Path(state.directory)
+        return state.view(listing=list_directory(directory, state.pattern))
 
+    def format_name(self, name: Any) -> str:
+        if isinstance(name, tuple):
+            # A hit in a layered document, recorded along with that document.
+            key, document = name
+            return f"{key} (from {document.source(key.split('.'))})"
+        return super().format_name(name)
+
+    def describe(self, context: Context, state: TomlState) -> Sequence[str]:
+        key = self.get_key(context, state)
+        sources = [str(file) for file in self.get_files(state)]
+
+        directory = self.get_directory(state)
+        if directory is not None:
+            sources.append(str(directory / state.pattern))
+        return [f"{source}:{key}" for source in reversed(sources)]
+
+    def get_key(self, context: Context, state: TomlState) -> str:
         field_name = context.name
         if not self.key and not context.infer_names:
             field = ".".join([*context.path, field_name])
@@ -29,27 +153,204 @@ class Toml(Loader[TomlState]):
             )
 
         key = self.key or field_name
+        if state.nested and context.path:
+            # Keys of fields of nested classes are relative to their class' table.
+            return ".".join([*context.path, key])
+        return key
 
+    def get_files(self, state: TomlState) -> tuple[Path, ...]:
         file = self.file or state.file
-        if file is None:
+        if not file:
+            if self.get_directory(state) is not None:
+                return ()
             raise ValueError("Toml loader requires a `file` argument")
 
-        file = Path(file)
-        if file not in state.value:
-            file_content = file.read_text()
-            state.value[file] = tomllib.loads(file_content)
+        if isinstance(file, (str, PurePath)):
+            return (Path(file),)
+        return tuple(Path(f) for f in file)
+
+    def get_directory(self, state: TomlState) -> Path | None:
+        # A `file` given to the annotation itself overrides the state entirely.
+        if self.file or state.directory is None:
+            return None
+        return Path(state.directory)
 
-        file_context = state.value[file]
-        context.record_loaded_value(self, str(self.file), file_context)
+    @classmethod
+    def load_with(
+        cls,
+        file: TomlFiles | None = None,
+        *,
+        directory: PathLike | None = None,
+        pattern: str = DEFAULT_PATTERN,
+        nested: bool = False,
+        parser: str | None = None,
+    ) -> TomlState:
+        """Configure the `Toml` loader.
 
-        for segment in key.split("."):
-            try:
-                file_context = file_context[segment]
-            except KeyError:
-                return None
+        Arguments:
+            file: A file, or ordered sequence of files, to read.
+            directory: A "conf.d" style directory, whose fragments matching
+                `pattern` are merged in lexical order (after any `file`). A
+                directory which doesn't exist is treated as empty.
+            pattern: The glob pattern fragments in `directory` must match.
+            nested: Look up the keys of fields of nested classes relative to the
+                table named by their path. I.e. `key` (or, with `infer_names`,
+                the field name) of a field at `settings.db` becomes `db.<key>`.
+            parser: The name of the `parsers` backend to parse files with, e.g.
+                "tomllib" or "tomli". By default, the most preferred installed
+                backend is used.
+        """
+        return TomlState(
+            cls,
+            file=file,
+            directory=None if directory is None else PurePath(directory),
+            pattern=pattern,
+            nested=nested,
+            parser=parsers.get_parser("toml", parser),
+        )
 
-        return file_context
 
-    @classmethod
-    def load_with(cls, file: str | PurePath | None = None) -> TomlState:
-        return TomlState(cls, file=file)
+def _rtoml() -> Parser:
+    import rtoml
+
+    return Parser("toml", "rtoml", rtoml.loads)
+
+
+def _tomllib() -> Parser:
+    import tomllib
+
+    return Parser("toml", "tomllib", tomllib.loads)
+
+
+def _tomli() -> Parser:
+    import tomli
+
+    return Parser("toml", "tomli", tomli.loads)
+
+
+# In order of preference: compiled, then the stdlib, then its backport.
+parsers.register("toml", "rtoml", _rtoml)
+parsers.register("toml", "tomllib", _tomllib)
+parsers.register("toml", "tomli", _tomli)
+
+
+def read_toml(file: Path, parser: Parser | None) -> dict[str, Any]:
+    if parser is None:
+        raise ImportError(
+            "Toml loader requires a TOML parser, e.g. `tomli` (before Python 3.11)"
+        )
+    return parser.loads(file.read_text(encoding="utf-8"))
+
+
+def read_layered(
+    state: TomlState,
+    files: tuple[Path, ...],
+    directory: Path | None,
+    listing: Listing,
+) -> TomlDocument:
+    """Parse and deep-merge `files`, then `directory`'s `listing` (through `state`'s cache)."""
+    documents = [
+        state.get_or_load(file, functools.partial(read_toml, file, state.parser))[0]
+        for file in files
+    ]
+
+    fragments = None
+    if directory is not None:
+        fragments = state.get_or_load_latest(
+            (directory,),
+            listing,
+            functools.partial(read_directory, directory, listing, state.parser),
+        )[0]
+
+    if fragments is None and len(documents) == 1:
+        return TomlDocument(documents[0])
+    if fragments is not None and not documents:
+        return fragments
+
+    result = TomlDocument({})
+    for file, document in zip(files, documents):
+        merge(result, document, functools.partial(constant, file), ())
+
+    if fragments is not None:
+        merge(result, fragments.value, fragments.source, ())
+    return result
+
+
+def read_directory(
+    directory: Path, listing: Listing, parser: Parser | None
+) -> TomlDocument:
+    """Parse (in parallel) and merge the fragments of `directory`'s `listing`, in order.
+
+    States cache the result by the listing, which includes each fragment's
+    `(st_dev, st_ino, st_mtime_ns, st_size)`; so it's only re-read when a
+    fragment is added, removed or changed.
+    """
+    paths = [directory / name for name, _ in listing]
+    if len(paths) > 1:
+        with ThreadPoolExecutor(min(len(paths), MAX_PARSE_WORKERS)) as pool:
+            documents = list(pool.map(read_toml, paths, [parser] * len(paths)))
+    else:
+        documents = [read_toml(path, parser) for path in paths]
+
+    result = TomlDocument({})
+    for path, document in zip(paths, documents):
+        merge(result, document, functools.partial(constant, path), ())
+    return result
+
+
+def list_directory(directory: Path, pattern: str) -> Listing:
+    """List the `(name, stat)` of files in `directory` matching `pattern`, sorted."""
+    entries = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if fnmatch.fnmatchcase(entry.name, pattern) and entry.is_file():
+                    entries.append((entry.name, stat_key(entry.stat())))
+    except FileNotFoundError:
+        return ()
+
+    entries.sort()
+    return tuple(entries)
+
+
+def merge(
+    result: TomlDocument,
+    value: dict[str, Any],
+    source: Callable[[tuple[str, ...]], Path | None],
+    prefix: tuple[str, ...],
+    target: dict[str, Any] | None = None,
+):
+    """Deep-merge `value` into `result`, recording `source(path)` for each key."""
+    if target is None:
+        target = result.value
+
+    for key, item in value.items():
+        path = (*prefix, key)
+        existing = target.get(key)
+        if isinstance(item, dict) and isinstance(existing, dict):
+            merge(result, item, source, path, existing)
+        else:
+            # Tables are copied, so that merging into them never mutates the
+            # cached (per-file) documents.
+            target[key] = copy_tables(item)
+            file = source(path)
+            if file is not None:
+                result.sources[path] = file
+
+
+def constant(file: Path, _: tuple[str, ...]) -> Path:
+    return file
+
+
+def flatten(result: dict[str, Any], prefix: str, value: Any):
+    """Index `value` (and, for a table, everything beneath it) by its dotted path."""
+    result.setdefault(prefix, value)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            flatten(result, f"{prefix}.{key}", item)
+
+
+def copy_tables(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: copy_tables(item) for key, item in value.items()}
+    return value
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Dict, List, Sequence, Tuple
+
+from dataclass_settings.observer import Observer
+
+if TYPE_CHECKING:
+    from dataclass_settings.context import Context
+    from dataclass_settings.loader import Loader
+
+__all__ = [
+    "DEFAULT_BUCKETS",
+    "Metrics",
+]
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+Labels = Tuple[Tuple[str, str], ...]
+MetricKey = Tuple[str, Labels]
+
+LOADS = "dataclass_settings_loads_total"
+RELOADS = "dataclass_settings_reloads_total"
+LOAD_DURATION = "dataclass_settings_load_duration_seconds"
+LOADER_LOOKUPS = "dataclass_settings_loader_lookups_total"
+LOADER_DURATION = "dataclass_settings_loader_duration_seconds"
+CACHE_LOOKUPS = "dataclass_settings_cache_lookups_total"
+
+HELP = {
+    LOADS: "Number of load_settings calls, by settings class and outcome.",
+    RELOADS: "Number of load_settings calls for a settings class which had already been loaded.",
+    LOAD_DURATION: "Duration of load_settings calls, by settings class.",
+    LOADER_LOOKUPS: "Number of Loader.load calls, by loader and result.",
+    LOADER_DURATION: "Duration of Loader.load calls, by loader.",
+    CACHE_LOOKUPS: "Number of loader state cache lookups, by loader and result.",
+}
+
+
+class Shard:
+    """The counters and histograms written to by a single thread."""
+
+    def __init__(self, bucket_count: int):
+        self.bucket_count = bucket_count
+        self.counters: Dict[MetricKey, float] = {}
+
+        # Each histogram is stored as [*bucket_counts, +Inf count, sum].
+        self.histograms: Dict[MetricKey, List[float]] = {}
+
+    def inc(self, key: MetricKey, amount: float = 1):
+        self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe(self, key: MetricKey, index: int, value: float):
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = [0.0] * (self.bucket_count + 2)
+
+        histogram[index] += 1
+        histogram[-1] += value
+
+
+class Metrics(Observer):
+    """Collect `load_settings` statistics and render them as Prometheus text.
+
+    Each thread records into its own `Shard`, so recording never takes a lock;
+    shards are only merged when `render` is called.
+
+    Register an instance with `load_settings(..., observer=metrics)` or process-wide
+    with `dataclass_settings.observer.set_observer(metrics)`, then serve
+    `metrics.render()` from a scrape endpoint.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._local = threading.local()
+        self._shards: list[Shard] = []
+        self._lock = threading.Lock()
+
+    def _shard(self) -> Shard:
+        shard: Shard | None = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = Shard(len(self.buckets))
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+    def _observe(self, shard: Shard, key: MetricKey, value: float):
+        shard.observe(key, bisect_left(self.buckets, value), value)
+
+    def on_load(
+        self, context: Context, loader: Loader, duration: float, hit: bool
+    ) -> None:
+        loader_name = loader.__class__.__name__
+        shard = self._shard()
+        shard.inc(
+            (
+                LOADER_LOOKUPS,
+                (("loader", loader_name), ("result", "hit" if hit else "miss")),
+            )
+        )
+        self._observe(shard, (LOADER_DURATION, (("loader", loader_name),)), duration)
+
+    def on_cache(self, loader: Loader, hit: bool) -> None:
+        self._shard().inc(
+            (
+                CACHE_LOOKUPS,
+                (
+                    ("loader", loader.__class__.__name__),
+                    ("result", "hit" if hit else "miss"),
+                ),
+            )
+        )
+
+    def on_finish(self, source_cls: type, duration: float, success: bool) -> None:
+        name = source_cls.__qualname__
+        shard = self._shard()
+        shard.inc(
+            (LOADS, (("class", name), ("outcome", "success" if success else "error")))
+        )
+        self._observe(shard, (LOAD_DURATION, (("class", name),)), duration)
+
+    def collect(self) -> tuple[dict[MetricKey, float], dict[MetricKey, list[float]]]:
+        """Merge all per-thread shards into a single snapshot."""
+        with self._lock:
+            shards = list(self._shards)
+
+        counters: dict[MetricKey, float] = {}
+        histograms: dict[MetricKey, list[float]] = {}
+        for shard in shards:
+            for key, value in list(shard.counters.items()):
+                counters[key] = counters.get(key, 0) + value
+
+            for key, histogram in list(shard.histograms.items()):
+                merged = histograms.get(key)
+                if merged is None:
+                    histograms[key] = list(histogram)
+                else:
+                    for i, value in enumerate(histogram):
+                        merged[i] += value
+
+        loads_by_class: dict[Labels, float] = {}
+        for (name, labels), value in counters.items():
+            if name == LOADS:
+                class_labels = labels[:1]
+                loads_by_class[class_labels] = (
+                    loads_by_class.get(class_labels, 0) + value
+                )
+
+        for class_labels, value in loads_by_class.items():
+            counters[(RELOADS, class_labels)] = max(value - 1, 0)
+
+        return counters, histograms
+
+    def render(self) -> str:
+        """Render the current metrics in the Prometheus text exposition format."""
+        counters, histograms = self.collect()
+
+        lines: list[str] = []
+        for name in (LOADS, RELOADS, LOADER_LOOKUPS, CACHE_LOOKUPS):
+            samples = sorted(
+                (labels, value) for (n, labels), value in counters.items() if n == name
+            )
+            if not samples:
+                continue
+
+            lines.append(f"# HELP {name} {HELP[name]}")
+            lines.append(f"# TYPE {name} counter")
+            for labels, value in samples:
+                lines.append(f"{name}{render_labels(labels)} {render_value(value)}")
+
+        for name in (LOAD_DURATION, LOADER_DURATION):
+            hist_samples = sorted(
+                (labels, value)
+                for (n, labels), value in histograms.items()
+                if n == name
+            )
+            if not hist_samples:
+                continue
+
+            lines.append(f"# HELP {name} {HELP[name]}")
+            lines.append(f"# TYPE {name} histogram")
+            for labels, histogram in hist_samples:
+                cumulative = 0.0
+                for bound, count in zip(self.buckets, histogram):
+                    cumulative += count
+                    bucket_labels = (*labels, ("le", render_value(bound)))
+                    lines.append(
+                        f"{name}_bucket{render_labels(bucket_labels)} {render_value(cumulative)}"
+                    )
+
+                cumulative += histogram[-2]
+                inf_labels = (*labels, ("le", "+Inf"))
+                lines.append(
+                    f"{name}_bucket{render_labels(inf_labels)} {render_value(cumulative)}"
+                )
+                lines.append(
+                    f"{name}_sum{render_labels(labels)} {render_value(histogram[-1])}"
+                )
+                lines.append(
+                    f"{name}_count{render_labels(labels)} {render_value(cumulative)}"
+                )
+
+        return "\n".join(lines) + "\n"
+
+
+def render_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+
+    rendered = ",".join(f'{key}="{escape_label(value)}"' for key, value in labels)
+    return "{" + rendered + "}"
+
+
+def escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render_value(value: float) -> str:
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
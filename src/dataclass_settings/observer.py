@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from dataclass_settings.context import Context
+    from dataclass_settings.loader import Loader
+
+__all__ = [
+    "LoadStats",
+    "Observer",
+    "Observers",
+    "get_observer",
+    "set_observer",
+]
+
+
+class Observer:
+    """Receives instrumentation events emitted during `load_settings`.
+
+    Every hook is a no-op by default, subclasses override only what they need.
+    Durations are in seconds, as measured by `time.perf_counter`.
+    """
+
+    def on_compile(self, source_cls: type, duration: float) -> None:
+        """Inspect the fields of a (possibly nested) settings class."""
+
+    def on_load(
+        self, context: Context, loader: Loader, duration: float, hit: bool
+    ) -> None:
+        """Call a single `Loader.load` for a field."""
+
+    def on_map(self, context: Context, duration: float) -> None:
+        """Map/validate a field's loaded value."""
+
+    def on_construct(self, source_cls: type, duration: float) -> None:
+        """Construct the root settings instance."""
+
+    def on_cache(self, loader: Loader, hit: bool) -> None:
+        """Consult a loader's state cache (e.g. file contents)."""
+
+    def on_finish(self, source_cls: type, duration: float, success: bool) -> None:
+        """Complete (or fail) an entire `load_settings` call."""
+
+
+@dataclass(init=False)
+class Observers(Observer):
+    """Fan events out to multiple observers."""
+
+    observers: tuple[Observer, ...]
+
+    def __init__(self, *observers: Observer):
+        self.observers = observers
+
+    def on_compile(self, source_cls: type, duration: float) -> None:
+        for observer in self.observers:
+            observer.on_compile(source_cls, duration)
+
+    def on_load(
+        self, context: Context, loader: Loader, duration: float, hit: bool
+    ) -> None:
+        for observer in self.observers:
+            observer.on_load(context, loader, duration, hit)
+
+    def on_map(self, context: Context, duration: float) -> None:
+        for observer in self.observers:
+            observer.on_map(context, duration)
+
+    def on_construct(self, source_cls: type, duration: float) -> None:
+        for observer in self.observers:
+            observer.on_construct(source_cls, duration)
+
+    def on_cache(self, loader: Loader, hit: bool) -> None:
+        for observer in self.observers:
+            observer.on_cache(loader, hit)
+
+    def on_finish(self, source_cls: type, duration: float, success: bool) -> None:
+        for observer in self.observers:
+            observer.on_finish(source_cls, duration, success)
+
+
+@dataclass
+class Stat:
+    calls: int = 0
+    hits: int = 0
+    misses: int = 0
+    total: float = 0.0
+
+    def add(self, duration: float, hit: bool | None = None):
+        self.calls += 1
+        self.total += duration
+        if hit is True:
+            self.hits += 1
+        elif hit is False:
+            self.misses += 1
+
+
+@dataclass
+class LoadStats(Observer):
+    """Aggregate events into per-event cumulative timings.
+
+    Pass an instance as `load_settings(..., observer=stats)` (or register it
+    with `set_observer`), then render the aggregate with `stats.summary()`.
+    Events may be recorded from multiple threads at once.
+    """
+
+    stats: dict[tuple[str, str, str], Stat] = field(default_factory=dict)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def _add(
+        self,
+        kind: str,
+        target: str,
+        name: str,
+        duration: float,
+        hit: bool | None = None,
+    ):
+        key = (kind, target, name)
+        with self._lock:
+            stat = self.stats.get(key)
+            if stat is None:
+                stat = self.stats[key] = Stat()
+            stat.add(duration, hit)
+
+    def on_compile(self, source_cls: type, duration: float) -> None:
+        self._add("compile", source_cls.__qualname__, "", duration)
+
+    def on_load(
+        self, context: Context, loader: Loader, duration: float, hit: bool
+    ) -> None:
+        name = ".".join([*context.path, context.name])
+        self._add("load", loader.__class__.__name__, name, duration, hit)
+
+    def on_map(self, context: Context, duration: float) -> None:
+        name = ".".join([*context.path, context.name])
+        self._add("map", "", name, duration)
+
+    def on_construct(self, source_cls: type, duration: float) -> None:
+        self._add("construct", source_cls.__qualname__, "", duration)
+
+    def summary(self) -> str:
+        """Render a table of the recorded events, sorted by cumulative time."""
+        header = ("event", "target", "field", "calls", "hits", "misses", "total ms")
+        rows: list[tuple[Any, ...]] = [header]
+        with self._lock:
+            items = list(self.stats.items())
+
+        for (kind, target, name), stat in sorted(
+            items, key=lambda item: item[1].total, reverse=True
+        ):
+            rows.append(
+                (
+                    kind,
+                    target,
+                    name,
+                    stat.calls,
+                    stat.hits,
+                    stat.misses,
+                    f"{stat.total * 1000:.3f}",
+                )
+            )
+
+        str_rows = [[str(cell) for cell in row] for row in rows]
+        widths = [max(len(row[i]) for row in str_rows) for i in range(len(header))]
+        return "\n".join(
+            "  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+            for row in str_rows
+        )
+
+
+_observer: Observer | None = None
+
+
+def set_observer(observer: Observer | None) -> None:
+    """Set the process-wide default observer, used when `load_settings` is not given one."""
+    global _observer
+    _observer = observer
+
+
+def get_observer() -> Observer | None:
+    return _observer
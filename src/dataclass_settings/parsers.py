@@ -0,0 +1,113 @@
+"""Parser backends for file based loaders (e.g. `Toml`, `Json`).
+
+Each format has an ordered (most preferred first) set of named backends, each
+registered as a factory which imports its library, and raises `ImportError` if
+it isn't installed. A loader's state selects (and resolves) its backend once,
+when it's created, rather than on every file read.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Tuple
+
+__all__ = [
+    "Parser",
+    "available",
+    "get_parser",
+    "register",
+]
+
+
+@dataclass(frozen=True)
+class Parser:
+    """A resolved parser backend.
+
+    Arguments:
+        format: The format parsed, e.g. "toml".
+        name: The backend's name, e.g. "tomllib".
+        loads: Parses the content of a file.
+        decode: For backends which defer decoding nested values (e.g. as
+            `msgspec.Raw`), finishes decoding a value produced by `loads`.
+    """
+
+    format: str
+    name: str
+    loads: Callable[[Any], Any]
+    decode: Callable[[Any], Any] | None = None
+
+    def __reduce__(self):
+        # Backends are re-resolved by name, so that they needn't be picklable.
+        return (get_parser, (self.format, self.name))
+
+
+ParserFactory = Callable[[], Parser]
+
+_backends: Dict[str, Dict[str, ParserFactory]] = {}
+_resolved: Dict[Tuple[str, str], Parser | None] = {}
+
+
+def register(format: str, name: str, factory: ParserFactory, *, first: bool = False):
+    """Register a parser backend `factory` for `format`.
+
+    Backends are preferred in the order they're registered, unless `first` is
+    given. Registering an existing `name` replaces it (in place).
+    """
+    backends = _backends.setdefault(format, {})
+    if first:
+        backends.pop(name, None)
+        _backends[format] = {name: factory, **backends}
+    else:
+        backends[name] = factory
+
+    for key in [key for key in _resolved if key[0] == format]:
+        del _resolved[key]
+
+
+def get_parser(format: str, name: str | None = None) -> Parser | None:
+    """Return the `name`d backend for `format`, else the most preferred installed one.
+
+    Returns `None` if no backend for `format` is installed.
+
+    Raises:
+        ValueError: If `name` isn't a registered backend.
+        ImportError: If the `name`d backend isn't installed.
+    """
+    backends = _backends.get(format, {})
+    if name is not None and name not in backends:
+        options = ", ".join(f"`{option}`" for option in backends)
+        raise ValueError(
+            f"Unknown {format} parser `{name}`, expected one of: {options}"
+        )
+
+    key = (format, name or "")
+    try:
+        return _resolved[key]
+    except KeyError:
+        pass
+
+    if name is not None:
+        parser: Parser | None = backends[name]()
+    else:
+        parser = None
+        for factory in backends.values():
+            try:
+                parser = factory()
+            except ImportError:
+                continue
+            break
+
+    _resolved[key] = parser
+    return parser
+
+
+def available(format: str) -> list[str]:
+    """Return the names of the installed backends for `format`, in preference order."""
+    result = []
+    for name, factory in _backends.get(format, {}).items():
+        try:
+            factory()
+        except ImportError:
+            continue
+        result.append(name)
+    return result
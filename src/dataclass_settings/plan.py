@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import ClassVar, Iterator
+
+from dataclass_settings import class_inspect
+from dataclass_settings.context import Context
+from dataclass_settings.loader import Loader
+
+__all__ = [
+    "PlanEntry",
+    "walk",
+]
+
+
+@dataclass
+class PlanEntry:
+    """A leaf field of a settings class, along with the loaders it will consult."""
+
+    context: Context
+    field: class_inspect.Field
+    loaders: list[Loader]
+
+    @property
+    def path(self) -> str:
+        return ".".join([*self.context.path, self.context.name])
+
+    def describe(self) -> list[tuple[Loader, list[str]]]:
+        """Produce the concrete sources (env vars, files, keys) each loader will consult."""
+        result = []
+        for loader in self.loaders:
+            state = self.context.get_state(loader)
+            try:
+                sources = list(loader.describe(self.context, state))
+            except ValueError as e:
+                sources = [f"<error: {e}>"]
+            result.append((loader, sources))
+        return result
+
+
+def walk(source_cls: type, context: Context) -> Iterator[PlanEntry]:
+    """Yield a `PlanEntry` for every leaf field, in the order `load_settings` visits them.
+
+    `context` should already have its loaders resolved.
+    """
+    loaders = context.loaders
+    observer = context.observer
+    fields = class_inspect.fields(
+        source_cls, on_compile=observer.on_compile if observer else None
+    )
+    for field in fields:
+        if field.type_view.fallback_origin is ClassVar:
+            continue
+
+        field_context = context.enter(field.name)
+
+        nested_type = field.get_nested_type()
+        if nested_type:
+            yield from walk(nested_type, field_context)
+        else:
+            yield PlanEntry(field_context, field, list(field.get_loaders(loaders)))
@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    MutableSequence,
+    TypeVar,
+)
+
+from dataclass_settings import class_inspect
+
+__all__ = [
+    "SettingsTable",
+]
+
+T = TypeVar("T")
+
+# The `array` typecode used to store columns of each (exact) leaf type.
+TYPECODES: dict[type, str] = {
+    bool: "b",
+    int: "q",
+    float: "d",
+}
+
+
+class Column:
+    """The values of a single leaf field (or the presence of a nested field).
+
+    Values are stored in an `array` for `bool`/`int`/`float` fields (degrading to a
+    list, should a value not fit), and in a list otherwise, with strings interned.
+    Nulls are tracked in a separate bitmap, leaving a placeholder in `values`.
+    """
+
+    def __init__(self, name: str, annotation: Any):
+        self.name = name
+        self.type: type | None = annotation if annotation in TYPECODES else None
+        self.values: MutableSequence[Any] = (
+            array(TYPECODES[annotation]) if self.type else []
+        )
+        self.nulls = bytearray()
+        self.index: Dict[Any, List[int]] | None = None
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def append(self, value: Any):
+        row = len(self.values)
+        if row % 8 == 0:
+            self.nulls.append(0)
+
+        if value is None:
+            self.nulls[row >> 3] |= 1 << (row & 7)
+            self.values.append(0 if self.type else None)
+        else:
+            if type(value) is str:
+                value = sys.intern(value)
+
+            if self.type is not None and type(value) is not self.type:
+                self.degrade()
+
+            try:
+                self.values.append(value)
+            except OverflowError:
+                self.degrade()
+                self.values.append(value)
+
+        if self.index is not None:
+            self.index.setdefault(value, []).append(row)
+
+    def degrade(self):
+        """Fall back to storing arbitrary objects."""
+        if self.type is None:
+            return
+
+        values = self.values
+        self.values = [self.type(v) for v in values]
+        for row in range(len(values)):
+            if self.is_null(row):
+                self.values[row] = None
+        self.type = None
+
+    def is_null(self, row: int) -> bool:
+        return bool(self.nulls[row >> 3] & (1 << (row & 7)))
+
+    def get(self, row: int) -> Any:
+        if self.is_null(row):
+            return None
+
+        value = self.values[row]
+        if self.type is bool:
+            return bool(value)
+        return value
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self.get(row) for row in range(len(self.values)))
+
+    def where(self, value: Any) -> list[int]:
+        """Return the rows whose value equals `value`."""
+        if self.index is not None:
+            return list(self.index.get(value, ()))
+
+        if value is None:
+            return [row for row in range(len(self.values)) if self.is_null(row)]
+
+        values = self.values
+        nulls = self.nulls
+        return [
+            row
+            for row in range(len(values))
+            if values[row] == value and not nulls[row >> 3] & (1 << (row & 7))
+        ]
+
+    def build_index(self):
+        index: Dict[Any, List[int]] = {}
+        for row, value in enumerate(self):
+            index.setdefault(value, []).append(row)
+        self.index = index
+
+
+class SettingsTable(Generic[T]):
+    """Store many instances of one settings class column-wise.
+
+    Holding many (e.g. per-tenant) settings instances costs an object (and a
+    `__dict__`, and boxed values) per instance and per nested instance. Instead,
+    each leaf field of `source_cls` (as inspected by `class_inspect.fields`,
+    with nested fields named by their dotted path) is stored as a `Column`, and a
+    real instance is only constructed when it's accessed with `table[i]`.
+
+    Instances are decomposed on `append`; so a table can be filled lazily, with
+    `SettingsTable.from_instances(cls, load_settings_many(cls, sources))`,
+    without holding every instance at once.
+
+    Examples:
+        >>> from dataclasses import dataclass
+        >>> @dataclass
+        ... class Tenant:
+        ...     name: str
+        ...     port: int = 80
+        >>> table = SettingsTable.from_instances(Tenant, [Tenant("a"), Tenant("b", 81)])
+        >>> table[1]
+        Tenant(name='b', port=81)
+        >>> table.where(port=80)
+        [0]
+        >>> table.lookup("name", "b").port
+        81
+    """
+
+    def __init__(self, source_cls: type[T]):
+        self.source_cls = source_cls
+        self.columns: dict[str, Column] = {}
+        self._length = 0
+        self._add_columns(source_cls, "")
+
+    @classmethod
+    def from_instances(
+        cls, source_cls: type[T], instances: Iterable[T]
+    ) -> SettingsTable[T]:
+        table = cls(source_cls)
+        table.extend(instances)
+        return table
+
+    def _add_columns(self, source_cls: type, prefix: str):
+        for field in _fields(source_cls):
+            name = prefix + field.name
+            nested_type = field.get_nested_type()
+            if nested_type:
+                # Records whether the nested instance was present (i.e. not `None`).
+                self.columns[name] = Column(name, bool)
+                self._add_columns(nested_type, name + ".")
+            else:
+                self.columns[name] = Column(name, field.type_view.annotation)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def append(self, instance: T):
+        self._append(self.source_cls, instance, "")
+        self._length += 1
+
+    def extend(self, instances: Iterable[T]):
+        for instance in instances:
+            self.append(instance)
+
+    def _append(self, source_cls: type, instance: Any, prefix: str):
+        for field in _fields(source_cls):
+            name = prefix + field.name
+            value = getattr(instance, field.name) if instance is not None else None
+
+            nested_type = field.get_nested_type()
+            if nested_type:
+                self.columns[name].append(None if value is None else True)
+                self._append(nested_type, value, name + ".")
+            else:
+                self.columns[name].append(value)
+
+    def __getitem__(self, row: int) -> T:
+        if row < 0:
+            row += self._length
+        if not 0 <= row < self._length:
+            raise IndexError(row)
+
+        return self.source_cls(**self._materialize(self.source_cls, row, ""))
+
+    def _materialize(self, source_cls: type, row: int, prefix: str) -> dict[str, Any]:
+        result: dict[str, Any] = {}
+        for field in _fields(source_cls):
+            name = prefix + field.name
+
+            nested_type = field.get_nested_type()
+            if nested_type:
+                if self.columns[name].is_null(row):
+                    result[field.name] = None
+                else:
+                    value = self._materialize(nested_type, row, name + ".")
+                    result[field.name] = field.map_value(value)
+            else:
+                result[field.name] = self.columns[name].get(row)
+        return result
+
+    def __iter__(self) -> Iterator[T]:
+        return (self[row] for row in range(self._length))
+
+    def column(self, name: str) -> Column:
+        """Return the column for the (dotted) field `name`."""
+        try:
+            return self.columns[name]
+        except KeyError:
+            raise KeyError(
+                f"'{self.source_cls.__qualname__}' has no field '{name}'"
+            ) from None
+
+    def where(
+        self, criteria: Mapping[str, Any] | None = None, /, **kwargs
+    ) -> list[int]:
+        """Return the rows whose fields equal all of the given values.
+
+        Nested fields are given by their dotted path, through `criteria`.
+        """
+        criteria = {**(criteria or {}), **kwargs}
+
+        rows: list[int] | None = None
+        for name, value in criteria.items():
+            matches = self.column(name).where(value)
+            if rows is None:
+                rows = matches
+            else:
+                matching = set(matches)
+                rows = [row for row in rows if row in matching]
+
+            if not rows:
+                return []
+
+        return list(range(self._length)) if rows is None else rows
+
+    def filter(
+        self, criteria: Mapping[str, Any] | None = None, /, **kwargs
+    ) -> Iterator[T]:
+        """Yield an instance for each row matching `where(criteria, **kwargs)`."""
+        return (self[row] for row in self.where(criteria, **kwargs))
+
+    def lookup(self, name: str, value: Any) -> T:
+        """Return the first row whose field `name` equals `value`.
+
+        The first lookup by a given field builds a hash index for it, which is
+        then maintained by `append`.
+        """
+        column = self.column(name)
+        if column.index is None:
+            column.build_index()
+
+        rows = column.where(value)
+        if not rows:
+            raise KeyError(f"No row with {name}={value!r}")
+        return self[rows[0]]
+
+
+_fields_cache: class_inspect.ClassCache[list[class_inspect.Field]] = (
+    class_inspect.ClassCache()
+)
+
+
+def _fields(source_cls: type) -> list[class_inspect.Field]:
+    try:
+        return _fields_cache[source_cls]
+    except KeyError:
+        pass
+
+    return _fields_cache.setdefault(
+        source_cls,
+        [
+            field
+            for field in class_inspect.fields(source_cls)
+            if field.type_view.fallback_origin is not ClassVar
+        ],
+    )
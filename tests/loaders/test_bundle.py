@@ -0,0 +1,142 @@
+import os
+import pickle
+from dataclasses import dataclass
+
+import pytest
+from typing_extensions import Annotated
+
+from dataclass_settings import SecretBundle, load_settings
+from dataclass_settings.context import Context, LoadHistory
+from dataclass_settings.loader import FileCache
+from dataclass_settings.loaders import bundle
+from dataclass_settings.loaders.bundle import build_bundle, open_bundle
+from tests.utils import record_calls
+
+
+@dataclass
+class Config:
+    user: Annotated[str, SecretBundle("user")]
+    host: Annotated[str, SecretBundle("host")] = "localhost"
+
+
+@pytest.fixture
+def secrets(tmp_path):
+    directory = tmp_path / "secrets"
+    directory.mkdir()
+    (directory / "user").write_text("admin")
+    (directory / "unicode").write_text("pässword")
+    (directory / "empty").write_text("")
+    return directory
+
+
+def test_build_and_load(secrets, tmp_path):
+    file = tmp_path / "secrets.bundle"
+    assert build_bundle(secrets, file) == 3
+
+    history = LoadHistory()
+    state = SecretBundle.load_with(file=file)
+    assert load_settings(Config, loaders=state, emit_history=history) == Config(
+        user="admin"
+    )
+    assert f"{file}:user" in history.format()
+    assert "admin" not in history.format()
+
+    mapped = open_bundle(file)
+    assert mapped is not None
+    assert len(mapped) == 3
+    assert mapped.get("unicode") == "pässword"
+    assert mapped.get("empty") == ""
+    assert mapped.get("missing") is None
+
+
+def test_mapped_once(secrets, tmp_path, monkeypatch):
+    file = tmp_path / "secrets.bundle"
+    build_bundle(secrets, file)
+
+    mapped = record_calls(monkeypatch, bundle, "Bundle")
+
+    for _ in range(3):
+        state = SecretBundle.load_with(file=file)
+        assert load_settings(Config, loaders=state) == Config(user="admin")
+    assert mapped == [file]
+
+    # Rebuilding the bundle (which replaces the file) remaps it.
+    (secrets / "host").write_text("db")
+    build_bundle(secrets, file)
+    state = SecretBundle.load_with(file=file)
+    assert load_settings(Config, loaders=state) == Config(user="admin", host="db")
+    assert mapped == [file, file]
+
+
+def test_mappings_bounded(secrets, tmp_path, monkeypatch):
+    monkeypatch.setattr(bundle, "_bundles", FileCache(limit=2))
+
+    files = [tmp_path / f"{tenant}.bundle" for tenant in ("a", "b", "c")]
+    for file in files:
+        build_bundle(secrets, file)
+        assert open_bundle(file) is not None
+
+    # The least recently used bundle was evicted, and is remapped when next read.
+    assert len(bundle._bundles) == 2
+    mapped = record_calls(monkeypatch, bundle, "Bundle")
+    open_bundle(files[2])
+    open_bundle(files[0])
+    assert mapped == [files[0]]
+
+
+def test_kubernetes_mount(secrets, tmp_path):
+    data = secrets / "..2024_01_01"
+    data.mkdir()
+    (data / "host").write_text("db")
+    (secrets / "..data").symlink_to(data.name)
+    (secrets / "host").symlink_to(os.path.join("..data", "host"))
+
+    file = tmp_path / "secrets.bundle"
+    assert build_bundle(secrets, file) == 4
+
+    state = SecretBundle.load_with(file=file)
+    assert load_settings(Config, loaders=state) == Config(user="admin", host="db")
+
+
+def test_missing_bundle(tmp_path):
+    @dataclass
+    class Optional:
+        host: Annotated[str, SecretBundle("host")] = "localhost"
+
+    state = SecretBundle.load_with(file=tmp_path / "missing.bundle")
+    assert load_settings(Optional, loaders=state) == Optional()
+
+
+def test_invalid_bundle(tmp_path):
+    file = tmp_path / "secrets.bundle"
+    file.write_bytes(b"not a bundle")
+
+    with pytest.raises(ValueError) as e:
+        open_bundle(file)
+    assert "is not a secret bundle" in str(e.value)
+
+
+def test_requires_file():
+    with pytest.raises(ValueError) as e:
+        load_settings(Config, loaders=SecretBundle)
+    assert "requires a `file` argument" in str(e.value)
+
+
+def test_describe(tmp_path):
+    context = Context(path=["db"], field_name="user", nested_delimiter=True)
+    state = SecretBundle.load_with(file="secrets.bundle")
+    assert SecretBundle().describe(
+        Context(field_name="user", infer_names=True), state
+    ) == ["secrets.bundle:user"]
+    assert SecretBundle("user").describe(context, state) == ["secrets.bundle:db_user"]
+
+
+def test_pickle_state(secrets, tmp_path):
+    file = tmp_path / "secrets.bundle"
+    build_bundle(secrets, file)
+
+    state = SecretBundle.load_with(file=file)
+    load_settings(Config, loaders=state)
+
+    restored = pickle.loads(pickle.dumps(state))  # noqa: S301
+    assert restored.value[file].get("user") == "admin"
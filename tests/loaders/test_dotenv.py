@@ -0,0 +1,143 @@
+import os
+import textwrap
+from dataclasses import dataclass, field
+
+import pytest
+from typing_extensions import Annotated
+
+from dataclass_settings import DotEnv, Env, load_settings
+from dataclass_settings.loader import FileCache
+from dataclass_settings.loaders import dotenv
+from dataclass_settings.loaders.dotenv import parse_dotenv, read_dotenv
+from tests.utils import record_calls
+
+
+@dataclass
+class Database:
+    host: Annotated[str, DotEnv("HOST")] = "localhost"
+
+
+@dataclass
+class Config:
+    name: Annotated[str, Env("NAME"), DotEnv("name")]
+    port: Annotated[int, DotEnv("PORT")] = 80
+    database: Database = field(default_factory=Database)
+
+
+def test_parse():
+    text = textwrap.dedent(
+        """\
+        # A comment
+        A=1
+        export B = two words  # trailing comment
+        C="double \\"quoted\\"\\n\\$HOME \\x"
+        D='single \\n $HOME'
+
+        E="multi
+        line"
+        F=a#b
+        G=
+        """
+    )
+    assert parse_dotenv(text) == {
+        "A": "1",
+        "B": "two words",
+        "C": 'double "quoted"\n$HOME \\x',
+        "D": "single \\n $HOME",
+        "E": "multi\nline",
+        "F": "a#b",
+        "G": "",
+    }
+
+
+def test_parse_crlf():
+    assert parse_dotenv('A=1\r\nB="2"\r\n') == {"A": "1", "B": "2"}
+
+
+@pytest.mark.parametrize(
+    "text, error",
+    [
+        ("A=1\nnot a pair\n", "<string>:2: Expected `KEY=VALUE`"),
+        ('A="1\nB=2\n', '<string>:1: Unterminated " quote'),
+    ],
+)
+def test_parse_errors(text, error):
+    with pytest.raises(ValueError, match=error):
+        parse_dotenv(text)
+
+
+def test_load(tmp_path):
+    base = tmp_path / ".env"
+    base.write_text("NAME=base\nPORT=8000\nHOST=db\n")
+    local = tmp_path / ".env.local"
+    local.write_text("PORT=9000\n")
+
+    state = DotEnv.load_with(files=[base, local, tmp_path / "missing"])
+    config = load_settings(Config, loaders=[Env.load_with(env={}), state])
+    assert config == Config(name="base", port=9000, database=Database(host="db"))
+
+
+def test_nested_delimiter_and_infer_names(tmp_path):
+    @dataclass
+    class Inferred:
+        database: Annotated[Database, DotEnv()]
+        debug: Annotated[bool, DotEnv()] = False
+
+    file = tmp_path / ".env"
+    file.write_text("DATABASE_HOST=nested\nDEBUG=false\n")
+
+    config = load_settings(
+        Inferred,
+        loaders=DotEnv.load_with(files=file),
+        nested_delimiter=True,
+        infer_names=True,
+    )
+    assert config == Inferred(database=Database(host="nested"))
+
+
+def test_requires_name(tmp_path):
+    @dataclass
+    class Unnamed:
+        foo: Annotated[str, DotEnv()]
+
+    with pytest.raises(ValueError, match="DotEnv instance for `foo`"):
+        load_settings(Unnamed, loaders=DotEnv.load_with(files=tmp_path / ".env"))
+
+
+def test_parse_cache_invalidated_by_stat(tmp_path, monkeypatch):
+    file = tmp_path / ".env"
+    file.write_text("A=1\n")
+
+    parses = record_calls(
+        monkeypatch, dotenv, "parse_dotenv", key=lambda text, source: source
+    )
+
+    assert read_dotenv(file) == {"A": "1"}
+    assert read_dotenv(file) == {"A": "1"}
+    assert len(parses) == 1
+
+    file.write_text("A=22\n")
+    stat = os.stat(file)
+    os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert read_dotenv(file) == {"A": "22"}
+    assert len(parses) == 2
+
+
+def test_parse_cache_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(dotenv, "_parse_cache", FileCache(limit=2))
+    parses = record_calls(
+        monkeypatch, dotenv, "parse_dotenv", key=lambda text, source: source
+    )
+
+    files = []
+    for tenant in ("a", "b", "c"):
+        file = tmp_path / f"{tenant}.env"
+        file.write_text(f"TENANT={tenant}\n")
+        files.append(file)
+        read_dotenv(file)
+
+    # The least recently used file was evicted.
+    assert len(dotenv._parse_cache) == 2
+    read_dotenv(files[2])
+    read_dotenv(files[0])
+    assert parses == [str(file) for file in files] + [str(files[0])]
@@ -0,0 +1,92 @@
+import json
+from dataclasses import dataclass
+
+import msgspec
+import pytest
+from pydantic import BaseModel
+from typing_extensions import Annotated
+
+from dataclass_settings import Env, Json, load_settings
+from dataclass_settings.loaders import json as json_loader
+from tests.utils import record_calls
+
+
+class Database(BaseModel):
+    host: Annotated[str, Json("database.host")]
+    port: Annotated[int, Json("database.port")] = 5432
+
+
+class Config(BaseModel):
+    name: Annotated[str, Env("NAME"), Json("project.name")]
+    tags: Annotated[list, Json("project.tags")] = []
+    first_tag: Annotated[str, Json("project.tags.0")] = "none"
+    missing: Annotated[str, Json("project.missing.deeper")] = "default"
+    database: Database
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    file = tmp_path / "config.json"
+    file.write_text(
+        json.dumps(
+            {
+                "project": {"name": "foo", "tags": ["a", "b"]},
+                "database": {"host": "db"},
+                "unused": {"huge": list(range(100))},
+            }
+        )
+    )
+    return file
+
+
+def test_load(config_file):
+    config = load_settings(Config, loaders=[Env, Json.load_with(file=config_file)])
+    assert config == Config(name="foo", tags=["a", "b"], database=Database(host="db"))
+
+
+def test_file_on_annotation(config_file):
+    @dataclass
+    class Annotation:
+        name: Annotated[str, Json("project.name", file=config_file)]
+
+    assert load_settings(Annotation, loaders=Json) == Annotation(name="foo")
+
+
+def test_only_used_subtrees_are_decoded(config_file, monkeypatch):
+    decoded = record_calls(
+        monkeypatch,
+        json_loader,
+        "decode_subtree",
+        key=lambda value, parser: bytes(value),
+    )
+
+    state = Json.load_with(file=config_file)
+    load_settings(Config, loaders=state)
+    assert [json.loads(value) for value in decoded] == [
+        {"name": "foo", "tags": ["a", "b"]},
+        {"host": "db"},
+    ]
+
+    # The unused subtree is kept as an undecoded slice of the file.
+    assert isinstance(state.value[config_file]["unused"], msgspec.Raw)
+
+
+def test_requires_file():
+    @dataclass
+    class NoFile:
+        name: Annotated[str, Json("name")]
+
+    with pytest.raises(ValueError, match="requires a `file`"):
+        load_settings(NoFile, loaders=Json)
+
+
+def test_requires_object(tmp_path):
+    file = tmp_path / "list.json"
+    file.write_text("[1, 2]")
+
+    @dataclass
+    class Listed:
+        name: Annotated[str, Json("name")]
+
+    with pytest.raises(ValueError, match="to contain a JSON object"):
+        load_settings(Listed, loaders=Json.load_with(file=file))
@@ -0,0 +1,147 @@
+import csv
+from dataclasses import dataclass
+
+import pytest
+from pydantic import BaseModel, ValidationError
+from typing_extensions import Annotated
+
+from dataclass_settings import (
+    Env,
+    LoadTimeoutError,
+    Row,
+    iter_load_settings,
+    load_settings,
+)
+from dataclass_settings.loaders.row import read_csv, read_jsonl
+
+
+class Database(BaseModel):
+    host: Annotated[str, Row("host")] = "localhost"
+
+
+class Tenant(BaseModel):
+    name: Annotated[str, Row("name")]
+    port: Annotated[int, Row("port")] = 80
+    database: Database = Database()
+
+
+@dataclass
+class Inferred:
+    name: Annotated[str, Row()]
+    region: Annotated[str, Env("REGION")] = "us-east-1"
+
+
+def test_row_loader():
+    loader = Row.load_with(row={"name": "one", "port": "81", "NAME": "wrong"})
+    result = load_settings(Tenant, loaders=loader)
+    assert result == Tenant(name="one", port=81)
+
+
+def test_row_requires_column():
+    with pytest.raises(ValueError):
+        load_settings(Inferred, loaders=Row.load_with(row={"name": "one"}))
+
+
+def test_iter_load_settings():
+    rows = [{"name": "one", "host": "db1"}, {"port": "bad"}, {"name": "three"}]
+
+    results = list(iter_load_settings(Tenant, rows))
+    assert [r.index for r in results] == [0, 1, 2]
+    assert results[0].value == Tenant(name="one", database=Database(host="db1"))
+    assert results[2].value == Tenant(name="three")
+
+    assert not results[1].ok
+    assert results[1].value is None
+    assert isinstance(results[1].error, ValidationError)
+
+
+def test_iter_load_settings_is_lazy():
+    def rows():
+        yield {"name": "one"}
+        raise RuntimeError()
+
+    results = iter_load_settings(Tenant, rows())
+    assert next(results).value == Tenant(name="one")
+    with pytest.raises(RuntimeError):
+        next(results)
+
+
+def test_iter_load_settings_shared_loaders():
+    rows = [{"name": "one"}, {"name": "two"}]
+    results = iter_load_settings(
+        Inferred,
+        rows,
+        loaders=[Row, Env.load_with(env={"REGION": "eu"})],
+        infer_names=True,
+    )
+    assert [r.value for r in results] == [
+        Inferred(name="one", region="eu"),
+        Inferred(name="two", region="eu"),
+    ]
+
+
+def test_iter_load_settings_timeouts(monkeypatch):
+    # Non-blocking loaders are always called, regardless of their budget.
+    monkeypatch.setattr(Row, "blocking", True)
+    rows = [{"name": "one"}, {"name": "two"}]
+
+    results = list(
+        iter_load_settings(Tenant, rows, timeouts={Row: 0}, on_timeout="raise")
+    )
+    assert [r.index for r in results] == [0, 1]
+    assert all(isinstance(r.error, LoadTimeoutError) for r in results)
+
+
+def test_read_csv(tmp_path):
+    file = tmp_path / "tenants.csv"
+    file.write_text("name,port\none,8000\ntwo,\n")
+
+    rows = read_csv(file)
+    assert next(rows) == {"name": "one", "port": "8000"}
+
+    results = iter_load_settings(Tenant, rows)
+    assert [r.value for r in results] == [Tenant(name="two")]
+
+
+def test_read_jsonl(tmp_path):
+    file = tmp_path / "tenants.jsonl"
+    file.write_text('{"name": "one", "port": 8000}\n\n{"name": "two"}\n')
+
+    results = iter_load_settings(Tenant, read_jsonl(file))
+    assert [r.value for r in results] == [
+        Tenant(name="one", port=8000),
+        Tenant(name="two"),
+    ]
+
+
+def test_read_jsonl_malformed(tmp_path):
+    file = tmp_path / "tenants.jsonl"
+    file.write_text('{"name": "one"}\n{"name": \n[1, 2]\n{"name": "four"}\n')
+
+    results = list(iter_load_settings(Tenant, read_jsonl(file)))
+    assert [r.index for r in results] == [0, 1, 2, 3]
+    assert results[0].value == Tenant(name="one")
+    assert results[3].value == Tenant(name="four")
+
+    assert isinstance(results[1].error, ValueError)
+    assert "Line 2 of" in str(results[1].error)
+    assert isinstance(results[2].error, TypeError)
+    assert "Expected row 2 to be a mapping, got `list`" in str(results[2].error)
+
+
+def test_read_csv_malformed(tmp_path):
+    file = tmp_path / "tenants.csv"
+    file.write_text("name,port\none,1\n" + "x" * 20 + ",2\nthree,3\n")
+
+    limit = csv.field_size_limit(10)
+    try:
+        results = list(iter_load_settings(Tenant, read_csv(file)))
+    finally:
+        csv.field_size_limit(limit)
+
+    assert [r.value for r in results] == [
+        Tenant(name="one", port=1),
+        None,
+        Tenant(name="three", port=3),
+    ]
+    assert "Malformed row in" in str(results[1].error)
@@ -0,0 +1,161 @@
+import os
+from dataclasses import dataclass
+
+import pytest
+from typing_extensions import Annotated
+
+from dataclass_settings import Secret, load_settings
+from dataclass_settings.loaders import secret
+from tests.utils import record_calls
+
+
+@dataclass
+class Config:
+    user: Annotated[str, Secret("user")]
+    host: Annotated[str, Secret("host")]
+    cert: Annotated[str, Secret("tls/cert")] = "none"
+
+
+def write_generation(volume, generation: str, **values: str):
+    """Write a new generation, and swap `..data` to it, as the kubelet does."""
+    directory = volume / generation
+    directory.mkdir()
+    for name, value in values.items():
+        path = directory / name.replace("__", "/")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(value)
+
+        link = volume / name.replace("__", "/").split("/")[0]
+        if not os.path.lexists(link):
+            link.symlink_to(f"..data/{link.name}")
+
+    temp = volume / "..data_tmp"
+    temp.symlink_to(generation)
+    os.replace(temp, volume / "..data")
+
+
+@pytest.fixture
+def volume(tmp_path):
+    write_generation(tmp_path, "..1", user="admin", host="db1", tls__cert="cert1")
+    return tmp_path
+
+
+def record_generations(monkeypatch, before=None, after=None) -> list:
+    return record_calls(
+        monkeypatch,
+        secret,
+        "read_generation",
+        key=lambda path, *_: os.path.basename(path),
+        before=before,
+        after=after,
+    )
+
+
+def test_atomic(volume, monkeypatch):
+    calls = record_generations(monkeypatch)
+
+    state = Secret.load_with(dir=volume, atomic=True)
+    config = load_settings(Config, loaders=state)
+    assert config == Config(user="admin", host="db1", cert="cert1")
+
+    # The generation is resolved, and read, once for every field.
+    assert calls == ["..1"]
+
+
+def test_rotated_while_reading(volume, monkeypatch):
+    def rotate(call):
+        if call == 1:
+            write_generation(volume, "..2", user="root", host="db2")
+
+    calls = record_generations(monkeypatch, after=rotate)
+
+    state = Secret.load_with(dir=volume, atomic=True)
+    config = load_settings(Config, loaders=state)
+
+    # Every value comes from the new generation, never a mix of the two.
+    assert config == Config(user="root", host="db2")
+    assert calls == ["..1", "..2"]
+
+
+def test_rotated_after_snapshot(volume, monkeypatch):
+    state = Secret.load_with(dir=volume, atomic=True)
+    assert load_settings(Config, loaders=state).host == "db1"
+
+    calls = record_generations(monkeypatch)
+    assert load_settings(Config, loaders=state).host == "db1"
+    assert calls == []
+
+    write_generation(volume, "..2", user="root", host="db2")
+
+    # A reused state sees the rotation on its next load, only keeping the latest.
+    assert load_settings(Config, loaders=state) == Config(user="root", host="db2")
+    assert calls == ["..2"]
+    assert [key for key in state.value if key[0] == "..data"] == [
+        ("..data", volume, "..2")
+    ]
+
+
+def test_rotated_between_fields(volume, monkeypatch):
+    def rotate(call):
+        if call == 1:
+            write_generation(volume, "..2", user="root", host="db2")
+
+    # Rotate once the first field's value has been decoded.
+    record_calls(monkeypatch, secret, "decode", after=rotate)
+
+    state = Secret.load_with(dir=volume, atomic=True)
+    config = load_settings(Config, loaders=state)
+    assert config == Config(user="admin", host="db1", cert="cert1")
+    assert load_settings(Config, loaders=state) == Config(user="root", host="db2")
+
+
+def test_generation_resolved_once_per_load(volume, monkeypatch):
+    readlinks = record_calls(monkeypatch, os, "readlink")
+
+    state = Secret.load_with(dir=volume, atomic=True)
+    load_settings(Config, loaders=state)
+    load_settings(Config, loaders=state)
+
+    # Once per load (plus once to verify the first, uncached, read).
+    assert readlinks.count(os.path.join(volume, "..data")) == 3
+
+
+def test_generation_removed_while_reading(volume, monkeypatch):
+    def remove(call):
+        if call == 1:
+            write_generation(volume, "..2", user="root", host="db2")
+            raise FileNotFoundError(volume / "..1")
+
+    calls = record_generations(monkeypatch, before=remove)
+
+    state = Secret.load_with(dir=volume, atomic=True)
+    assert load_settings(Config, loaders=state) == Config(user="root", host="db2")
+    assert calls == ["..1", "..2"]
+
+
+def test_always_rotating(volume, monkeypatch):
+    generations = iter(range(2, 100))
+
+    def rotate(call):
+        write_generation(volume, f"..{next(generations)}", user="root", host="db")
+
+    record_generations(monkeypatch, after=rotate)
+
+    state = Secret.load_with(dir=volume, atomic=True)
+    with pytest.raises(RuntimeError) as e:
+        load_settings(Config, loaders=state)
+    assert "was rotated 5 times" in str(e.value)
+
+
+def test_not_a_projected_volume(tmp_path):
+    (tmp_path / "user").write_text("admin")
+    (tmp_path / "host").write_text("db")
+
+    state = Secret.load_with(dir=tmp_path, atomic=True)
+    assert load_settings(Config, loaders=state) == Config(user="admin", host="db")
+
+
+def test_atomic_excludes_cache():
+    with pytest.raises(ValueError) as e:
+        Secret.load_with(atomic=True, cache=True)
+    assert "can't be combined" in str(e.value)
@@ -0,0 +1,95 @@
+from dataclasses import dataclass
+
+import pytest
+from typing_extensions import Annotated
+
+from dataclass_settings import Secret, load_settings
+from dataclass_settings.loaders import secret
+from dataclass_settings.loaders.secret import SecretCache
+from tests.utils import record_calls
+
+DER = b"\x30\x82\x01\x0a\x02\x82\x01\x01\x00\xff\n"
+
+
+@dataclass
+class Config:
+    key: Annotated[bytes, Secret("key", binary=True)]
+    user: Annotated[str, Secret("user", strip=True)]
+    raw_user: Annotated[str, Secret("user")]
+
+
+@pytest.fixture
+def secrets(tmp_path):
+    (tmp_path / "key").write_bytes(DER)
+    (tmp_path / "user").write_bytes(b"admin\r\n\n")
+    return tmp_path
+
+
+def test_binary_and_strip(secrets):
+    state = Secret.load_with(dir=secrets)
+    config = load_settings(Config, loaders=state)
+    assert config == Config(key=DER, user="admin", raw_user="admin\n\n")
+
+
+def test_strip_reads_only_stripped_contents(tmp_path, monkeypatch):
+    (tmp_path / "user").write_text("admin" + "\n" * 100)
+
+    sizes = record_calls(monkeypatch, secret, "read_exact", key=lambda fd, size: size)
+
+    @dataclass
+    class Stripped:
+        user: Annotated[bytes, Secret("user", binary=True, strip=True)]
+
+    config = load_settings(Stripped, loaders=Secret.load_with(dir=tmp_path))
+    assert config == Stripped(user=b"admin")
+    assert sizes == [5]
+
+
+def test_large_binary_is_mapped(tmp_path, monkeypatch):
+    monkeypatch.setattr(secret, "MMAP_THRESHOLD", 16)
+    (tmp_path / "key").write_bytes(DER * 4)
+
+    value = secret.read_bounded(
+        tmp_path / "key", binary=True, strip=True, max_bytes=None
+    )
+    assert isinstance(value, memoryview)
+    assert value == DER * 3 + DER[:-1]
+
+
+@pytest.mark.parametrize("options", [{}, {"cache": SecretCache()}, {"atomic": True}])
+def test_max_bytes(secrets, options):
+    state = Secret.load_with(dir=secrets, max_bytes=8, **options)
+    with pytest.raises(ValueError) as e:
+        load_settings(Config, loaders=state)
+    assert "bytes, exceeding `max_bytes` (8)" in str(e.value)
+
+    state = Secret.load_with(dir=secrets, max_bytes=len(DER), **options)
+    config = load_settings(Config, loaders=state)
+    assert config == Config(key=DER, user="admin", raw_user="admin\n\n")
+
+
+def test_cache(secrets):
+    state = Secret.load_with(dir=secrets, cache=SecretCache())
+    config = load_settings(Config, loaders=state)
+    assert config == Config(key=DER, user="admin", raw_user="admin\n\n")
+
+    # Cached contents are shared between differently configured fields.
+    assert len(state.cache or ()) == 2
+
+
+def test_atomic(secrets):
+    generation = secrets / "..1"
+    generation.mkdir()
+    for name in ("key", "user"):
+        (secrets / name).rename(generation / name)
+        (secrets / name).symlink_to(f"..data/{name}")
+    (secrets / "..data").symlink_to("..1")
+
+    state = Secret.load_with(dir=secrets, atomic=True)
+    config = load_settings(Config, loaders=state)
+    assert config == Config(key=DER, user="admin", raw_user="admin\n\n")
+
+
+def test_with_name_preserves_options():
+    loader = Secret("key", binary=True, strip=True).with_name("other")
+    assert (loader.names, loader.binary, loader.strip) == (("other",), True, True)
@@ -0,0 +1,152 @@
+import os
+import pickle
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from typing_extensions import Annotated
+
+from dataclass_settings import Secret, load_settings
+from dataclass_settings.loaders import secret
+from dataclass_settings.loaders.secret import SecretCache
+from tests.utils import record_calls
+
+
+@dataclass
+class Config:
+    user: Annotated[str, Secret("user")]
+    host: Annotated[str, Secret("host")] = "localhost"
+
+
+def test_shared_between_loads(tmp_path, monkeypatch):
+    (tmp_path / "user").write_text("admin")
+
+    cache = SecretCache()
+    reads = record_calls(
+        monkeypatch, secret, "read_buffer", key=lambda file, size: file.name
+    )
+
+    for _ in range(3):
+        # A fresh state per load, but the same cache.
+        state = Secret.load_with(dir=tmp_path, cache=cache)
+        assert load_settings(Config, loaders=state) == Config(user="admin")
+
+    assert reads == [str(tmp_path / "user")]
+    assert len(cache) == 1
+    assert cache.size == len("admin")
+
+
+def test_replaced_while_reading(tmp_path, monkeypatch):
+    file = tmp_path / "user"
+    file.write_text("admin")
+
+    def rotate(call):
+        if call == 1:
+            new = tmp_path / "user.new"
+            new.write_text("root!")
+            os.replace(new, file)
+
+    record_calls(monkeypatch, secret.os, "fstat", after=rotate)
+
+    # The contents read are cached under the key of the file they were read from.
+    cache = SecretCache()
+    assert cache.get(file) == ("admin", False)
+    assert cache.get(file) == ("root!", False)
+
+
+def test_rotated_secret_is_reread(tmp_path):
+    file = tmp_path / "user"
+    file.write_text("admin")
+
+    cache = SecretCache()
+    assert cache.get(file) == ("admin", False)
+    assert cache.get(file) == ("admin", True)
+    (buffer,) = cache._entries.values()
+
+    # Rotate the secret, e.g. a k8s secret update (which swaps in a new file).
+    new = tmp_path / "user.new"
+    new.write_text("root!")
+    os.replace(new, file)
+
+    assert cache.get(file) == ("root!", False)
+    assert len(cache) == 1
+
+    # The replaced contents are wiped.
+    assert buffer == bytearray(len("admin"))
+
+
+def test_concurrent_miss_keeps_path(tmp_path):
+    file = tmp_path / "user"
+    file.write_text("admin")
+
+    class Missing(OrderedDict):
+        """Misses every lookup, as two threads missing the same key at once would."""
+
+        def get(self, key, default=None):
+            return default
+
+    cache = SecretCache()
+    cache._entries = Missing()
+    assert cache.get(file) == ("admin", False)
+    assert cache.get(file) == ("admin", False)
+    (buffer,) = cache._entries.values()
+
+    new = tmp_path / "user.new"
+    new.write_text("root!")
+    os.replace(new, file)
+
+    assert cache.get(file) == ("root!", False)
+    assert len(cache) == 1
+    assert buffer == bytearray(len("admin"))
+
+
+def test_bounded_lru(tmp_path):
+    for name in "abc":
+        (tmp_path / name).write_text(name * 4)
+
+    cache = SecretCache(max_bytes=8)
+    cache.get(tmp_path / "a")
+    cache.get(tmp_path / "b")
+    buffers = list(cache._entries.values())
+
+    cache.get(tmp_path / "a")  # Now most recently used.
+    cache.get(tmp_path / "c")
+
+    assert cache.size == 8
+    assert cache.get(tmp_path / "a") == ("aaaa", True)
+    assert cache.get(tmp_path / "b") == ("bbbb", False)
+    assert buffers[1] == bytearray(4)
+
+
+def test_oversized_value_is_not_cached(tmp_path):
+    (tmp_path / "big").write_text("x" * 10)
+
+    cache = SecretCache(max_bytes=4)
+    assert cache.get(tmp_path / "big") == ("x" * 10, False)
+    assert len(cache) == 0
+
+
+def test_missing_and_clear(tmp_path):
+    (tmp_path / "user").write_text("admin")
+
+    cache = SecretCache()
+    assert cache.get(tmp_path / "missing") == (None, False)
+
+    cache.get(tmp_path / "user")
+    (buffer,) = cache._entries.values()
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
+    assert buffer == bytearray(5)
+
+
+def test_process_wide_cache(tmp_path):
+    (tmp_path / "user").write_text("admin")
+
+    state = Secret.load_with(dir=tmp_path, cache=True)
+    assert state.cache is secret.shared_cache
+    assert load_settings(Config, loaders=state) == Config(user="admin")
+
+    restored = pickle.loads(pickle.dumps(state.cache))  # noqa: S301
+    assert len(restored) == 0
+    assert restored.max_bytes == state.cache.max_bytes
+    secret.shared_cache.clear()
@@ -0,0 +1,224 @@
+import pickle
+import sqlite3
+import time
+from dataclasses import dataclass
+
+import pytest
+from typing_extensions import Annotated
+
+from dataclass_settings import (
+    Env,
+    LoadTimeoutError,
+    Sqlite,
+    load_settings,
+    load_settings_many,
+    plan,
+)
+from dataclass_settings.context import Context
+from dataclass_settings.loaders import sqlite
+from dataclass_settings.loaders.sqlite import quote_identifier
+from tests.utils import record_calls
+
+
+@dataclass
+class Database:
+    host: Annotated[str, Sqlite("db_host")]
+    port: Annotated[int, Sqlite("db_port")] = 5432
+
+
+@dataclass
+class Config:
+    name: Annotated[str, Env("NAME"), Sqlite("name")]
+    database: Database
+    debug: Annotated[bool, Sqlite("debug")] = False
+
+
+def create(file, rows, table="settings", key="key", value="value"):
+    table, key, value = (quote_identifier(name) for name in (table, key, value))
+
+    connection = sqlite3.connect(file)
+    with connection:
+        connection.execute(f"CREATE TABLE IF NOT EXISTS {table} ({key}, {value})")
+        connection.executemany(
+            f"INSERT INTO {table} VALUES (?, ?)",  # noqa: S608
+            rows.items(),
+        )
+    connection.close()
+
+
+@pytest.fixture
+def database(tmp_path):
+    file = tmp_path / "settings.db"
+    create(file, {"name": "app", "db_host": "db", "debug": 1, "unused": "x"})
+    return file
+
+
+@pytest.fixture
+def queries(monkeypatch):
+    return record_calls(
+        monkeypatch,
+        sqlite,
+        "query",
+        key=lambda connection, select, names: sorted(names),
+    )
+
+
+def test_single_batched_query(database, queries):
+    state = Sqlite.load_with(database)
+    config = load_settings(Config, loaders=[Env.load_with(env={}), state])
+    assert config == Config(name="app", database=Database(host="db"), debug=True)
+
+    # Every name the class may need is fetched at once, before any field is loaded.
+    assert queries == [["db_host", "db_port", "debug", "name"]]
+
+
+def test_cached_by_data_version(database, queries):
+    state = Sqlite.load_with(database)
+    loaders = [Env.load_with(env={}), state]
+
+    load_settings(Config, loaders=loaders)
+    load_settings(Config, loaders=loaders)
+    assert len(queries) == 1
+
+    create(database, {"db_port": 5433})
+    config = load_settings(Config, loaders=loaders)
+    assert config.database.port == 5433
+    assert len(queries) == 2
+
+
+def test_classes_share_snapshot(database, queries):
+    @dataclass
+    class Other:
+        name: Annotated[str, Sqlite("name")]
+        unused: Annotated[str, Sqlite("unused")]
+
+    state = Sqlite.load_with(database)
+    loaders = [Env.load_with(env={}), state]
+    for _ in range(3):
+        load_settings(Config, loaders=loaders)
+        assert load_settings(Other, loaders=loaders) == Other(name="app", unused="x")
+
+    # The second class only fetches the names the first didn't.
+    assert queries == [["db_host", "db_port", "debug", "name"], ["unused"]]
+
+    create(database, {"other": "y"})
+    load_settings(Other, loaders=loaders)
+    load_settings(Config, loaders=loaders)
+    assert queries[2:] == [["name", "unused"], ["db_host", "db_port", "debug"]]
+
+
+def test_load_many_shares_state(database, queries):
+    state = Sqlite.load_with(database)
+    envs = [Env.load_with(env={"NAME": str(i)}) for i in range(3)]
+
+    results = list(load_settings_many(Config, envs, loaders=[state]))
+    assert [config.name for config in results] == ["0", "1", "2"]
+    assert len(queries) == 1
+
+
+def test_names_compiled_once_per_class(database, monkeypatch, queries):
+    @dataclass
+    class Compiled:
+        database: Database
+
+    walks = record_calls(monkeypatch, plan, "walk")
+    state = Sqlite.load_with(database)
+
+    load_settings(Compiled, loaders=state)
+    load_settings(Compiled, loaders=state)
+    assert walks.count(Compiled) == 1
+
+    # Names depend on `nested_delimiter`, so they're compiled separately.
+    create(database, {"database_db_host": "nested"})
+    config = load_settings(Compiled, loaders=state, nested_delimiter=True)
+    assert config.database.host == "nested"
+    assert walks.count(Compiled) == 2
+    assert queries == [["db_host", "db_port"], ["database_db_host", "database_db_port"]]
+
+
+def test_prepare_within_budget(database, monkeypatch):
+    def slow_fetch(self, names):
+        time.sleep(0.2)
+
+    monkeypatch.setattr(sqlite.SqliteState, "fetch", slow_fetch)
+    state = Sqlite.load_with(database)
+
+    start = time.perf_counter()
+    with pytest.raises(LoadTimeoutError) as e:
+        load_settings(
+            Config, loaders=state, timeouts={Sqlite: 0.01}, on_timeout="raise"
+        )
+    assert time.perf_counter() - start < 0.2
+    assert str(e.value) == "`Sqlite` exceeded its 0.010s budget loading `Config`"
+
+
+def test_infer_names(database):
+    @dataclass
+    class Db:
+        host: Annotated[str, Sqlite()]
+
+    @dataclass
+    class Inferred:
+        db: Db
+        name: Annotated[str, Sqlite()]
+
+    state = Sqlite.load_with(database)
+    config = load_settings(
+        Inferred, loaders=state, infer_names=True, nested_delimiter="_"
+    )
+    assert config == Inferred(db=Db(host="db"), name="app")
+
+
+def test_custom_table(tmp_path):
+    file = tmp_path / "settings.db"
+    create(file, {"name": "app"}, table='my "table"', key="k", value="v")
+
+    @dataclass
+    class Named:
+        name: Annotated[str, Sqlite("name")]
+
+    state = Sqlite.load_with(
+        file, table='my "table"', key_column="k", value_column="v", immutable=True
+    )
+    assert load_settings(Named, loaders=state) == Named(name="app")
+
+
+def test_missing_database(tmp_path):
+    @dataclass
+    class Optional:
+        debug: Annotated[bool, Sqlite("debug")] = False
+
+    state = Sqlite.load_with(tmp_path / "missing.db")
+    assert load_settings(Optional, loaders=state) == Optional()
+
+
+def test_read_only(database):
+    state = Sqlite.load_with(database)
+    state.fetch(["name"])
+
+    assert state._connection is not None
+    with pytest.raises(sqlite3.OperationalError):
+        state._connection.execute("DELETE FROM settings")
+
+
+def test_requires_file():
+    with pytest.raises(ValueError) as e:
+        load_settings(Database, loaders=Sqlite)
+    assert "requires a `file` argument" in str(e.value)
+
+
+def test_describe():
+    state = Sqlite.load_with("settings.db")
+    context = Context(path=["database"], field_name="host", nested_delimiter=True)
+    assert Sqlite("host").describe(context, state) == [
+        "settings.db:settings[database_host]"
+    ]
+
+
+def test_pickle_state(database):
+    state = Sqlite.load_with(database)
+    load_settings(Database, loaders=state)
+
+    restored = pickle.loads(pickle.dumps(state))  # noqa: S301
+    assert restored.snapshot == state.snapshot
+    assert load_settings(Database, loaders=restored) == Database(host="db")
@@ -1,3 +1,4 @@
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -9,7 +10,8 @@ from pydantic.dataclasses import dataclass as pydantic_dataclass
 from typing_extensions import Annotated
 
 from dataclass_settings import Toml, load_settings
-from tests.utils import env_setup, skip_under
+from dataclass_settings.context import LoadHistory
+from tests.utils import env_setup, record_calls, requires_parser
 
 pyproject = Path(__file__).parent.parent.parent / "pyproject.toml"
 
@@ -37,7 +39,7 @@ class PDataclassMissingRequired:
     asdf: Annotated[str, Toml("asdf", file=pyproject)]
 
 
-@skip_under(3, 11, reason="Requires tomllib")
+@requires_parser("toml")
 @pytest.mark.parametrize(
     "config_class, exc_class",
     [
@@ -86,7 +88,7 @@ class PDataclassRequired:
     ignoreme: str = "asdf"
 
 
-@skip_under(3, 11, reason="Requires tomllib")
+@requires_parser("toml")
 @pytest.mark.parametrize(
     "config_class",
     [
@@ -132,7 +134,7 @@ class PDataclassMissingOptionalInferred:
     ignoreme: str = "asdf"
 
 
-@skip_under(3, 11, reason="Requires tomllib")
+@requires_parser("toml")
 @pytest.mark.parametrize(
     "config_class",
     [
@@ -152,7 +154,7 @@ def test_missing_optional_inferred_name(config_class):
     )
 
 
-@skip_under(3, 11, reason="Requires tomllib")
+@requires_parser("toml")
 @pytest.mark.parametrize(
     "config_class, exc_class", [(BaseModel, ValidationError), (Struct, TypeError)]
 )
@@ -167,7 +169,7 @@ def test_empty_toml(config_class, exc_class, tmp_path: Path):
         load_settings(Config)
 
 
-@skip_under(3, 11, reason="Requires tomllib")
+@requires_parser("toml")
 def test_toml_int(tmp_path: Path):
     toml_file = tmp_path / "config.toml"
     toml_file.write_text("[postgres]\nport = 42")
@@ -181,7 +183,7 @@ def test_toml_int(tmp_path: Path):
     assert config.postgres == {"port": 42}
 
 
-@skip_under(3, 11, reason="Requires tomllib")
+@requires_parser("toml")
 def test_load_with():
     @dataclass
     class Example:
@@ -190,3 +192,212 @@ def test_load_with():
     loader = Toml.load_with(file="pyproject.toml")
     example: Example = load_settings(Example, extra_loaders=loader)
     assert example == Example(name="dataclass-settings")
+
+
+@requires_parser("toml")
+def test_layered_files(tmp_path: Path, monkeypatch):
+    from dataclass_settings.loaders import toml
+
+    base = tmp_path / "base.toml"
+    base.write_text(
+        '[db]\nhost = "base"\nport = 5432\noptions = ["a"]\n[app]\nname = "app"'
+    )
+    prod = tmp_path / "prod.toml"
+    prod.write_text('[db]\nhost = "prod"\noptions = ["b", "c"]')
+    local = tmp_path / "local.toml"
+    local.write_text("[db.pool]\nsize = 4\n[app]\ndebug = true")
+
+    reads = record_calls(monkeypatch, toml, "read_toml")
+
+    @dataclass
+    class Config:
+        host: Annotated[str, Toml("db.host")]
+        port: Annotated[int, Toml("db.port")]
+        options: Annotated[list, Toml("db.options")]
+        pool_size: Annotated[int, Toml("db.pool.size")]
+        name: Annotated[str, Toml("app.name")]
+        debug: Annotated[bool, Toml("app.debug")]
+
+    history = LoadHistory()
+    state = Toml.load_with(file=[base, prod, local])
+    config = load_settings(Config, loaders=state, emit_history=history)
+    assert config == Config(
+        host="prod", port=5432, options=["b", "c"], pool_size=4, name="app", debug=True
+    )
+
+    # Each file is parsed once, regardless of the number of fields.
+    assert reads == [base, prod, local]
+
+    # The per-file documents are left unmodified by the merge.
+    assert state.value[base]["db"] == {"host": "base", "port": 5432, "options": ["a"]}
+
+    assert [event.name for event in history.events] == [
+        f"db.host (from {prod})",
+        f"db.port (from {base})",
+        f"db.options (from {prod})",
+        f"db.pool.size (from {local})",
+        f"app.name (from {base})",
+        f"app.debug (from {local})",
+    ]
+
+
+@requires_parser("toml")
+def test_layered_source_only_formatted_with_history(tmp_path: Path, monkeypatch):
+    from dataclass_settings.loaders import toml
+
+    base = tmp_path / "base.toml"
+    base.write_text('[app]\nname = "base"\n')
+    prod = tmp_path / "prod.toml"
+    prod.write_text('[app]\nname = "prod"\n')
+
+    lookups = record_calls(
+        monkeypatch, toml.TomlDocument, "source", key=lambda self, segments: segments
+    )
+
+    @dataclass
+    class Config:
+        name: Annotated[str, Toml("app.name")]
+
+    state = Toml.load_with(file=[base, prod])
+    assert load_settings(Config, loaders=state) == Config(name="prod")
+    assert lookups == []
+
+    history = LoadHistory()
+    load_settings(Config, loaders=state, emit_history=history)
+    assert lookups == []
+    assert history.format().count(f"app.name (from {prod})") == 1
+    assert lookups == [["app", "name"]]
+
+
+@requires_parser("toml")
+def test_layered_describe(tmp_path: Path):
+    from dataclass_settings.context import Context
+
+    context = Context(field_name="name")
+    state = Toml.load_with(file=["base.toml", "prod.toml"])
+    assert Toml("app.name").describe(context, state) == [
+        "prod.toml:app.name",
+        "base.toml:app.name",
+    ]
+
+
+@requires_parser("toml")
+def test_directory(tmp_path: Path, monkeypatch):
+    from dataclass_settings.context import LoadHistory
+    from dataclass_settings.loaders import toml
+
+    base = tmp_path / "base.toml"
+    base.write_text('[db]\nhost = "base"\nport = 5432\n')
+
+    conf_d = tmp_path / "conf.d"
+    conf_d.mkdir()
+    (conf_d / "20-prod.toml").write_text('[db]\nhost = "prod"\n')
+    (conf_d / "10-pool.toml").write_text('[db]\nhost = "pool"\npool = 4\n')
+    (conf_d / "30-ignored.conf").write_text('[db]\nhost = "ignored"\n')
+
+    reads = record_calls(monkeypatch, toml, "read_toml")
+
+    @dataclass
+    class Config:
+        host: Annotated[str, Toml("db.host")]
+        port: Annotated[int, Toml("db.port")]
+        pool: Annotated[int, Toml("db.pool")]
+
+    history = LoadHistory()
+    state = Toml.load_with(file=base, directory=conf_d)
+    config = load_settings(Config, loaders=state, emit_history=history)
+    assert config == Config(host="prod", port=5432, pool=4)
+    assert sorted(reads) == [base, conf_d / "10-pool.toml", conf_d / "20-prod.toml"]
+    assert [event.name for event in history.events] == [
+        f"db.host (from {conf_d / '20-prod.toml'})",
+        f"db.port (from {base})",
+        f"db.pool (from {conf_d / '10-pool.toml'})",
+    ]
+
+    # An unchanged directory is served from the state's cache.
+    reads.clear()
+    listings = record_calls(monkeypatch, toml, "list_directory")
+    load_settings(Config, loaders=state)
+    assert reads == []
+    assert listings == [conf_d]
+
+    # Adding a fragment (or changing one) invalidates it, for the same state.
+    (conf_d / "40-local.toml").write_text("[db]\npool = 8\n")
+    config = load_settings(Config, loaders=state)
+    assert config == Config(host="prod", port=5432, pool=8)
+    assert len(reads) == 3
+
+    reads.clear()
+    local = conf_d / "40-local.toml"
+    mtime = local.stat().st_mtime_ns
+    local.write_text("[db]\npool = 9\n")
+    os.utime(local, ns=(mtime + 1_000_000, mtime + 1_000_000))
+    assert load_settings(Config, loaders=state).pool == 9
+    assert len(reads) == 3
+
+    reads.clear()
+    local.unlink()
+    assert load_settings(Config, loaders=state).pool == 4
+    assert len(reads) == 2
+
+    # Only the latest listing's documents are kept.
+    assert len([key for key in state.value if isinstance(key, tuple)]) == 2
+
+
+@requires_parser("toml")
+def test_directory_missing(tmp_path: Path):
+    from dataclass_settings.context import Context
+
+    @dataclass
+    class Config:
+        host: Annotated[str, Toml("db.host")] = "default"
+
+    state = Toml.load_with(directory=tmp_path / "missing", pattern="*.conf")
+    assert load_settings(Config, loaders=state) == Config()
+
+    context = Context(field_name="host")
+    assert Toml("db.host").describe(context, state) == [
+        f"{tmp_path / 'missing' / '*.conf'}:db.host"
+    ]
+
+
+@requires_parser("toml")
+def test_flat_index():
+    from dataclass_settings.loaders.toml import TomlDocument
+
+    document = TomlDocument({"db": {"pool": {"size": 4}}, "app": {"name": "app"}})
+    assert document.get("db.pool.size") == 4
+    assert document.get("db.pool") == {"size": 4}
+    assert document.get("db.missing") is None
+    assert document.get("missing.key") is None
+
+    # Only the looked up top-level tables are indexed.
+    assert document.index == {
+        "db": {"db": {"pool": {"size": 4}}, "db.pool": {"size": 4}, "db.pool.size": 4},
+        "missing": {},
+    }
+
+
+@requires_parser("toml")
+def test_nested_keys(tmp_path: Path):
+    file = tmp_path / "config.toml"
+    file.write_text('name = "app"\n[db]\nhost = "db"\n[db.pool]\nsize = 4\n')
+
+    @dataclass
+    class Pool:
+        size: Annotated[int, Toml()]
+
+    @dataclass
+    class Db:
+        host: Annotated[str, Toml()]
+        pool: Pool
+        port: Annotated[int, Toml("port")] = 5432
+
+    @dataclass
+    class Config:
+        name: Annotated[str, Toml()]
+        db: Db
+
+    state = Toml.load_with(file=file, nested=True)
+    config = load_settings(Config, loaders=state, infer_names=True)
+    assert config == Config(name="app", db=Db(host="db", pool=Pool(size=4)))
@@ -0,0 +1,156 @@
+import io
+import subprocess
+import sys
+from dataclasses import dataclass
+
+import pytest
+from typing_extensions import Annotated
+
+from dataclass_settings import Env, Json, Row, Secret, cli
+from dataclass_settings.cli import main, percentile
+from tests.utils import env_setup, record_calls
+
+
+@dataclass
+class Database:
+    host: Annotated[str, Env("HOST"), Secret("host")] = "localhost"
+
+
+@dataclass
+class Config:
+    name: Annotated[str, Env("NAME")]
+    database: Database
+    debug: bool = False
+
+
+def run(*args: str) -> tuple[int, str]:
+    out = io.StringIO()
+    code = main(args, out=out)
+    return code, out.getvalue()
+
+
+def test_explain():
+    code, output = run(
+        "explain",
+        "tests.test_cli:Config",
+        "--nested-delimiter",
+        "--secret-dir",
+        "/foo",
+    )
+    assert code == 0
+    assert output == (
+        "name:\n"
+        "  Env: NAME\n"
+        "database.host:\n"
+        "  Env: DATABASE_HOST\n"
+        "  Secret: /foo/database_host\n"
+        "debug:\n"
+        "  (no loaders)\n"
+    )
+
+
+def test_load():
+    with env_setup(env={"NAME": "app"}, files={"/run/secrets/host": "db"}):
+        code, output = run("load", "tests.test_cli:Config")
+
+    assert code == 0
+    assert "  name: Env 'NAME'\n" in output
+    assert "  database.host: Secret '/run/secrets/host'\n" in output
+    assert "Timings:\n" in output
+
+
+def test_load_failure():
+    with env_setup():
+        code, output = run("load", "tests.test_cli:Config")
+
+    assert code == 1
+    assert "  name: (not found)\n" in output
+    assert "Failed to load `Config`" in output
+
+
+def test_profile():
+    with env_setup(env={"NAME": "app"}):
+        code, output = run("profile", "tests.test_cli:Config", "-n", "5")
+
+    assert code == 0
+    assert "iterations: 5\n" in output
+    assert "first: " in output
+    assert "p50: " in output
+    assert "p99: " in output
+    assert "peak allocated per load: " in output
+
+
+def test_profile_failure():
+    with env_setup():
+        code, output = run("profile", "tests.test_cli:Config", "-n", "5")
+
+    assert code == 1
+    assert "name:\n - Used `Env` to read 'NAME', found 'None'. Skipping.\n" in output
+    assert "Failed to load `Config`" in output
+    assert "iterations: " not in output
+
+
+def test_invalid_source():
+    with pytest.raises(SystemExit):
+        run("explain", "tests.test_cli")
+
+
+def test_bundle(tmp_path):
+    from dataclass_settings.loaders.bundle import open_bundle
+
+    (tmp_path / "host").write_text("db")
+    file = tmp_path / "secrets.bundle"
+
+    code, output = run("bundle", str(tmp_path), str(file))
+    assert code == 0
+    assert output == f"Bundled 1 secrets from {tmp_path} into {file}\n"
+
+    bundle = open_bundle(file)
+    assert bundle is not None
+    assert bundle.get("host") == "db"
+
+
+def test_percentile():
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([1.0], 99) == 1
+    assert percentile([], 50) == 0
+
+
+def test_module_entrypoint():
+    result = subprocess.run(
+        [sys.executable, "-m", "dataclass_settings", "--help"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert "explain" in result.stdout
+
+
+def test_profile_fresh_states(monkeypatch):
+    states = record_calls(
+        monkeypatch,
+        cli,
+        "load_settings",
+        key=lambda source_cls, *, loaders, **_: loaders[1],
+    )
+
+    with env_setup(env={"NAME": "app"}):
+        code, _ = run("profile", "tests.test_cli:Config", "-n", "3")
+
+    assert code == 0
+    assert len({id(state) for state in states}) == len(states) > 3
+
+
+@dataclass
+class JsonConfig:
+    name: Annotated[str, Json("name")]
+    row: Annotated[str, Row("row")] = "row"
+
+
+def test_json_option():
+    code, output = run("explain", "tests.test_cli:JsonConfig", "--json-file", "a.json")
+    assert code == 0
+    assert "name:\n  Json: a.json:name\n" in output
+    assert "Unresolved loaders (skipped): Row\n" in output
@@ -0,0 +1,128 @@
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import pytest
+from typing_extensions import Annotated
+
+from dataclass_settings import Secret, Toml, class_inspect, load_settings
+from dataclass_settings.class_inspect import ClassCache
+from dataclass_settings.loader import CacheState
+from dataclass_settings.loaders import secret, toml
+from tests.utils import record_calls, requires_parser
+
+THREADS = 32
+
+
+def run_concurrently(fn, count: int = THREADS) -> list:
+    barrier = threading.Barrier(count)
+
+    def run(_):
+        barrier.wait()
+        return fn()
+
+    with ThreadPoolExecutor(count) as pool:
+        return list(pool.map(run, range(count)))
+
+
+def test_shared_secret_state_single_flight(tmp_path, monkeypatch):
+    @dataclass
+    class Config:
+        user: Annotated[str, Secret("user")]
+        host: Annotated[str, Secret("host")]
+        missing: Annotated[str, Secret("missing")] = "default"
+
+    (tmp_path / "user").write_text("admin")
+    (tmp_path / "host").write_text("db")
+
+    calls = record_calls(monkeypatch, secret, "read_file", delay=0.01)
+    state = Secret.load_with(dir=tmp_path)
+
+    results = run_concurrently(lambda: load_settings(Config, loaders=state))
+    assert results == [Config(user="admin", host="db")] * THREADS
+
+    assert calls.count(tmp_path / "user") == 1
+    assert calls.count(tmp_path / "host") == 1
+    assert set(state.value) == {tmp_path / "user", tmp_path / "host"}
+
+
+@requires_parser("toml")
+def test_shared_toml_state_single_flight(tmp_path, monkeypatch):
+    @dataclass
+    class Config:
+        name: Annotated[str, Toml("project.name")]
+        version: Annotated[str, Toml("project.version")]
+
+    file = tmp_path / "config.toml"
+    file.write_text('[project]\nname = "foo"\nversion = "1.0"\n')
+
+    calls = record_calls(monkeypatch, toml, "read_toml", delay=0.01)
+    state = Toml.load_with(file=file)
+
+    results = run_concurrently(lambda: load_settings(Config, loaders=state))
+    assert results == [Config(name="foo", version="1.0")] * THREADS
+    assert calls == [file]
+
+
+def test_get_or_load_failure_is_shared_but_not_cached():
+    state: CacheState = CacheState(object)
+    error = OSError()
+
+    def fail():
+        time.sleep(0.01)
+        raise error
+
+    def load():
+        try:
+            return state.get_or_load("key", fail)
+        except OSError as e:
+            return e
+
+    assert run_concurrently(load) == [error] * THREADS
+    assert state.get_or_load("key", lambda: "value") == ("value", False)
+
+
+def test_cache_state_is_picklable(tmp_path):
+    state = Secret.load_with(dir=tmp_path)
+    state.get_or_load("key", lambda: "value")
+
+    restored = pickle.loads(pickle.dumps(state))  # noqa: S301
+    assert restored.value == {"key": "value"}
+    assert restored.get_or_load("other", lambda: "new") == ("new", False)
+
+
+@pytest.mark.parametrize("count", [1, THREADS])
+def test_none_is_not_cached(count):
+    state: CacheState = CacheState(object)
+    results = run_concurrently(lambda: state.get_or_load("key", lambda: None), count)
+    assert all(value is None for value, _ in results)
+    assert state.value == {}
+
+
+def test_class_cache_setdefault_and_collection():
+    import gc
+
+    cache: ClassCache[int] = ClassCache()
+
+    class Foo:
+        pass
+
+    assert cache.setdefault(Foo, 1) == 1
+    assert cache.setdefault(Foo, 2) == 1
+    assert cache[Foo] == 1
+    assert Foo in cache
+
+    del Foo
+    gc.collect()
+    assert len(cache) == 0
+
+
+def test_concurrent_field_inspection_is_shared():
+    @dataclass
+    class Config:
+        name: Annotated[str, Secret("name")] = "default"
+
+    results = run_concurrently(lambda: class_inspect.fields(Config))
+    assert all(result is results[0] for result in results)
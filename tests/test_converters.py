@@ -0,0 +1,130 @@
+import datetime
+from dataclasses import dataclass
+from decimal import Decimal
+from enum import Enum, IntEnum, IntFlag
+from typing import Dict, FrozenSet, List, Literal, Optional, Sequence, Set, Tuple, Union
+
+import pytest
+from attr import dataclass as attr_dataclass
+from typing_extensions import Annotated
+
+from dataclass_settings import Env, load_settings
+from dataclass_settings.class_inspect import compile_converter
+from tests.utils import env_setup
+
+
+class Color(Enum):
+    red = "r"
+    green = "g"
+
+
+class Level(Enum):
+    low = 1
+    high = 2
+
+
+class Priority(IntEnum):
+    none = 0
+    some = 1
+
+
+class Permission(IntFlag):
+    none = 0
+    read = 1
+
+
+class Marker(str, Enum):
+    empty = ""
+    star = "*"
+
+
+@pytest.mark.parametrize(
+    "annotation, value, expected",
+    [
+        (str, "foo", "foo"),
+        (int, "8080", 8080),
+        (int, 8080, 8080),
+        (float, "1.5", 1.5),
+        (Decimal, "3", Decimal("3")),
+        (bool, "false", False),
+        (bool, "FALSE", False),
+        (bool, "0", False),
+        (bool, "off", False),
+        (bool, "true", True),
+        (bool, "Yes", True),
+        (bool, "1", True),
+        (bool, True, True),
+        (List[int], "1, 2,3", [1, 2, 3]),
+        (List[int], "[1, 2]", [1, 2]),
+        (List[int], "", []),
+        (List[str], ["a", "b"], ["a", "b"]),
+        (Sequence[int], "1,2", [1, 2]),
+        (Set[str], "a,b,a", {"a", "b"}),
+        (FrozenSet[int], "1,2", frozenset({1, 2})),
+        (Tuple[int, ...], "1,2", (1, 2)),
+        (Tuple[int, str], "1,b", (1, "b")),
+        (Dict[str, int], '{"a": "1"}', {"a": 1}),
+        (Dict[str, int], {"a": 1}, {"a": 1}),
+        (Color, "r", Color.red),
+        (Color, "green", Color.green),
+        (Level, "2", Level.high),
+        (Priority, "0", Priority.none),
+        (Priority, "none", Priority.none),
+        (Permission, "0", Permission.none),
+        (Marker, "", Marker.empty),
+        (Literal["a", "b"], "b", "b"),
+        (Literal[1, 2], "2", 2),
+        (Union[int, str], "3", 3),
+        (Union[int, str], "three", "three"),
+        (List[Optional[int]], "1,null", [1, None]),
+        (datetime.date, "2024-01-02", datetime.date(2024, 1, 2)),
+        (
+            datetime.datetime,
+            "2024-01-02T03:04:05",
+            datetime.datetime(2024, 1, 2, 3, 4, 5),
+        ),
+    ],
+)
+def test_convert(annotation, value, expected):
+    assert compile_converter(annotation)(value) == expected
+
+
+@pytest.mark.parametrize(
+    "annotation, value",
+    [
+        (bool, "maybe"),
+        (int, "eight"),
+        (Literal["a", "b"], "c"),
+        (Color, "blue"),
+        (Tuple[int, int], "1"),
+    ],
+)
+def test_convert_invalid(annotation, value):
+    with pytest.raises(ValueError):
+        compile_converter(annotation)(value)
+
+
+def test_cached():
+    assert compile_converter(List[int]) is compile_converter(List[int])
+
+
+@dataclass
+class DataclassConfig:
+    debug: Annotated[bool, Env("DEBUG")] = True
+    ports: Annotated[List[int], Env("PORTS")] = ()  # type: ignore
+    color: Annotated[Optional[Color], Env("COLOR")] = None
+
+
+@attr_dataclass
+class AttrsConfig:
+    debug: Annotated[bool, Env("DEBUG")] = True
+    ports: Annotated[List[int], Env("PORTS")] = ()  # type: ignore
+    color: Annotated[Optional[Color], Env("COLOR")] = None
+
+
+@pytest.mark.parametrize("config_class", [DataclassConfig, AttrsConfig])
+def test_load(config_class):
+    with env_setup({"DEBUG": "false", "PORTS": "80,443", "COLOR": "green"}):
+        config = load_settings(config_class)
+
+    assert config == config_class(debug=False, ports=[80, 443], color=Color.green)
@@ -0,0 +1,71 @@
+import textwrap
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel, ValidationError
+from typing_extensions import Annotated
+
+from dataclass_settings import Env, Secret, Toml, load_settings
+from dataclass_settings.context import Context, LoadHistory
+from tests.utils import env_setup, requires_parser
+
+
+def test_history_disabled_is_noop():
+    context = Context().enter("foo")
+    context.record_loaded_value(Env("FOO"), "FOO", "1")
+
+    assert context.history is None
+    assert context.generate_load_history() == ""
+
+
+def test_history_is_bounded():
+    history = LoadHistory(limit=2)
+    context = Context(history=history).enter("foo")
+    for i in range(5):
+        context.record_loaded_value(Env("FOO"), f"FOO{i}", str(i))
+
+    assert [event.name for event in history.events] == ["FOO3", "FOO4"]
+
+
+def test_secret_values_redacted(caplog):
+    class Config(BaseModel):
+        foo: Annotated[int, Secret("foo")]
+        bar: Annotated[int, Secret("bar")]
+
+    with env_setup(files={"/run/secrets/foo": "hunter2"}), pytest.raises(
+        ValidationError
+    ):
+        load_settings(Config, emit_history=True)
+
+    assert caplog.messages[0] == textwrap.dedent(
+        """\
+        foo:
+         - Used `Secret` to read '/run/secrets/foo', found '***'.
+
+        bar:
+         - Used `Secret` to read '/run/secrets/bar', found 'None'. Skipping.
+        """
+    )
+
+
+@requires_parser("toml")
+def test_toml_records_key_not_document(caplog, tmp_path: Path):
+    toml_file = tmp_path / "config.toml"
+    toml_file.write_text('[postgres]\nport = "not a port"\nhost = "localhost"')
+
+    class Config(BaseModel):
+        port: Annotated[int, Toml("postgres.port", file=toml_file)]
+        user: Annotated[str, Toml("postgres.user", file=toml_file)]
+
+    with pytest.raises(ValidationError):
+        load_settings(Config, emit_history=True)
+
+    assert caplog.messages[0] == textwrap.dedent(
+        """\
+        port:
+         - Used `Toml` to read 'postgres.port', found 'not a port'.
+
+        user:
+         - Used `Toml` to read 'postgres.user', found 'None'. Skipping.
+        """
+    )
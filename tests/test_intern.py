@@ -0,0 +1,74 @@
+import sys
+from dataclasses import dataclass
+
+from typing_extensions import Annotated
+
+from dataclass_settings import Env, load_settings, load_settings_many
+from dataclass_settings.context import InternTable
+
+
+@dataclass
+class Tenant:
+    region: Annotated[str, Env("REGION")]
+    host: Annotated[str, Env("HOST")]
+    port: Annotated[int, Env("PORT")] = 80
+
+
+def fresh(value: str) -> str:
+    # Build an equal, but distinct, string object.
+    return "".join(list(value))
+
+
+def envs(count: int):
+    for i in range(count):
+        yield Env.load_with(
+            env={
+                "REGION": fresh("us-east-1"),
+                "HOST": fresh(f"db{i % 2}"),
+                "PORT": "5432",
+            }
+        )
+
+
+def test_intern_disabled():
+    a, b = load_settings_many(Tenant, envs(2), loaders=Env)
+    assert a.region == b.region
+    assert a.region is not b.region
+
+
+def test_intern_deduplicates_across_loads():
+    table = InternTable()
+    results = list(load_settings_many(Tenant, envs(4), loaders=Env, intern=table))
+
+    assert len({id(r.region) for r in results}) == 1
+    assert len({id(r.host) for r in results}) == 2
+    assert results[0].port == 5432
+
+    # 3 duplicate regions and 2 duplicate hosts. The port is the same literal
+    # object in every env, so it's not a duplicate.
+    assert table.hits == 5
+    assert table.bytes_saved == (
+        3 * sys.getsizeof("us-east-1") + 2 * sys.getsizeof("db0")
+    )
+
+
+def test_intern_table_is_bounded():
+    table = InternTable(limit=1)
+    assert table(fresh("one")) == "one"
+
+    two = fresh("two")
+    assert table(two) is two
+    assert table(fresh("two")) is not two
+    assert table.values == {"one": "one"}
+
+
+def test_intern_shared_between_load_settings_calls():
+    table = InternTable()
+
+    def load():
+        env = {"REGION": fresh("eu"), "HOST": fresh("eu")}
+        return load_settings(Tenant, loaders=Env.load_with(env=env), intern=table)
+
+    first, second = load(), load()
+    assert first.region is first.host is second.region is second.host
+    assert table.hits == 3
@@ -0,0 +1,117 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel, ValidationError
+from typing_extensions import Annotated
+
+from dataclass_settings import Env, Secret, Toml, load_settings_many
+from dataclass_settings.context import InternTable
+from dataclass_settings.observer import LoadStats
+from tests.utils import requires_parser
+
+
+class Database(BaseModel):
+    host: Annotated[str, Env("HOST"), Secret("host")] = "localhost"
+
+
+class TenantSettings(BaseModel):
+    name: Annotated[str, Env("NAME")]
+    database: Database
+
+
+def test_load_many():
+    envs = [{"NAME": f"tenant{i}", "HOST": f"db{i}"} for i in range(5)]
+
+    results = load_settings_many(
+        TenantSettings, (Env.load_with(env=env) for env in envs)
+    )
+    assert list(results) == [
+        TenantSettings(name=f"tenant{i}", database=Database(host=f"db{i}"))
+        for i in range(5)
+    ]
+
+
+def test_load_many_is_lazy():
+    def sources():
+        yield Env.load_with(env={"NAME": "one"})
+        raise RuntimeError()
+
+    results = load_settings_many(TenantSettings, sources(), loaders=Env)
+    assert next(results) == TenantSettings(name="one", database=Database())
+    with pytest.raises(RuntimeError):
+        next(results)
+
+
+def test_load_many_sources_do_not_leak(tmp_path: Path):
+    (tmp_path / "host").write_text("secret-db")
+
+    results = load_settings_many(
+        TenantSettings,
+        [
+            [Env.load_with(env={"NAME": "one"}), Secret.load_with(dir=tmp_path)],
+            Env.load_with(env={"NAME": "two"}),
+        ],
+        loaders=[Env, Secret.load_with(dir=tmp_path / "missing")],
+    )
+    assert list(results) == [
+        TenantSettings(name="one", database=Database(host="secret-db")),
+        TenantSettings(name="two", database=Database(host="localhost")),
+    ]
+
+
+def test_load_many_error():
+    results = load_settings_many(TenantSettings, [Env.load_with(env={})])
+    with pytest.raises(ValidationError):
+        next(results)
+
+
+@requires_parser("toml")
+def test_shared_loaders_resolved_once(tmp_path: Path):
+    toml_file = tmp_path / "config.toml"
+    toml_file.write_text('region = "us-east-1"')
+
+    @dataclass
+    class Config:
+        name: Annotated[str, Env("NAME")]
+        region: Annotated[str, Toml("region")]
+
+    stats = LoadStats()
+    results = load_settings_many(
+        Config,
+        [Env.load_with(env={"NAME": str(i)}) for i in range(3)],
+        extra_loaders=Toml.load_with(file=toml_file),
+        observer=stats,
+    )
+    assert [r.region for r in results] == ["us-east-1"] * 3
+    assert stats.stats[("compile", Config.__qualname__, "")].calls <= 1
+
+
+def test_load_many_processes():
+    envs = [{"NAME": f"tenant{i}", "HOST": f"db{i}"} for i in range(10)]
+
+    results = load_settings_many(
+        TenantSettings,
+        [Env.load_with(env=env) for env in envs],
+        loaders=Env,
+        processes=2,
+        chunksize=3,
+    )
+    assert [r.name for r in results] == [f"tenant{i}" for i in range(10)]
+
+
+def test_load_many_processes_observer():
+    with pytest.raises(ValueError) as e:
+        load_settings_many(
+            TenantSettings, [Env], loaders=Env, processes=2, observer=LoadStats()
+        )
+    assert "`observer` is not supported alongside `processes`" in str(e.value)
+
+
+@pytest.mark.parametrize("intern", [True, InternTable()])
+def test_load_many_processes_intern(intern):
+    with pytest.raises(ValueError) as e:
+        load_settings_many(
+            TenantSettings, [Env], loaders=Env, processes=2, intern=intern
+        )
+    assert "`intern` is not supported alongside `processes`" in str(e.value)
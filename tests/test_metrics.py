@@ -0,0 +1,113 @@
+import threading
+
+import pytest
+from pydantic import BaseModel, ValidationError
+from typing_extensions import Annotated
+
+from dataclass_settings import Env, Secret, load_settings
+from dataclass_settings.metrics import Metrics
+from tests.utils import env_setup
+
+
+class Config(BaseModel):
+    foo: Annotated[int, Env("FOO")]
+    bar: Annotated[int, Secret("bar")]
+    baz: Annotated[int, Secret("bar")]
+
+
+def parse(text: str) -> dict:
+    samples = {}
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        name, value = line.rsplit(" ", 1)
+        samples[name] = float(value)
+    return samples
+
+
+def test_render():
+    metrics = Metrics(buckets=(0.5, 1.0))
+    with env_setup(env={"FOO": "1"}, files={"/run/secrets/bar": "2"}):
+        load_settings(Config, observer=metrics)
+        load_settings(Config, observer=metrics)
+
+    with env_setup(), pytest.raises(ValidationError):
+        load_settings(Config, observer=metrics)
+
+    text = metrics.render()
+    assert "# TYPE dataclass_settings_loads_total counter" in text
+    assert "# TYPE dataclass_settings_load_duration_seconds histogram" in text
+
+    samples = parse(text)
+    assert (
+        samples['dataclass_settings_loads_total{class="Config",outcome="success"}'] == 2
+    )
+    assert (
+        samples['dataclass_settings_loads_total{class="Config",outcome="error"}'] == 1
+    )
+    assert samples['dataclass_settings_reloads_total{class="Config"}'] == 2
+
+    assert (
+        samples['dataclass_settings_loader_lookups_total{loader="Env",result="hit"}']
+        == 2
+    )
+    assert (
+        samples['dataclass_settings_loader_lookups_total{loader="Env",result="miss"}']
+        == 1
+    )
+    assert (
+        samples['dataclass_settings_loader_lookups_total{loader="Secret",result="hit"}']
+        == 4
+    )
+
+    assert (
+        samples['dataclass_settings_cache_lookups_total{loader="Secret",result="hit"}']
+        == 2
+    )
+    assert (
+        samples['dataclass_settings_cache_lookups_total{loader="Secret",result="miss"}']
+        == 2
+    )
+
+    assert (
+        samples[
+            'dataclass_settings_load_duration_seconds_bucket{class="Config",le="0.5"}'
+        ]
+        == 3
+    )
+    assert (
+        samples[
+            'dataclass_settings_load_duration_seconds_bucket{class="Config",le="+Inf"}'
+        ]
+        == 3
+    )
+    assert (
+        samples['dataclass_settings_load_duration_seconds_count{class="Config"}'] == 3
+    )
+
+
+def test_threads_merged_on_scrape():
+    metrics = Metrics()
+
+    class Loader:
+        pass
+
+    def record():
+        for _ in range(100):
+            metrics.on_cache(Loader(), True)  # type: ignore
+
+    threads = [threading.Thread(target=record) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    samples = parse(metrics.render())
+    assert (
+        samples['dataclass_settings_cache_lookups_total{loader="Loader",result="hit"}']
+        == 400
+    )
+
+
+def test_empty_render():
+    assert Metrics().render() == "\n"
@@ -0,0 +1,80 @@
+from dataclasses import dataclass
+
+from typing_extensions import Annotated
+
+from dataclass_settings import Env, Secret, class_inspect, load_settings
+from dataclass_settings.observer import LoadStats, Observers, set_observer
+from tests.utils import env_setup
+
+
+@dataclass
+class Sub:
+    bar: Annotated[int, Env("BAR"), Secret("bar")] = 0
+
+
+@dataclass
+class Config:
+    foo: Annotated[int, Env("FOO")]
+    sub: Sub
+
+
+def test_load_stats(monkeypatch):
+    # The classes are shared between tests, so start from an empty inspection
+    # cache in order to observe them being compiled.
+    monkeypatch.setattr(class_inspect, "_fields_cache", class_inspect.ClassCache())
+
+    stats = LoadStats()
+    with env_setup(env={"FOO": "1"}, files={"/run/secrets/bar": "2"}):
+        config = load_settings(Config, observer=stats)
+
+    assert config == Config(foo=1, sub=Sub(bar=2))
+
+    assert stats.stats[("compile", Config.__qualname__, "")].calls == 1
+    assert stats.stats[("compile", Sub.__qualname__, "")].calls == 1
+    assert stats.stats[("construct", Config.__qualname__, "")].calls == 1
+
+    foo = stats.stats[("load", "Env", "foo")]
+    assert (foo.calls, foo.hits, foo.misses) == (1, 1, 0)
+
+    env_bar = stats.stats[("load", "Env", "sub.bar")]
+    assert (env_bar.calls, env_bar.hits, env_bar.misses) == (1, 0, 1)
+
+    secret_bar = stats.stats[("load", "Secret", "sub.bar")]
+    assert (secret_bar.calls, secret_bar.hits, secret_bar.misses) == (1, 1, 0)
+
+    assert stats.stats[("map", "", "sub")].calls == 1
+
+
+def test_summary_sorted_by_cumulative_time():
+    stats = LoadStats()
+    stats.on_construct(Config, 0.001)
+    stats.on_compile(Config, 0.003)
+    stats.on_compile(Config, 0.003)
+
+    lines = stats.summary().splitlines()
+    assert lines[0].split() == [
+        "event",
+        "target",
+        "field",
+        "calls",
+        "hits",
+        "misses",
+        "total",
+        "ms",
+    ]
+    assert lines[1].split() == ["compile", "Config", "2", "0", "0", "6.000"]
+    assert lines[2].split() == ["construct", "Config", "1", "0", "0", "1.000"]
+
+
+def test_global_observer():
+    first = LoadStats()
+    second = LoadStats()
+    set_observer(Observers(first, second))
+    try:
+        with env_setup(env={"FOO": "1"}):
+            load_settings(Config)
+    finally:
+        set_observer(None)
+
+    assert first.stats == second.stats
+    assert first.stats[("load", "Env", "foo")].hits == 1
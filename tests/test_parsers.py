@@ -0,0 +1,99 @@
+import copy
+import json
+import pickle
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+import pytest
+from typing_extensions import Annotated
+
+from dataclass_settings import Json, Toml, load_settings, parsers
+from dataclass_settings.parsers import Parser
+from tests.utils import record_calls, requires_parser
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(parsers, "_backends", copy.deepcopy(parsers._backends))
+    monkeypatch.setattr(parsers, "_resolved", {})
+
+
+@dataclass
+class Config:
+    name: Annotated[str, Toml("project.name"), Json("project.name")]
+
+
+@requires_parser("toml")
+def test_default_toml_parser():
+    state = Toml.load_with(file="config.toml")
+    assert state.parser is not None
+    assert state.parser.name in parsers.available("toml")
+    assert state.parser.name == parsers.available("toml")[0]
+
+
+def test_unknown_parser():
+    with pytest.raises(ValueError) as e:
+        Toml.load_with(parser="yaml")
+    assert "Unknown toml parser `yaml`" in str(e.value)
+
+
+def test_uninstalled_parser(registry):
+    def missing() -> Parser:
+        raise ImportError("No module named 'missing'")
+
+    parsers.register("toml", "missing", missing, first=True)
+    assert "missing" not in parsers.available("toml")
+
+    with pytest.raises(ImportError):
+        Toml.load_with(parser="missing")
+
+
+def test_no_installed_parser(registry, tmp_path):
+    def missing() -> Parser:
+        raise ImportError()
+
+    parsers._backends["toml"] = {"missing": missing}
+
+    file = tmp_path / "config.toml"
+    file.write_text('[project]\nname = "foo"\n')
+
+    state = Toml.load_with(file=file)
+    assert state.parser is None
+    with pytest.raises(ImportError) as e:
+        load_settings(Config, loaders=state)
+    assert "requires a TOML parser" in str(e.value)
+
+
+def test_register_preferred(registry, tmp_path, monkeypatch):
+    backend = SimpleNamespace(loads=lambda content: {"project": {"name": "fake"}})
+    calls = record_calls(monkeypatch, backend, "loads")
+
+    parsers.register(
+        "toml", "fake", lambda: Parser("toml", "fake", backend.loads), first=True
+    )
+
+    file = tmp_path / "config.toml"
+    file.write_text("")
+
+    state = Toml.load_with(file=file)
+    assert load_settings(Config, loaders=state) == Config(name="fake")
+    assert calls == [""]
+
+
+@pytest.mark.parametrize("name", ["msgspec", "orjson", "json"])
+def test_json_parsers(name, tmp_path):
+    pytest.importorskip(name)
+
+    file = tmp_path / "config.json"
+    file.write_text(json.dumps({"project": {"name": "foo"}}))
+
+    state = Json.load_with(file=file, parser=name)
+    assert state.parser is not None
+    assert state.parser.name == name
+    assert load_settings(Config, loaders=state) == Config(name="foo")
+
+
+def test_states_pickle_by_parser_name():
+    state = Json.load_with(file="config.json", parser="json")
+    restored = pickle.loads(pickle.dumps(state))  # noqa: S301
+    assert restored.parser is parsers.get_parser("json", "json")
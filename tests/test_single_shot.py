@@ -0,0 +1,104 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import msgspec
+import pydantic
+import pytest
+from pydantic import BaseModel
+from typing_extensions import Annotated
+
+from dataclass_settings import Env, load_settings
+from dataclass_settings.class_inspect import single_shot_builder
+from dataclass_settings.observer import LoadStats
+from tests.utils import env_setup
+
+
+class PydanticLeaf(BaseModel):
+    value: Annotated[int, Env("VALUE")]
+
+
+class PydanticMiddle(BaseModel):
+    leaf: PydanticLeaf
+    flag: Annotated[bool, Env("FLAG")] = False
+
+
+class PydanticRoot(BaseModel):
+    middle: PydanticMiddle
+
+
+class MsgspecLeaf(msgspec.Struct):
+    value: Annotated[int, Env("VALUE")]
+
+
+class MsgspecMiddle(msgspec.Struct):
+    leaf: MsgspecLeaf
+    flag: Annotated[bool, Env("FLAG")] = False
+
+
+class MsgspecRoot(msgspec.Struct):
+    middle: MsgspecMiddle
+
+
+@pytest.mark.parametrize(
+    "config_class, middle, leaf",
+    [
+        pytest.param(
+            PydanticRoot,
+            PydanticMiddle,
+            PydanticLeaf,
+            marks=pytest.mark.skipif(
+                pydantic.__version__.startswith("1."),
+                reason="Single-shot construction requires pydantic v2",
+            ),
+        ),
+        (MsgspecRoot, MsgspecMiddle, MsgspecLeaf),
+    ],
+)
+def test_single_construction(config_class, middle, leaf):
+    assert single_shot_builder(config_class) is single_shot_builder(config_class)
+
+    stats = LoadStats()
+    with env_setup({"VALUE": "4", "FLAG": "false"}):
+        config = load_settings(config_class, observer=stats)
+
+    assert config == config_class(middle=middle(leaf=leaf(value=4), flag=False))
+
+    # The nested levels are never mapped individually.
+    assert not [key for key in stats.stats if key[0] == "map"]
+    assert stats.stats[("construct", config_class.__qualname__, "")].calls == 1
+
+
+class Mixed(msgspec.Struct):
+    leaf: PydanticLeaf
+
+
+@dataclass
+class DataclassRoot:
+    leaf: PydanticLeaf
+
+
+class Renamed(msgspec.Struct, rename="camel"):
+    foo_bar: Annotated[int, Env("FOO")] = 0
+
+
+@pytest.mark.parametrize("config_class", [Mixed, DataclassRoot, Renamed])
+def test_ineligible(config_class):
+    assert single_shot_builder(config_class) is None
+
+
+def test_renamed_struct_uses_attribute_names():
+    with env_setup({"FOO": "3"}):
+        config = load_settings(Renamed)
+
+    assert config == Renamed(foo_bar=3)
+
+
+class OptionalLeaf(BaseModel):
+    leaf: Optional[PydanticLeaf] = None
+
+
+def test_falls_back_to_per_level_mapping():
+    with env_setup({}):
+        config = load_settings(OptionalLeaf)
+
+    assert config == OptionalLeaf(leaf=None)
@@ -0,0 +1,142 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+import attr
+import msgspec
+import pytest
+from pydantic import BaseModel
+from typing_extensions import Annotated
+
+from dataclass_settings import Env, load_settings_many
+from dataclass_settings.table import SettingsTable
+
+
+@dataclass
+class Database:
+    host: str
+    port: int = 5432
+
+
+@dataclass
+class Tenant:
+    name: Annotated[str, Env("NAME")]
+    ratio: float = 0.5
+    debug: bool = False
+    tags: Optional[List[str]] = None
+    database: Optional[Database] = None
+
+
+class PydanticDatabase(BaseModel):
+    host: str = "localhost"
+
+
+class PydanticTenant(BaseModel):
+    name: str
+    database: PydanticDatabase = PydanticDatabase()
+
+
+@attr.define
+class AttrsTenant:
+    name: str
+    port: int
+
+
+class MsgspecDatabase(msgspec.Struct):
+    host: str
+
+
+class MsgspecTenant(msgspec.Struct):
+    name: str
+    database: MsgspecDatabase
+
+
+def tenants(count: int) -> list[Tenant]:
+    return [
+        Tenant(
+            name=f"tenant{i % 3}",
+            ratio=i / 2,
+            debug=i % 2 == 0,
+            tags=["a"] if i == 1 else None,
+            database=Database(host=f"db{i}", port=i) if i % 2 else None,
+        )
+        for i in range(count)
+    ]
+
+
+def test_round_trip():
+    instances = tenants(5)
+    table = SettingsTable.from_instances(Tenant, instances)
+
+    assert len(table) == 5
+    assert list(table) == instances
+    assert table[-1] == instances[-1]
+
+    with pytest.raises(IndexError):
+        table[5]
+
+
+def test_columns():
+    table = SettingsTable.from_instances(Tenant, tenants(4))
+
+    assert list(table.column("database.port")) == [None, 1, None, 3]
+    assert list(table.column("debug")) == [True, False, True, False]
+    assert table.column("ratio").type is float
+
+    # Strings are interned.
+    names = list(table.column("name"))
+    assert names[0] is names[3]
+
+    with pytest.raises(KeyError):
+        table.column("missing")
+
+
+def test_where():
+    table = SettingsTable.from_instances(Tenant, tenants(6))
+
+    assert table.where(name="tenant1") == [1, 4]
+    assert table.where({"database.host": "db3"}) == [3]
+    assert table.where({"database.host": None}, name="tenant1") == [4]
+    assert table.where(name="missing") == []
+    assert table.where() == list(range(6))
+
+    assert [t.name for t in table.filter(debug=True, name="tenant0")] == ["tenant0"]
+
+
+def test_lookup_index_is_maintained():
+    table = SettingsTable.from_instances(Tenant, tenants(3))
+    assert table.lookup("name", "tenant2") == tenants(3)[2]
+
+    table.append(Tenant(name="new"))
+    assert table.lookup("name", "new") == Tenant(name="new")
+
+    with pytest.raises(KeyError):
+        table.lookup("name", "missing")
+
+
+def test_degrades_column_which_doesnt_fit_array():
+    table = SettingsTable.from_instances(
+        Database, [Database("a", 1), Database("b", 2**70)]
+    )
+    assert table.column("port").type is None
+    assert list(table.column("port")) == [1, 2**70]
+
+
+@pytest.mark.parametrize(
+    "instance",
+    [
+        PydanticTenant(name="one", database=PydanticDatabase(host="db")),
+        AttrsTenant(name="one", port=4),
+        MsgspecTenant(name="one", database=MsgspecDatabase(host="db")),
+    ],
+)
+def test_class_kinds(instance):
+    table = SettingsTable.from_instances(type(instance), [instance, instance])
+    assert table[1] == instance
+
+
+def test_from_load_settings_many():
+    sources = (Env.load_with(env={"NAME": f"t{i}"}) for i in range(3))
+    table = SettingsTable.from_instances(
+        Tenant, load_settings_many(Tenant, sources, loaders=Env)
+    )
+    assert table.lookup("name", "t1") == Tenant(name="t1")
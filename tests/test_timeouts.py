@@ -0,0 +1,217 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
+from typing_extensions import Annotated
+
+from dataclass_settings import Env, Loader, LoadTimeoutError, Row, load_settings
+from dataclass_settings import context as context_module
+from dataclass_settings.context import Context, LoadHistory
+
+
+class Slow(Loader):
+    """Blocks until released (or for a given number of seconds)."""
+
+    release = threading.Event()
+
+    def __init__(self, value: str, delay: Optional[float] = None):
+        self.value = value
+        self.delay = delay
+
+    def load(self, context: Context, state):
+        if self.delay is None:
+            self.release.wait(5)
+        else:
+            time.sleep(self.delay)
+        return self.value
+
+    def describe(self, context: Context, state):
+        return [f"slow:{context.name}"]
+
+
+@pytest.fixture(autouse=True)
+def release_slow_loaders():
+    Slow.release.clear()
+    yield
+    Slow.release.set()
+
+
+@dataclass
+class Config:
+    foo: Annotated[str, Slow("slow"), Env("FOO")] = "default"
+
+
+def test_timeout_falls_through_to_next_loader():
+    history = LoadHistory()
+    start = time.perf_counter()
+    config = load_settings(
+        Config,
+        loaders=[Slow, Env.load_with(env={"FOO": "env"})],
+        timeouts={Slow: 0.05},
+        emit_history=history,
+    )
+    assert time.perf_counter() - start < 1
+    assert config == Config(foo="env")
+
+    event = history.events[0]
+    assert event.timed_out_after is not None
+    assert event.timed_out_after >= 0.05
+    assert event.format().startswith(
+        "Used `Slow` to read 'slow:foo', timed out after 0.0"
+    )
+    assert event.format().endswith("Skipping.")
+
+
+def test_timeout_raises():
+    with pytest.raises(LoadTimeoutError) as e:
+        load_settings(
+            Config,
+            loaders=[Slow, Env.load_with(env={"FOO": "env"})],
+            timeouts={Slow: 0.05},
+            on_timeout="raise",
+        )
+
+    assert isinstance(e.value, TimeoutError)
+    assert e.value.field == "foo"
+    assert str(e.value) == "`Slow` exceeded its 0.050s budget loading `foo`"
+
+
+def test_deadline_bounds_whole_load():
+    @dataclass
+    class Many:
+        a: Annotated[str, Slow("a", delay=0.03)] = "default"
+        b: Annotated[str, Slow("b", delay=0.03)] = "default"
+        c: Annotated[str, Slow("c")] = "default"
+        d: Annotated[str, Slow("d")] = "default"
+
+    start = time.perf_counter()
+    config = load_settings(Many, loaders=[Slow], deadline=0.2)
+    assert time.perf_counter() - start < 1
+    assert config == Many(a="a", b="b")
+
+
+def test_within_budget():
+    @dataclass
+    class Quick:
+        foo: Annotated[str, Slow("slow", delay=0.01)] = "default"
+
+    config = load_settings(
+        Quick, loaders=[Slow], timeouts={Slow: 1}, deadline=1, on_timeout="raise"
+    )
+    assert config == Quick(foo="slow")
+
+
+def test_loader_error_propagates():
+    class Broken(Loader):
+        def load(self, context, state):
+            raise RuntimeError("broken")
+
+    @dataclass
+    class Fails:
+        foo: Annotated[str, Broken()] = "default"
+
+    with pytest.raises(RuntimeError, match="broken"):
+        load_settings(Fails, loaders=[Broken], timeouts={Broken: 1})
+
+
+@pytest.fixture
+def workers(monkeypatch):
+    """Record each `Worker` started by a load."""
+    started = []
+
+    class Recorded(context_module.Worker):
+        def __init__(self):
+            super().__init__()
+            started.append(self)
+
+    monkeypatch.setattr(context_module, "Worker", Recorded)
+    return started
+
+
+def test_non_blocking_loaders_skip_worker(workers):
+    @dataclass
+    class Plain:
+        foo: Annotated[str, Env("FOO")]
+        bar: Annotated[str, Row("bar")]
+
+    config = load_settings(
+        Plain,
+        loaders=[Env.load_with(env={"FOO": "env"}), Row.load_with(row={"bar": "row"})],
+        deadline=2.0,
+    )
+    assert config == Plain(foo="env", bar="row")
+    assert workers == []
+
+
+def test_single_worker_per_load(workers):
+    @dataclass
+    class Many:
+        a: Annotated[str, Slow("a", delay=0)]
+        b: Annotated[str, Slow("b", delay=0)]
+        c: Annotated[str, Slow("c", delay=0)]
+
+    config = load_settings(Many, loaders=[Slow], deadline=2.0)
+    assert config == Many(a="a", b="b", c="c")
+
+    assert len(workers) == 1
+    workers[0].thread.join(1)
+    assert not workers[0].thread.is_alive()
+
+
+def test_worker_replaced_after_timeout(workers):
+    @dataclass
+    class Stuck:
+        a: Annotated[str, Slow("a")] = "default"
+        b: Annotated[str, Slow("b", delay=0)] = "default"
+
+    config = load_settings(Stuck, loaders=[Slow], timeouts={Slow: 0.05})
+    assert config == Stuck(a="default", b="b")
+    assert len(workers) == 2
+
+
+def test_non_blocking_deadline_exhausted():
+    history = LoadHistory()
+    config = load_settings(
+        Config,
+        loaders=[Slow, Env.load_with(env={"FOO": "env"})],
+        deadline=0,
+        emit_history=history,
+    )
+    assert config == Config(foo="env")
+    assert [event.timed_out_after is not None for event in history.events] == [
+        True,
+        False,
+    ]
+
+
+def test_env_after_deadline_spent():
+    @dataclass
+    class Mixed:
+        slow: Annotated[str, Slow("slow", delay=0.2)] = "default"
+        foo: Annotated[str, Env("FOO")] = "default"
+        bar: Annotated[str, Env("BAR")] = "default"
+
+    config = load_settings(
+        Mixed,
+        loaders=[Slow, Env.load_with(env={"FOO": "foo", "BAR": "bar"})],
+        deadline=0.05,
+    )
+    assert config == Mixed(foo="foo", bar="bar")
+
+
+def test_deadline_leaves_required_field_empty():
+    @dataclass
+    class Required:
+        slow: Annotated[str, Slow("slow")]
+        foo: Annotated[str, Env("FOO")]
+
+    with pytest.raises(LoadTimeoutError) as e:
+        load_settings(
+            Required,
+            loaders=[Slow, Env.load_with(env={"FOO": "foo"})],
+            deadline=0.05,
+        )
+    assert e.value.field == "slow"
+    assert isinstance(e.value.__cause__, TypeError)
@@ -1,10 +1,14 @@
 import contextlib
 import sys
+import threading
+import time
 from pathlib import PurePath
 from unittest.mock import mock_open, patch
 
 import pytest
 
+from dataclass_settings import parsers
+
 
 @contextlib.contextmanager
 def env_setup(env={}, files={}):
@@ -31,3 +35,43 @@ def env_setup(env={}, files={}):
 
 def skip_under(major: int, minor: int, *, reason: str):
     return pytest.mark.skipif(sys.version_info < (major, minor), reason=reason)
+
+
+def requires_parser(format: str):
+    """Skip unless a `parsers` backend for `format` is installed."""
+    return pytest.mark.skipif(
+        parsers.get_parser(format) is None, reason=f"Requires a {format} parser"
+    )
+
+
+def record_calls(
+    monkeypatch, target, name: str, *, key=None, delay=0.0, before=None, after=None
+):
+    """Wrap `target.name`, recording each call by its first argument (or `key(*args, **kwargs)`).
+
+    `delay` slows each call (e.g. to widen a race window). `before` and `after`
+    are called with the number of calls so far, before the call is made (which
+    `before` may prevent, by raising) and once it returns, respectively.
+    """
+    original = getattr(target, name)
+    calls: list = []
+    lock = threading.Lock()
+
+    def wrapper(*args, **kwargs):
+        with lock:
+            calls.append(args[0] if key is None else key(*args, **kwargs))
+            count = len(calls)
+
+        if delay:
+            time.sleep(delay)
+
+        if before is not None:
+            before(count)
+
+        result = original(*args, **kwargs)
+        if after is not None:
+            after(count)
+        return result
+
+    monkeypatch.setattr(target, name, wrapper)
+    return calls